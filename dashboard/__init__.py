@@ -0,0 +1 @@
+"""Shared data and chart helpers for the Sensormatic Streamlit dashboards."""
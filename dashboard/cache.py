@@ -0,0 +1,328 @@
+"""Process-wide cache shared by every Streamlit session.
+
+Parsed datasets, trend aggregates and serialized figures are kept in one
+LRU with a total memory budget, so 50 browser tabs on a wall display share
+a single copy of each and the server's memory stays bounded. The budget is
+``SENSORMATIC_CACHE_MB`` (default 256); ``SENSORMATIC_CACHE_TTL`` sets an
+optional time-to-live in seconds (default 0, entries never expire).
+
+Keys are tuples whose first element is a namespace ("data", "trend",
+"figure", ...); hit/miss/eviction counters are kept per namespace. Values
+read from a single file (the cube, link and SEO results, Site24x7 and
+Lighthouse tables, sitemap diffs) go through versioned(), keyed by the
+file's mtime, so they share the budget too.
+
+The sidebar admin panel shows the cache and can clear it for every session,
+so it needs a server-side token: set ``SENSORMATIC_ADMIN_TOKEN`` (or
+``admin_token`` in .streamlit/secrets.toml) and open the dashboard with
+``?admin=<token>``. Without a token the panel is off.
+
+Entries stored with ``persist=True`` are also written to a disk tier of
+Arrow (DataFrames) and JSON (figures) blobs named by a hash of their key,
+and a memory miss is served from disk before anything is rebuilt, so a
+restarted server starts warm. The tier is active when its folder exists:
+``SENSORMATIC_CACHE_DIR`` or store/cache, created by scripts/warm_cache.py.
+It is capped at ``SENSORMATIC_CACHE_DISK_MB`` (default 1024): past that the
+least recently read blobs are deleted, which also clears out blobs for
+data fingerprints that no longer exist. Disk errors never reach the page;
+the value is simply not persisted.
+"""
+import hashlib
+import hmac
+import logging
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+import pandas as pd
+import pyarrow.feather as feather
+
+from dashboard import fileio
+
+logger = logging.getLogger(__name__)
+
+MAX_BYTES = int(float(os.environ.get("SENSORMATIC_CACHE_MB", 256)) * 2**20)
+DISK_BYTES = int(float(os.environ.get("SENSORMATIC_CACHE_DISK_MB", 1024)) * 2**20)
+BLOB_SUFFIXES = (".arrow", ".json")
+TTL = float(os.environ.get("SENSORMATIC_CACHE_TTL", 0))
+ADMIN_PARAM = "admin"
+
+
+def size_of(value):
+    """Approximate memory held by a cached value, in bytes."""
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        usage = value.memory_usage(deep=True)
+        return int(usage.sum() if isinstance(value, pd.DataFrame) else usage)
+    if isinstance(value, (str, bytes)):
+        return len(value)
+    if isinstance(value, tuple):
+        return sum(size_of(v) for v in value)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(size_of(k) + size_of(v) for k, v in value.items())
+    return sys.getsizeof(value)
+
+
+class _Entry:
+    __slots__ = ("value", "size", "created", "expires", "hits")
+
+    def __init__(self, value, size, ttl):
+        self.value, self.size, self.hits = value, size, 0
+        self.created = time.monotonic()
+        self.expires = self.created + ttl if ttl else None
+
+
+class DiskTier:
+    """Directory of cache blobs, one file per key, bounded by ``max_bytes``.
+
+    A blob's mtime is its last read or write, so pruning drops the least
+    recently used ones first.
+    """
+
+    def __init__(self, directory=None, max_bytes=DISK_BYTES):
+        self._directory = directory
+        self.max_bytes = max_bytes
+        self._size = None  # bytes on disk, counted on the first save
+        self._lock = threading.Lock()
+
+    @property
+    def directory(self):
+        if self._directory is not None:
+            return Path(self._directory)
+        if os.environ.get("SENSORMATIC_CACHE_DIR"):
+            return Path(os.environ["SENSORMATIC_CACHE_DIR"])
+        from dashboard import store
+
+        return store.STORE_DIR / "cache"
+
+    def enabled(self):
+        return self.directory.is_dir()
+
+    def path(self, key, suffix):
+        digest = hashlib.blake2b(repr(key[1:]).encode(), digest_size=16).hexdigest()
+        return self.directory / f"{key[0]}-{digest}{suffix}"
+
+    def load(self, key):
+        """The value stored for ``key``, or None."""
+        if not self.enabled():
+            return None
+        try:
+            path = self.path(key, ".arrow")
+            if path.exists():
+                value = feather.read_table(path).to_pandas()
+            else:
+                path = self.path(key, ".json")
+                if not path.exists():
+                    return None
+                value = path.read_text(encoding="utf-8")
+        except (OSError, ValueError):
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return value
+
+    def save(self, key, value):
+        """Write DataFrames and strings atomically; other values are skipped.
+
+        Best effort: a failed write (disk full, read-only volume) is logged
+        and the value just stays memory-only.
+        """
+        if not self.enabled():
+            return
+        if not isinstance(value, (pd.DataFrame, str)):
+            return
+        target = self.path(key, ".arrow" if isinstance(value, pd.DataFrame) else ".json")
+        try:
+            if isinstance(value, pd.DataFrame):
+                fileio.atomic_write(target, lambda tmp: feather.write_feather(value, tmp))
+            else:
+                fileio.write_text(target, value)
+            written = target.stat().st_size
+        except OSError as exc:
+            logger.warning("Disk cache write failed for %s: %s", target.name, exc)
+            return
+        with self._lock:
+            # Rewriting a key overcounts until the next prune recounts
+            self._size = self.disk_size() if self._size is None else self._size + written
+            if self._size > self.max_bytes:
+                self.prune()
+
+    def _blobs(self):
+        """(mtime, bytes, path) of every blob, oldest first."""
+        blobs = []
+        for path in self.directory.iterdir():
+            if path.suffix not in BLOB_SUFFIXES or path.name.startswith("."):
+                continue
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            blobs.append((stat.st_mtime_ns, stat.st_size, path))
+        return sorted(blobs)
+
+    def disk_size(self):
+        return sum(size for _, size, _ in self._blobs())
+
+    def prune(self, target=None):
+        """Delete least recently used blobs until at most ``target`` bytes remain.
+
+        Defaults to 90% of the budget, so a full tier is not pruned on
+        every save. Returns the number of blobs deleted.
+        """
+        target = 0.9 * self.max_bytes if target is None else target
+        blobs = self._blobs()
+        total = sum(size for _, size, _ in blobs)
+        deleted = 0
+        for _, size, path in blobs:
+            if total <= target:
+                break
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            except OSError as exc:
+                logger.warning("Disk cache prune failed for %s: %s", path.name, exc)
+                break
+            total -= size
+            deleted += 1
+        self._size = total
+        return deleted
+
+
+class Cache:
+    """Thread-safe LRU bounded by total size, with optional TTL and disk tier."""
+
+    def __init__(self, max_bytes=MAX_BYTES, ttl=TTL, disk=None):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.disk = disk
+        self.size = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {}
+
+    def _count(self, key, event):
+        counters = self.stats.setdefault(key[0], {"hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0,
+                                                  "expired": 0})
+        counters[event] += 1
+
+    def _drop(self, key):
+        self.size -= self._entries.pop(key).size
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires is not None and entry.expires < time.monotonic():
+                self._drop(key)
+                self._count(key, "expired")
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+                entry.hits += 1
+                self._count(key, "hits")
+                return entry.value
+        value = self.disk.load(key) if self.disk is not None else None
+        with self._lock:
+            self._count(key, "misses" if value is None else "disk_hits")
+        if value is None:
+            return default
+        return self.put(key, value)
+
+    def put(self, key, value, size=None, ttl=None, persist=False):
+        """Store ``value``, evicting least recently used entries over budget.
+
+        With ``persist``, the value is also written to the disk tier.
+        """
+        if persist and self.disk is not None:
+            self.disk.save(key, value)
+        entry = _Entry(value, size_of(value) if size is None else size, self.ttl if ttl is None else ttl)
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = entry
+            self.size += entry.size
+            while self.size > self.max_bytes and len(self._entries) > 1:
+                old = next(iter(self._entries))
+                self._drop(old)
+                self._count(old, "evictions")
+        return value
+
+    def invalidate(self, match):
+        """Drop every entry whose key satisfies ``match(key)``."""
+        with self._lock:
+            for key in [k for k in self._entries if match(k)]:
+                self._drop(key)
+
+    def clear(self, namespace=None):
+        self.invalidate(lambda key: namespace in (None, key[0]))
+
+    def entries(self):
+        """Snapshot of the cache contents, most recently used first."""
+        now = time.monotonic()
+        with self._lock:
+            return [{"namespace": key[0], "key": " / ".join(str(k) for k in key[1:]), "bytes": e.size,
+                     "hits": e.hits, "age_s": round(now - e.created, 1)}
+                    for key, e in reversed(self._entries.items())]
+
+
+shared = Cache(disk=DiskTier())
+
+
+def versioned(key, version, build, size=None, cache=shared):
+    """``build()`` cached under ``key`` until ``version`` (e.g. a file mtime) changes.
+
+    Rebuilding drops the entries for older versions of ``key``. ``size``
+    estimates the value's bytes when size_of() cannot see into it.
+    """
+    full = (*key, version)
+    value = cache.get(full)
+    if value is None:
+        value = build()
+        n = len(key)
+        cache.invalidate(lambda k: len(k) == n + 1 and k[:n] == key and k[n] != version)
+        cache.put(full, value, size=None if size is None else size(value))
+    return value
+
+
+def admin_token():
+    """The configured admin token, or None."""
+    token = os.environ.get("SENSORMATIC_ADMIN_TOKEN")
+    if token:
+        return token
+    try:
+        import streamlit as st
+
+        return st.secrets.get("admin_token") or None
+    except Exception:
+        # No secrets.toml
+        return None
+
+
+def _admin_requested():
+    import streamlit as st
+
+    token = admin_token()
+    given = st.query_params.get(ADMIN_PARAM, "")
+    return bool(token) and hmac.compare_digest(given.encode(), token.encode())
+
+
+def panel(cache=shared):
+    """Sidebar admin panel with usage, counters and contents (``?admin=<token>``)."""
+    import streamlit as st
+
+    if not _admin_requested():
+        return
+    with st.sidebar.expander("🗄️ Shared cache", expanded=False):
+        st.progress(min(1.0, cache.size / cache.max_bytes),
+                    text=f"{cache.size / 2**20:,.1f} / {cache.max_bytes / 2**20:,.0f} MB")
+        stats = pd.DataFrame.from_dict(cache.stats, orient="index")
+        if len(stats):
+            stats["hit rate"] = (stats["hits"] / (stats["hits"] + stats["misses"]).where(lambda n: n > 0)).round(3)
+        st.dataframe(stats)
+        st.dataframe(pd.DataFrame(cache.entries()), hide_index=True)
+        if st.button("Clear cache"):
+            cache.clear()
@@ -0,0 +1,127 @@
+"""Month x country x metric aggregation cube for drill-downs.
+
+Coverage, performance and error rows are reshaped to (month, country,
+metric, value) and aggregated at ingestion time, including the roll-ups
+over all months and all countries, into store/cube.parquet. Viewers load
+it once into a dict keyed by (month, country, metric), so drilling down or
+rolling up is a lookup instead of a groupby over raw rows.
+
+Error counts have no country, so they are stored under country ``ALL``.
+"""
+import threading
+
+import pandas as pd
+
+from dashboard import cache, fileio, schema, store
+
+MONTH = store.MONTH_COLUMN
+COUNTRY = "country"
+METRIC = "metric"
+ALL = "All"
+
+# dataset -> (country column or None, label column or None, value columns)
+SOURCES = {
+    "country_coverage": (schema.COUNTRY, None, (schema.PAGES_TESTED,)),
+    "performance_metrics": (schema.COUNTRY, None, (schema.PAGE_LOAD_TIME, schema.UPTIME)),
+    "error_metrics": (None, schema.ERROR_TYPE, (schema.COUNT,)),
+}
+
+_build_lock = threading.RLock()  # held across ensure_cube's check and rebuild
+
+
+def cube_path(store_dir=None):
+    return store.store_path(next(iter(SOURCES)), store_dir).with_name("cube.parquet")
+
+
+def _long(dataset, store_dir=None):
+    """One source dataset as (month, country, metric, value) rows."""
+    country, label, values = SOURCES[dataset]
+    columns = [c for c in (country, label) if c is not None] + list(values)
+    df = store.read_store(dataset, columns, store_dir=store_dir)
+    frames = []
+    for value in values:
+        part = pd.DataFrame({
+            MONTH: df[MONTH].astype(str),
+            COUNTRY: df[country].astype(str) if country is not None else ALL,
+            # Labelled rows (error types) become one metric per label
+            METRIC: df[label].astype(str) if label is not None else value,
+            "value": df[value].astype(float),
+        })
+        frames.append(part)
+    return pd.concat(frames, ignore_index=True)
+
+
+def compute_cube(store_dir=None):
+    """Sum and count for every (month, country, metric), with ALL roll-ups."""
+    rows = pd.concat([_long(dataset, store_dir) for dataset in SOURCES], ignore_index=True)
+    levels = []
+    for by_month in (True, False):
+        for by_country in (True, False):
+            keys = [k for k, keep in ((MONTH, by_month), (COUNTRY, by_country)) if keep] + [METRIC]
+            level = rows.groupby(keys, sort=False)["value"].agg(["sum", "count"]).reset_index()
+            if not by_month:
+                level[MONTH] = ALL
+            if not by_country:
+                level[COUNTRY] = ALL
+            levels.append(level)
+    cube = pd.concat(levels, ignore_index=True).drop_duplicates([MONTH, COUNTRY, METRIC])
+    cube["mean"] = cube["sum"] / cube["count"]
+    return cube[[MONTH, COUNTRY, METRIC, "sum", "count", "mean"]].sort_values(
+        [MONTH, COUNTRY, METRIC], ignore_index=True)
+
+
+def build_cube(store_dir=None):
+    """Recompute and atomically rewrite the cube; returns its cells."""
+    with _build_lock:
+        cube = compute_cube(store_dir)
+        fileio.atomic_write(cube_path(store_dir), lambda tmp: cube.to_parquet(tmp, index=False))
+        return len(cube)
+
+
+def ensure_cube(data_dir=None, store_dir=None):
+    """Rebuild sources and the cube if anything upstream is newer."""
+    with _build_lock:
+        for dataset in SOURCES:
+            store.ensure_dataset(dataset, data_dir, store_dir)
+        out = cube_path(store_dir)
+        newest_source = max(store.store_path(d, store_dir).stat().st_mtime_ns for d in SOURCES)
+        if not out.exists() or out.stat().st_mtime_ns < newest_source:
+            build_cube(store_dir)
+
+
+class Cube:
+    """In-memory cube: O(1) cell lookups plus indexed slices."""
+
+    def __init__(self, frame):
+        self.frame = frame.set_index([MONTH, COUNTRY, METRIC]).sort_index()
+        self.cells = {key: (row[0], int(row[1]), row[2])
+                      for key, row in zip(self.frame.index, self.frame.to_numpy().tolist())}
+
+    def cell(self, metric, month=ALL, country=ALL, measure="mean"):
+        """One measure ("sum", "count" or "mean") of one cell, or None."""
+        values = self.cells.get((month, country, metric))
+        if values is None:
+            return None
+        return values[("sum", "count", "mean").index(measure)]
+
+    def slice(self, month=None, country=None, metric=None):
+        """Cells matching the given coordinates; None leaves a dimension open."""
+        key = tuple(slice(None) if v is None else [v] for v in (month, country, metric))
+        try:
+            return self.frame.loc[key, :].reset_index()
+        except KeyError:
+            return self.frame.iloc[:0].reset_index()
+
+    def members(self, dimension):
+        """Values of one dimension, without the ALL roll-up."""
+        values = self.frame.index.unique(dimension)
+        return sorted(v for v in values if v != ALL)
+
+
+def load_cube(store_dir=None):
+    """The process-wide Cube, reloaded when cube.parquet changes."""
+    ensure_cube(store_dir=store_dir)
+    path = cube_path(store_dir)
+    # The cell dict roughly doubles the frame
+    return cache.versioned(("cube", str(path)), path.stat().st_mtime_ns, lambda: Cube(pd.read_parquet(path)),
+                           size=lambda cube: 2 * cache.size_of(cube.frame))
@@ -0,0 +1,99 @@
+"""Month-aware access to the SensormaticDashboard/data/YYYY_MM CSV files.
+
+Every Streamlit rerun calls the section loaders again, so parsed frames are
+kept in the shared process-wide cache (dashboard.cache). Entries are keyed
+by (month, dataset) and the file fingerprint (mtime, size) they were parsed
+from, so a changed file is re-read on the next access.
+"""
+import os
+import re
+from datetime import datetime
+from pathlib import Path
+
+from dashboard import cache, schema
+
+DATA_DIR = Path(os.environ.get(
+    "SENSORMATIC_DATA_DIR",
+    Path(__file__).resolve().parent.parent / "SensormaticDashboard" / "data",
+))
+
+# Dataset name -> CSV file inside each data/YYYY_MM folder
+DATASETS = {
+    "country_coverage": "country_coverage.csv",
+    "form_coverage": "form_coverage.csv",
+    "coveo_coverage": "coveo_coverage.csv",
+    "automation_metrics": "automation_metrics.csv",
+    "browser_matrix": "browser_matrix.csv",
+    "error_metrics": "error_metrics.csv",
+    "performance_metrics": "performance_metrics.csv",
+    "lighthouse_scores": "lighthouse_scores.csv",
+    "lighthouse_deep_dive": "lighthouse_deep_dive.csv",
+    "sentiment_data": "sentiment_data.csv",
+    "lead_segmentation": "lead_segmentation.csv",
+    "release_metrics": "release_metrics.csv",
+}
+
+# Written by scripts/ingest_lighthouse.py rather than the Excel converter, so
+# a month folder may not have them; load_dataset returns an empty frame
+OPTIONAL_DATASETS = frozenset({"lighthouse_scores", "lighthouse_deep_dive"})
+LIGHTHOUSE_MISSING = "No Lighthouse reports ingested for this month yet: run scripts/ingest_lighthouse.py."
+
+MONTH_DIR_RE = re.compile(r"^\d{4}_\d{2}$")
+
+
+def available_months(data_dir=None):
+    """Month keys ("2025_07", ...) that have a data folder, oldest first."""
+    root = Path(data_dir or DATA_DIR)
+    if not root.is_dir():
+        return []
+    return sorted(p.name for p in root.iterdir() if p.is_dir() and MONTH_DIR_RE.match(p.name))
+
+
+def latest_month(data_dir=None):
+    months = available_months(data_dir)
+    return months[-1] if months else None
+
+
+def month_label(month, fmt="%B %Y"):
+    """Format a month key for display, e.g. "2025_07" -> "July 2025"."""
+    return datetime.strptime(month, "%Y_%m").strftime(fmt)
+
+
+def dataset_path(month, dataset, data_dir=None):
+    if dataset not in DATASETS:
+        raise KeyError(f"Unknown dataset: {dataset!r}")
+    return Path(data_dir or DATA_DIR) / month / DATASETS[dataset]
+
+
+def fingerprint(path):
+    """Cheap change detector for a data file: (mtime_ns, size)."""
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def load_dataset(month, dataset, data_dir=None):
+    """Return the DataFrame for one dataset of one month.
+
+    Columns are typed and validated by dashboard.schema. The frame is
+    shared between sessions, so callers must not mutate it in place. A
+    missing file of an OPTIONAL_DATASETS entry gives an empty frame with
+    the schema's columns.
+    """
+    path = dataset_path(month, dataset, data_dir)
+    try:
+        fp = fingerprint(path)
+    except FileNotFoundError:
+        if dataset not in OPTIONAL_DATASETS:
+            raise
+        return schema.empty_frame(dataset)
+    key = ("data", str(path.parent.parent), month, dataset, fp)
+    df = cache.shared.get(key)
+    if df is None:
+        df = cache.shared.put(key, schema.read_csv(path, dataset), persist=True)
+    return df
+
+
+def invalidate(month=None, dataset=None):
+    """Drop cached frames matching month and/or dataset (None matches all)."""
+    cache.shared.invalidate(lambda key: key[0] == "data" and month in (None, key[2])
+                            and dataset in (None, key[3]))
@@ -0,0 +1,120 @@
+"""Server-side downsampling for long line-chart series.
+
+A line chart cannot show more points than it has pixels, so series longer
+than ``MAX_POINTS`` are reduced before the figure is built. Two methods:
+
+* ``minmax`` keeps the first, minimum, maximum and last point of each
+  bucket, so spikes survive (the default; fully vectorized).
+* ``lttb`` is Largest-Triangle-Three-Buckets, which keeps the visual shape
+  with fewer points; each bucket is scored with vectorized NumPy.
+
+zoom_window() adds a range slider under a chart so a narrower window is
+re-fetched from the full data at higher resolution.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+
+# About two points per horizontal pixel of a wide-layout chart
+MAX_POINTS = int(os.environ.get("SENSORMATIC_MAX_POINTS", 2000))
+
+
+def _as_numeric(values):
+    """Numeric positions for an x column (datetimes as int64, labels by order)."""
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values.to_numpy("datetime64[ns]").astype(np.int64).astype(float)
+    if pd.api.types.is_numeric_dtype(values):
+        return values.to_numpy(float)
+    return np.arange(len(values), dtype=float)
+
+
+def minmax_indices(y, points):
+    """Indices keeping first/min/max/last per bucket, at most ``points``."""
+    n = len(y)
+    if n <= points:
+        return np.arange(n)
+    buckets = max(1, points // 4)
+    bucket = np.arange(n) * buckets // n
+    y = np.where(np.isnan(y), np.inf, y)
+    # Within each bucket, ordering by value puts the min first and the max last
+    order = np.lexsort((y, bucket))
+    starts = np.flatnonzero(np.r_[True, bucket[order][1:] != bucket[order][:-1]])
+    ends = np.r_[starts[1:], n] - 1
+    edges = np.flatnonzero(np.r_[True, bucket[1:] != bucket[:-1]])
+    keep = np.concatenate([order[starts], order[ends], edges, np.r_[edges[1:] - 1, n - 1]])
+    return np.unique(keep)
+
+
+def lttb_indices(x, y, points):
+    """Largest-Triangle-Three-Buckets indices, at most ``points``."""
+    n = len(y)
+    if n <= points or points < 3:
+        return np.arange(n)
+    edges = np.linspace(1, n - 1, points - 1).astype(int)
+    # Average of every bucket, used as the third triangle vertex
+    counts = np.diff(edges)
+    mean_x = np.add.reduceat(x[1:n - 1], edges[:-1] - 1) / counts
+    mean_y = np.add.reduceat(y[1:n - 1], edges[:-1] - 1) / counts
+    keep = np.empty(points, dtype=np.int64)
+    keep[0], keep[-1] = 0, n - 1
+    prev = 0
+    for i in range(points - 2):
+        lo, hi = edges[i], edges[i + 1]
+        nx, ny = (mean_x[i + 1], mean_y[i + 1]) if i + 1 < len(counts) else (x[-1], y[-1])
+        area = np.abs((x[prev] - nx) * (y[lo:hi] - y[prev]) - (x[prev] - x[lo:hi]) * (ny - y[prev]))
+        prev = lo + int(np.nanargmax(area)) if np.isfinite(area).any() else lo
+        keep[i + 1] = prev
+    return keep
+
+
+def downsample(df, x, y, key=None, points=MAX_POINTS, method="minmax"):
+    """Rows of ``df`` needed to draw each series with at most ``points`` points.
+
+    ``y`` may be one column or a list (wide-form px.line); ``key`` is the
+    column splitting series (px ``color``). Row order is preserved.
+    """
+    if len(df) <= points:
+        return df
+    ys = [y] if isinstance(y, str) else list(y)
+    groups = [np.arange(len(df))] if key is None else list(
+        df.groupby(key, observed=True, sort=False).indices.values())
+    keep = []
+    for rows in groups:
+        if len(rows) <= points:
+            keep.append(rows)
+            continue
+        xs = _as_numeric(df[x].iloc[rows]) if x is not None else np.arange(len(rows), dtype=float)
+        for col in ys:
+            values = df[col].iloc[rows].to_numpy(float)
+            if method == "lttb":
+                idx = lttb_indices(xs, values, points)
+            else:
+                idx = minmax_indices(values, points)
+            keep.append(rows[idx])
+    return df.iloc[np.unique(np.concatenate(keep))]
+
+
+def zoom_window(df, x, key, label="Zoom", points=MAX_POINTS):
+    """Range slider over ``x`` for series too long to show in full.
+
+    Returns the rows inside the selected window; narrowing it re-fetches
+    that window from the full data, so it is downsampled less. Data short
+    enough to draw in full is returned unchanged with no slider.
+    """
+    if len(df) <= points:
+        return df
+    import streamlit as st
+
+    values = df[x]
+    if pd.api.types.is_numeric_dtype(values) or pd.api.types.is_datetime64_any_dtype(values):
+        lo, hi = values.min(), values.max()
+        if pd.api.types.is_datetime64_any_dtype(values):
+            lo, hi = lo.to_pydatetime(), hi.to_pydatetime()
+        start, stop = st.slider(label, min_value=lo, max_value=hi, value=(lo, hi), key=key)
+        return df[(values >= start) & (values <= stop)]
+    labels = list(pd.unique(values))
+    start, stop = st.select_slider(label, options=labels, value=(labels[0], labels[-1]), key=key)
+    position = pd.Series(range(len(labels)), index=labels)
+    index = position[values].to_numpy()
+    return df[(index >= position[start]) & (index <= position[stop])]
@@ -0,0 +1,143 @@
+"""Plotly Express figures cached by (chart spec, data hash, theme).
+
+Building a px figure is the most expensive step of a rerun, and most reruns
+redraw charts whose data has not changed. Each figure is serialized to JSON
+once and kept in the shared process-wide cache (dashboard.cache); later
+requests for the same chart over the same data rebuild it from that JSON.
+"""
+import hashlib
+import json
+import os
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+import plotly.io as pio
+
+from dashboard import cache, downsample, profiler
+
+# Scatter charts switch from SVG to WebGL (Scattergl) above this many points
+WEBGL_POINTS = int(os.environ.get("SENSORMATIC_WEBGL_POINTS", 1000))
+# Above this many color groups a WebGL scatter is drawn as one trace
+MAX_TRACES = 50
+
+
+def data_hash(df):
+    """Content hash of a DataFrame: values, column names and dtypes."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    digest.update(repr([(str(c), str(t)) for c, t in df.dtypes.items()]).encode())
+    return digest.hexdigest()
+
+
+def figure_key(kind, df, template=None, **spec):
+    theme = template or pio.templates.default
+    return "figure", kind, json.dumps(spec, sort_keys=True, default=str), data_hash(df), theme
+
+
+def cached_figure(kind, df, template=None, **spec):
+    """Return ``px.<kind>(df, **spec)``, served from cache when unchanged."""
+    key = figure_key(kind, df, template, **spec)
+    payload = cache.shared.get(key)
+    if payload is None:
+        if template is not None:
+            spec["template"] = template
+        with profiler.span(f"build {kind}", "figure"):
+            fig = _BUILDERS.get(kind, getattr(px, kind, None))(df, **spec)
+        with profiler.span(f"serialize {kind}", "figure"):
+            payload = fig.to_json()
+        cache.shared.put(key, payload, persist=True)
+        return fig
+    with profiler.span(f"cached {kind}", "figure"):
+        return pio.from_json(payload)
+
+
+def bar(df, **spec):
+    return cached_figure("bar", df, **spec)
+
+
+def line(df, max_points=downsample.MAX_POINTS, **spec):
+    """px.line with each series downsampled to ``max_points`` (None: off)."""
+    if max_points and "y" in spec and len(df) > max_points:
+        with profiler.span("downsample line", "figure"):
+            df = downsample.downsample(df, spec.get("x"), spec["y"], key=spec.get("color"), points=max_points)
+    return cached_figure("line", df, **spec)
+
+
+def pie(df, **spec):
+    return cached_figure("pie", df, **spec)
+
+
+def scatter(df, **spec):
+    """px.scatter, rendered with WebGL once ``df`` exceeds ``WEBGL_POINTS``."""
+    if len(df) > WEBGL_POINTS:
+        color = spec.get("color")
+        if (color is not None and not pd.api.types.is_numeric_dtype(df[color])
+                and df[color].nunique() > MAX_TRACES):
+            return cached_figure("scatter_gl", df, **spec)
+        spec["render_mode"] = "webgl"
+    return cached_figure("scatter", df, **spec)
+
+
+def _scatter_gl(df, x, y, color, size=None, size_max=20, title=None, template=None, **_):
+    """One Scattergl trace colored per point, instead of a trace per category.
+
+    Colors follow the px discrete sequence in order of first appearance, and
+    bubble sizes use px's area scaling, so the chart matches px.scatter.
+    """
+    theme = pio.templates[template or pio.templates.default]
+    palette = np.array(theme.layout.colorway or px.colors.qualitative.Plotly)
+    codes, _ = pd.factorize(df[color])
+    marker = {"color": palette[codes % len(palette)]}
+    hover = [f"{color}=%{{customdata[0]}}", f"{x}=%{{x}}", f"{y}=%{{y}}"]
+    if size is not None:
+        sizes = df[size].to_numpy(float)
+        marker.update(size=sizes, sizemode="area", sizeref=2.0 * np.nanmax(sizes) / size_max ** 2)
+        if size not in (x, y):
+            hover.append(f"{size}=%{{marker.size}}")
+    trace = go.Scattergl(x=df[x], y=df[y], mode="markers", marker=marker, customdata=df[[color]].astype(str),
+                         hovertemplate="<br>".join(hover) + "<extra></extra>", showlegend=False)
+    layout = {"title": {"text": title}, "xaxis": {"title": {"text": x}}, "yaxis": {"title": {"text": y}}}
+    if template is not None:
+        layout["template"] = template
+    return go.Figure(data=[trace], layout=layout)
+
+
+def _gauge_grid(df, value, label, axis_range=(0, 100), columns=3, title_suffix="",
+                row_height=260, template=None):
+    n = len(df)
+    rows = max(1, -(-n // columns))
+    pos = np.arange(n)
+    row, col = pos // columns, pos % columns
+    # Domains in paper coordinates, with a gap of a fraction of each cell
+    pad = 0.06
+    x0, x1 = (col + pad) / columns, (col + 1 - pad) / columns
+    y1, y0 = 1 - (row + pad) / rows, 1 - (row + 1 - pad) / rows
+    titles = df[label].astype(str).to_numpy() + title_suffix
+    gauge = {"axis": {"range": list(axis_range)}}
+    traces = [
+        {"type": "indicator", "mode": "gauge+number", "value": v, "title": {"text": t},
+         "gauge": gauge, "domain": {"x": [a, b], "y": [c, d]}}
+        for v, t, a, b, c, d in zip(df[value].tolist(), titles, x0, x1, y0, y1)
+    ]
+    layout = {"height": rows * row_height, "margin": {"t": 40, "b": 10, "l": 30, "r": 30}}
+    if template is not None:
+        layout["template"] = template
+    return go.Figure({"data": traces, "layout": layout})
+
+
+_BUILDERS = {"gauge_grid": _gauge_grid, "scatter_gl": _scatter_gl}
+
+
+def gauge_grid(df, value, label, axis_range=(0, 100), columns=3, title_suffix=""):
+    """One figure with a gauge per row of ``df``, laid out ``columns`` per row.
+
+    Replaces one go.Indicator figure (and one chart element) per row.
+    """
+    return cached_figure("gauge_grid", df, value=value, label=label, axis_range=tuple(axis_range),
+                         columns=columns, title_suffix=title_suffix)
+
+
+def clear():
+    cache.shared.clear("figure")
@@ -0,0 +1,41 @@
+"""Atomic file replacement shared by every writer under data/ and store/.
+
+Session threads, the watcher and the ingest scripts can rewrite the same
+file at once, and readers must never see a partial one. atomic_write()
+has the writer fill a uniquely named temp file in the target's folder and
+renames it over the target; a failed write removes the temp file.
+"""
+import os
+import tempfile
+from pathlib import Path
+
+
+def atomic_write(path, writer, mode=0o644):
+    """Call ``writer(tmp_path)`` and move the result to ``path``.
+
+    Returns whatever ``writer`` returns. The parent folder is created if
+    needed.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(prefix=f".{path.name}.", dir=path.parent)
+    os.close(fd)
+    try:
+        result = writer(tmp)
+        os.chmod(tmp, mode)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+    return result
+
+
+def write_text(path, text):
+    """Atomically replace ``path`` with ``text`` (UTF-8, newlines untranslated)."""
+    def writer(tmp):
+        with open(tmp, "w", encoding="utf-8", newline="") as fh:
+            fh.write(text)
+    atomic_write(path, writer)
@@ -0,0 +1,161 @@
+"""Knowledge Base page catalog and its lazy Streamlit rendering.
+
+Each page-type group lists its example pages plus the reviewer checklist
+and QA scenarios shared by every page in the group. Only the page picked
+in a group is rendered, instead of building every nested expander and its
+markdown on each rerun.
+"""
+from collections import namedtuple
+
+import streamlit as st
+
+from dashboard import links
+
+PageGroup = namedtuple("PageGroup", "title pages checklist scenarios")
+
+GROUPS = (
+    PageGroup(
+        "📘 RESOURCES",
+        {
+            "Article/Blog": "https://www.sensormatic.com/resources/ar/2025/sustainable-spx-label-blog",
+            "Case Study": "https://www.sensormatic.com/resources/cs/2025/nrf-big-show-2025-case-study",
+            "TrafficTrak’r": "https://www.sensormatic.com/resources/tt/2025/traffictrakr-202509",
+            "Ungated Video": "https://www.sensormatic.com/resources/vi/2025/nrf-2025-big-idea-session-video-recording",
+            "Gated Video/Webinar": "https://www.sensormatic.com/resources/vi/2025/orbit-ai-2025-webinar",
+            "White Paper": "https://www.sensormatic.com/resources/wp/2025/re-id-revolution-white-paper"
+        },
+        """
+        **Content Reviewer**
+        - Validate headline, summary, and CTA
+        - Check metadata (author, publish date, tags)
+        - Ensure internal links and document uploads are correct
+
+        **Language Reviewer**
+        - Confirm tone and grammar
+        - Validate localization readiness
+
+        **Marketing Stakeholder**
+        - Ensure SEO metadata and campaign tracking
+        - Confirm CRM/form integration (if gated)
+        """,
+        """
+        - Verify page loads without errors
+        - Test form submission (if applicable)
+        - Check video/document embed functionality
+        - Validate redirects and thank-you pages
+        - Confirm analytics tracking is firing
+        """,
+    ),
+    PageGroup(
+        "📰 MEDIA ITEMS",
+        {
+            "In the News": "https://www.sensormatic.com/media-center/in-the-news",
+            "Press Release": "https://www.sensormatic.com/media-center"
+        },
+        """
+        **Content Reviewer**
+        - Validate source and quote accuracy
+        - Check formatting and attribution
+
+        **Language Reviewer**
+        - Confirm clarity and tone
+        - Validate localization
+
+        **Marketing Stakeholder**
+        - Ensure SEO tagging and social sharing setup
+        """,
+        """
+        - Verify page loads and links work
+        - Check media embeds (if any)
+        - Confirm metadata and schema tags
+        """,
+    ),
+    PageGroup(
+        "📍 LANDING PAGES",
+        {
+            "Tradeshow LP": None,
+            "Campaign Home LP": "https://www.sensormatic.com/landing/source-tagging-registration"
+        },
+        """
+        **Content Reviewer**
+        - Validate event/campaign details and CTA
+        - Check form setup and thank-you page
+
+        **Language Reviewer**
+        - Confirm localization of messaging
+        - Validate translation accuracy
+
+        **Marketing Stakeholder**
+        - Ensure CRM integration and campaign tracking
+        - Confirm lead-gen flow and analytics
+        """,
+        """
+        - Test form submission and thank-you redirect
+        - Validate UTM parameters and tracking
+        - Check responsiveness across devices
+        """,
+    ),
+    PageGroup(
+        "🧩 SOLUTIONS",
+        {
+            "Solution Main Page": "https://www.sensormatic.com/loss-prevention-liability",
+            "Solution Sub-page": "https://www.sensormatic.com/loss-prevention-liability/compliance-manager/food-safety"
+        },
+        """
+        **Content Reviewer**
+        - Validate solution overview and benefits
+        - Check linking to sub-pages and CTAs
+
+        **Language Reviewer**
+        - Confirm terminology consistency
+        - Validate localization readiness
+
+        **Marketing Stakeholder**
+        - Ensure SEO metadata and product alignment
+        - Confirm analytics and engagement tracking
+        """,
+        """
+        - Verify page loads and links work
+        - Test CTA buttons and navigation
+        - Confirm analytics and tag firing
+        """,
+    ),
+)
+
+
+def page_urls():
+    """Every (group title, page name, url) with a URL, in catalog order."""
+    return [(group.title, name, url) for group in GROUPS for name, url in group.pages.items() if url]
+
+
+def render_page(group, name, health=None):
+    url = group.pages[name]
+    if url:
+        result = (health or {}).get(url)
+        st.markdown(f"[View Page]({url}) &nbsp; `{links.badge(result)}`")
+        if result is not None and result.redirects:
+            st.caption("Redirects: " + " → ".join(f"{status} {hop}" for status, hop in result.redirects))
+    else:
+        st.markdown("_No URL provided_")
+    st.subheader("✅ Reviewer Checklist")
+    st.markdown(group.checklist)
+
+    st.subheader("🧪 QA Functional Scenarios")
+    st.markdown(group.scenarios)
+
+
+def render():
+    """Render the Knowledge Base, building only the page type picked per group.
+
+    Page types are labelled with their last link check (scripts/check_links.py).
+    """
+    health = links.load_results()
+    for group in GROUPS:
+        with st.expander(group.title):
+            icons = {name: links.badge(health.get(url)).split(" ")[0] if url else ""
+                     for name, url in group.pages.items()}
+            name = st.selectbox("Page type", list(group.pages), index=None, key=f"kb-{group.title}",
+                                placeholder="Choose a page type to review",
+                                format_func=lambda n, icons=icons: f"{icons[n]} {n}".strip())
+            if name is not None:
+                render_page(group, name, health)
@@ -0,0 +1,212 @@
+"""Lighthouse JSON reports -> lighthouse_scores and lighthouse_deep_dive.
+
+Reports are several MB each, mostly screenshots and audit details, so
+ingest() hands them to a process pool: each worker hashes and parses one
+report and sends back only the fields below as one small row. The dashboard
+process never holds a report tree. Rows are cached by report content hash
+in store/lighthouse_reports.json, and files whose (mtime, size) are
+unchanged are not even re-read, so re-running over the same folder only
+parses new reports.
+
+Runs are reduced to a median per page, month and form factor
+(store/lighthouse_pages.parquet), and each month's pages to the median
+written to data/YYYY_MM/lighthouse_scores.csv and lighthouse_deep_dive.csv.
+Mobile and desktop audits are not comparable, so the datasets only use one
+form factor: ``SENSORMATIC_LIGHTHOUSE_FORM_FACTOR`` (default mobile).
+This is the only writer of those two datasets; the Excel converter skips
+them and months without them load as empty frames.
+"""
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+
+from dashboard import cache, data, fileio, schema, store
+
+REPORTS_CACHE_PATH = store.STORE_DIR / "lighthouse_reports.json"
+PAGES_PATH = store.STORE_DIR / "lighthouse_pages.parquet"
+
+# Lighthouse category id -> lighthouse_scores Metric
+CATEGORIES = {
+    "performance": "Performance",
+    "accessibility": "Accessibility",
+    "best-practices": "Best Practices",
+    "seo": "SEO",
+}
+# Audit id -> (lighthouse_deep_dive Metric, divisor from the audit's numericValue)
+AUDITS = {
+    "first-contentful-paint": ("First Contentful Paint (FCP)", 1000),
+    "speed-index": ("Speed Index", 1000),
+    "interactive": ("Time to Interactive (TTI)", 1000),
+    "total-blocking-time": ("Total Blocking Time (TBT)", 1),
+    "largest-contentful-paint": ("Largest Contentful Paint (LCP)", 1000),
+    "cumulative-layout-shift": ("Cumulative Layout Shift (CLS)", 1),
+}
+PAGE_KEYS = (store.MONTH_COLUMN, "url", "form_factor")
+FORM_FACTOR = os.environ.get("SENSORMATIC_LIGHTHOUSE_FORM_FACTOR", "mobile")
+
+
+def report_hash(raw):
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+def extract(report):
+    """The fields the dashboard uses from one parsed report (LHR)."""
+    settings = report.get("configSettings") or {}
+    fetch_time = report.get("fetchTime")
+    row = {
+        store.MONTH_COLUMN: fetch_time[:7].replace("-", "_") if fetch_time else None,
+        "url": report.get("finalDisplayedUrl") or report.get("finalUrl") or report.get("requestedUrl"),
+        "form_factor": settings.get("formFactor") or settings.get("emulatedFormFactor") or "mobile",
+        "fetch_time": fetch_time,
+    }
+    categories = report.get("categories") or {}
+    for category, metric in CATEGORIES.items():
+        score = (categories.get(category) or {}).get("score")
+        row[metric] = None if score is None else round(100 * score, 1)
+    audits = report.get("audits") or {}
+    for audit, (metric, divisor) in AUDITS.items():
+        value = (audits.get(audit) or {}).get("numericValue")
+        row[metric] = None if value is None else round(value / divisor, 3)
+    return row
+
+
+def _extract_file(path, known):
+    """Worker: (path, content hash, row or None if the hash is already cached, error)."""
+    try:
+        raw = Path(path).read_bytes()
+        digest = report_hash(raw)
+        if digest in known:
+            return path, digest, None, None
+        return path, digest, extract(json.loads(raw)), None
+    except (OSError, ValueError, AttributeError, TypeError) as exc:
+        return path, None, None, f"{type(exc).__name__}: {exc}"
+
+
+def _load_cache(path):
+    try:
+        with open(path, encoding="utf-8") as fh:
+            cached = json.load(fh)
+    except FileNotFoundError:
+        return {}, {}
+    return cached.get("files", {}), cached.get("rows", {})
+
+
+def ingest(report_dir, workers=None, cache_path=None):
+    """Extract every *.json report under ``report_dir``.
+
+    Returns (rows, parsed, errors): one dict per report, the number of
+    reports actually parsed this run and {path: error}.
+    """
+    cache_path = cache_path or REPORTS_CACHE_PATH
+    files, rows = _load_cache(cache_path)
+    paths = sorted(str(p) for p in Path(report_dir).rglob("*.json"))
+    digests, pending = {}, []
+    for path in paths:
+        stat = os.stat(path)
+        old = files.get(path)
+        if old is not None and old[:2] == [stat.st_mtime_ns, stat.st_size] and old[2] in rows:
+            digests[path] = old[2]
+        else:
+            pending.append(path)
+
+    errors, parsed = {}, 0
+    if pending:
+        known = frozenset(rows)
+        workers = workers or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            chunksize = max(1, len(pending) // (4 * workers))
+            for path, digest, row, error in pool.map(_extract_file, pending, [known] * len(pending),
+                                                     chunksize=chunksize):
+                if error is not None:
+                    errors[path] = error
+                    continue
+                if row is not None:
+                    rows[digest] = row
+                    parsed += 1
+                digests[path] = digest
+                stat = os.stat(path)
+                files[path] = [stat.st_mtime_ns, stat.st_size, digest]
+
+    # Forget reports that are gone from every folder seen so far
+    files = {path: entry for path, entry in files.items() if os.path.exists(path)}
+    rows = {digest: row for digest, row in rows.items() if digest in {entry[2] for entry in files.values()}}
+    fileio.write_text(cache_path, json.dumps({"files": files, "rows": rows}))
+    # Byte-identical copies of a report count as one run
+    unique = dict.fromkeys(digests[path] for path in paths if path in digests)
+    return [rows[digest] for digest in unique], parsed, errors
+
+
+def page_frame(rows):
+    """Median of each page's runs per month and form factor."""
+    df = pd.DataFrame(rows)
+    metrics = list(CATEGORIES.values()) + [metric for metric, _ in AUDITS.values()]
+    if df.empty:
+        return pd.DataFrame(columns=[*PAGE_KEYS, "runs", *metrics])
+    df = df.dropna(subset=[store.MONTH_COLUMN, "url"])
+    grouped = df.groupby(list(PAGE_KEYS), sort=True)
+    pages = grouped[metrics].median()
+    pages.insert(0, "runs", grouped.size())
+    return pages.reset_index()
+
+
+def month_datasets(pages, month, form_factor=FORM_FACTOR):
+    """(lighthouse_scores, lighthouse_deep_dive) frames for one month: median over its pages.
+
+    Only runs of ``form_factor`` count; both frames are empty if the month
+    has none.
+    """
+    monthly = pages[(pages[store.MONTH_COLUMN] == month) & (pages["form_factor"] == form_factor)]
+    scores = monthly[list(CATEGORIES.values())].median().round(1)
+    deep_dive = monthly[[metric for metric, _ in AUDITS.values()]].median().round(3)
+    return (scores.dropna().rename_axis(schema.METRIC).rename(schema.SCORE).reset_index(),
+            deep_dive.dropna().rename_axis(schema.METRIC).rename(schema.VALUE).reset_index())
+
+
+def _write_csv(df, target):
+    text = df.to_csv(index=False, lineterminator="\n")
+    if target.exists() and target.read_text(encoding="utf-8") == text:
+        # Unchanged: keep the mtime so the store watcher does not rebuild
+        return
+    fileio.write_text(target, text)
+
+
+def write_datasets(pages, data_dir=None, pages_path=None, form_factor=FORM_FACTOR):
+    """Save the per-page table and write both dataset CSVs for each month in ``pages``.
+
+    The CSVs summarize ``form_factor`` runs only; the per-page table keeps
+    every form factor.
+
+    Months without a data folder are skipped, since a folder holding only
+    the Lighthouse datasets would break every other section. Returns
+    (months written, months skipped).
+    """
+    pages_path = pages_path or PAGES_PATH
+    months = sorted(pages[store.MONTH_COLUMN].unique())
+    saved = load_pages(pages_path)
+    if len(saved):
+        # Months in this run replace their earlier rows; other months are kept
+        saved = saved[~saved[store.MONTH_COLUMN].isin(pages[store.MONTH_COLUMN])]
+        pages = pd.concat([saved, pages], ignore_index=True).sort_values(list(PAGE_KEYS), ignore_index=True)
+    fileio.atomic_write(pages_path, lambda tmp: pages.to_parquet(tmp, index=False))
+
+    available = set(data.available_months(data_dir))
+    written = [month for month in months if month in available]
+    for month in written:
+        scores, deep_dive = month_datasets(pages, month, form_factor)
+        _write_csv(scores, data.dataset_path(month, "lighthouse_scores", data_dir))
+        _write_csv(deep_dive, data.dataset_path(month, "lighthouse_deep_dive", data_dir))
+    return written, [month for month in months if month not in available]
+
+
+def load_pages(path=None):
+    """Per-page medians from the last ingest (empty if none), cached by mtime."""
+    path = path or PAGES_PATH
+    try:
+        mtime = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return pd.DataFrame()
+    return cache.versioned(("lighthouse", str(path)), mtime, lambda: pd.read_parquet(path))
@@ -0,0 +1,154 @@
+"""Concurrent link-health checks for the Knowledge Base page catalog.
+
+check() runs every URL through one pooled aiohttp session with a global
+concurrency bound, a per-host connection limit and a per-host request rate.
+Each URL gets a HEAD request and falls back to GET when the server rejects
+or mishandles HEAD. ETag/Last-Modified validators from the previous run are
+sent back as conditional headers, so unchanged pages answer 304 with no
+body. Results (status, latency, redirect chain) are saved to
+store/link_health.json for the dashboard badges and the Broken Links metric.
+"""
+import asyncio
+import json
+import time
+from collections import namedtuple
+from urllib.parse import urlsplit
+
+from dashboard import cache, fileio, store
+
+LINKS_PATH = store.STORE_DIR / "link_health.json"
+
+CONCURRENCY = 100
+PER_HOST = 6
+RATE_PER_HOST = 20.0  # request starts per second per host
+TIMEOUT = 15
+# HEAD answers that are not trusted without a GET
+HEAD_FALLBACK = {400, 403, 404, 405, 429, 500, 501, 503}
+
+LinkResult = namedtuple(
+    "LinkResult", "url status ok latency_ms redirects method etag last_modified error checked_at",
+    defaults=(None, False, None, (), "HEAD", None, None, None, None),
+)
+
+
+class HostRateLimiter:
+    """Spaces request starts to the same host ``1 / rate`` seconds apart."""
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate if rate else 0.0
+        self._next = {}
+
+    async def wait(self, host):
+        if not self.interval:
+            return
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        start = max(now, self._next.get(host, now))
+        self._next[host] = start + self.interval
+        if start > now:
+            await asyncio.sleep(start - now)
+
+
+def conditional_headers(etag=None, last_modified=None):
+    """Revalidation headers from a previous response's validators."""
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    return headers
+
+
+async def _request(session, limiter, method, url, headers):
+    await limiter.wait(urlsplit(url).netloc)
+    async with session.request(method, url, headers=headers, allow_redirects=True) as response:
+        if method == "GET":
+            # Only the status matters; stop reading after the first chunk
+            await response.content.read(1024)
+        redirects = tuple((r.status, str(r.url)) for r in response.history)
+        return response.status, redirects, response.headers.get("ETag"), response.headers.get("Last-Modified")
+
+
+async def check_url(session, limiter, semaphore, url, previous=None):
+    """Check one URL; never raises."""
+    import aiohttp
+
+    headers = conditional_headers(previous.etag, previous.last_modified) if previous and previous.ok else {}
+    async with semaphore:
+        start = time.perf_counter()
+        method = "HEAD"
+        try:
+            status, redirects, etag, modified = await _request(session, limiter, method, url, headers)
+            if status in HEAD_FALLBACK:
+                method = "GET"
+                status, redirects, etag, modified = await _request(session, limiter, method, url, headers)
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as exc:
+            return LinkResult(url, method=method, error=f"{type(exc).__name__}: {exc}".strip(": "),
+                              latency_ms=round((time.perf_counter() - start) * 1000, 1), checked_at=time.time())
+    latency = round((time.perf_counter() - start) * 1000, 1)
+    if status == 304 and previous is not None:
+        # Unchanged since the last check: keep its status and validators
+        return previous._replace(latency_ms=latency, method=method, checked_at=time.time())
+    return LinkResult(url, status, status < 400, latency, redirects, method, etag, modified, None, time.time())
+
+
+async def check_async(urls, previous=None, concurrency=CONCURRENCY, per_host=PER_HOST, rate=RATE_PER_HOST,
+                      timeout=TIMEOUT):
+    """Check ``urls`` concurrently; returns {url: LinkResult} in input order."""
+    import aiohttp
+
+    previous = previous or {}
+    urls = list(dict.fromkeys(urls))
+    semaphore = asyncio.Semaphore(concurrency)
+    limiter = HostRateLimiter(rate)
+    connector = aiohttp.TCPConnector(limit=concurrency, limit_per_host=per_host, ttl_dns_cache=300)
+    client_timeout = aiohttp.ClientTimeout(total=timeout)
+    async with aiohttp.ClientSession(connector=connector, timeout=client_timeout,
+                                     headers={"User-Agent": "sensormatic-link-checker"}) as session:
+        results = await asyncio.gather(*(check_url(session, limiter, semaphore, url, previous.get(url))
+                                         for url in urls))
+    return {result.url: result for result in results}
+
+
+def check(urls, previous=None, **options):
+    """Synchronous wrapper around check_async()."""
+    return asyncio.run(check_async(urls, previous, **options))
+
+
+def save_results(results, path=None):
+    """Atomically write {url: LinkResult} as JSON."""
+    rows = [result._asdict() for result in results.values()]
+    fileio.write_text(path or LINKS_PATH, json.dumps(rows, indent=1))
+
+
+def load_results(path=None):
+    """{url: LinkResult} from the last saved run ({} if none), cached by mtime."""
+    path = path or LINKS_PATH
+    try:
+        mtime = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return {}
+    return cache.versioned(("links", str(path)), mtime, lambda: _read_results(path))
+
+
+def _read_results(path):
+    with open(path, encoding="utf-8") as fh:
+        rows = json.load(fh)
+    return {row["url"]: LinkResult(**dict(row, redirects=tuple(map(tuple, row["redirects"]))))
+            for row in rows}
+
+
+def broken(results):
+    """Results whose last check failed (error or HTTP status >= 400)."""
+    return [result for result in results.values() if not result.ok]
+
+
+def badge(result):
+    """Short status badge for a KB entry."""
+    if result is None:
+        return "⚪ not checked"
+    if result.error:
+        return f"🔴 {result.error.split(':')[0]}"
+    icon = "🟢" if result.ok and not result.redirects else "🟡" if result.ok else "🔴"
+    hops = f" · {len(result.redirects)} redirect(s)" if result.redirects else ""
+    return f"{icon} {result.status} · {result.latency_ms:.0f} ms{hops}"
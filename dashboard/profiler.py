@@ -0,0 +1,163 @@
+"""Opt-in timing spans for the rerun hot path.
+
+Enable with ``SENSORMATIC_PROFILE=1`` or by opening the dashboard with
+``?profile=1``. Data loading, figure building and element emission are
+wrapped in spans; each rerun's spans are shown in a collapsible panel,
+totalled per section across reruns, and can be downloaded as a Chrome
+trace (load it in chrome://tracing or https://ui.perfetto.dev).
+
+When profiling is off no trace is active for the thread, and every span
+is a shared no-op context manager, so the cost is one attribute lookup.
+"""
+import contextlib
+import functools
+import json
+import os
+import threading
+import time
+
+ENABLED = os.environ.get("SENSORMATIC_PROFILE", "") not in ("", "0")
+QUERY_PARAM = "profile"
+
+_local = threading.local()
+_NULL = contextlib.nullcontext()
+_history_lock = threading.Lock()
+# {section: {(category, name): [count, total seconds]}} across reruns
+history = {}
+
+
+class Trace:
+    """Spans recorded during one rerun of one section."""
+
+    def __init__(self, section=None):
+        self.section = section
+        self.origin = time.perf_counter()
+        self.events = []
+
+    def add(self, name, category, start, end, args=None):
+        self.events.append((name, category, start, end, args))
+
+    def totals(self):
+        """{(category, name): [count, total seconds]} for this rerun."""
+        out = {}
+        for name, category, start, end, _ in self.events:
+            entry = out.setdefault((category, name), [0, 0.0])
+            entry[0] += 1
+            entry[1] += end - start
+        return out
+
+    def chrome_trace(self):
+        """The spans as Chrome trace-event JSON ("X" complete events)."""
+        pid, tid = os.getpid(), threading.get_ident()
+        events = [
+            {"name": name, "cat": category, "ph": "X", "pid": pid, "tid": tid,
+             "ts": round((start - self.origin) * 1e6, 1), "dur": round((end - start) * 1e6, 1),
+             "args": dict(args or {}, section=self.section)}
+            for name, category, start, end, args in self.events
+        ]
+        return json.dumps({"traceEvents": events, "displayTimeUnit": "ms"})
+
+
+class _Span:
+    __slots__ = ("trace", "name", "category", "args", "start")
+
+    def __init__(self, trace, name, category, args):
+        self.trace, self.name, self.category, self.args = trace, name, category, args
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.trace.add(self.name, self.category, self.start, time.perf_counter(), self.args)
+        return False
+
+
+def _requested():
+    if ENABLED:
+        return True
+    try:
+        import streamlit as st
+
+        return st.query_params.get(QUERY_PARAM, "") not in ("", "0")
+    except Exception:
+        return False
+
+
+def begin(section=None):
+    """Start a trace for this rerun if profiling is on; returns it or None."""
+    trace = Trace(section) if _requested() else None
+    _local.trace = trace
+    return trace
+
+
+def end():
+    """Stop recording, fold the rerun into ``history`` and return its trace."""
+    trace = getattr(_local, "trace", None)
+    _local.trace = None
+    if trace is not None:
+        with _history_lock:
+            section = history.setdefault(trace.section, {})
+            for key, (count, total) in trace.totals().items():
+                entry = section.setdefault(key, [0, 0.0])
+                entry[0] += count
+                entry[1] += total
+    return trace
+
+
+def span(name, category, **args):
+    """Context manager timing one step; a no-op unless a trace is active."""
+    trace = getattr(_local, "trace", None)
+    if trace is None:
+        return _NULL
+    return _Span(trace, name, category, args or None)
+
+
+def traced(category, name=None):
+    """Decorator wrapping every call of a function in a span."""
+    def decorator(fn):
+        label = name or fn.__qualname__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            trace = getattr(_local, "trace", None)
+            if trace is None:
+                return fn(*args, **kwargs)
+            with _Span(trace, label, category, None):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def _rows(totals):
+    rows = [{"Category": category, "Span": name, "Calls": count, "Total (ms)": round(total * 1000, 2)}
+            for (category, name), (count, total) in totals.items()]
+    return sorted(rows, key=lambda row: -row["Total (ms)"])
+
+
+def panel(trace):
+    """Collapsible profiler panel for a finished trace (nothing when None)."""
+    if trace is None:
+        return
+    import pandas as pd
+    import streamlit as st
+
+    with st.expander("⏱️ Profiler", expanded=False):
+        by_category = {}
+        for _, category, start, end_, _ in trace.events:
+            if category != "section":
+                by_category[category] = by_category.get(category, 0.0) + (end_ - start)
+        cols = st.columns(max(1, len(by_category)))
+        for col, (category, total) in zip(cols, sorted(by_category.items())):
+            col.metric(category, f"{total * 1000:.1f} ms")
+
+        st.caption("This rerun")
+        st.dataframe(pd.DataFrame(_rows(trace.totals())), hide_index=True)
+
+        st.caption("All reruns, per section")
+        with _history_lock:
+            rows = [{"Section": section, **row} for section, totals in history.items() for row in _rows(totals)]
+        st.dataframe(pd.DataFrame(rows), hide_index=True)
+
+        st.download_button("Download Chrome trace", trace.chrome_trace(), file_name="sensormatic_trace.json",
+                           mime="application/json")
@@ -0,0 +1,85 @@
+"""Per-month KPI summary materialized at ingestion time.
+
+The Birds-Eye View only needs a handful of headline numbers. They are
+computed for every month in one grouped pass over the columnar store and
+written to a small kpi_summary.parquet, so a viewer reads one row instead
+of loading and aggregating three datasets.
+"""
+import threading
+
+import pandas as pd
+
+from dashboard import fileio, schema, store
+
+SOURCES = ("automation_metrics", "performance_metrics", "release_metrics")
+
+MONTH = store.MONTH_COLUMN
+
+# Held across ensure_kpis' staleness check and rebuild
+_lock = threading.RLock()
+
+
+def kpi_path(store_dir=None):
+    return store.store_path(SOURCES[0], store_dir).with_name("kpi_summary.parquet")
+
+
+def compute_kpis(store_dir=None):
+    """One row of KPIs per month, from the stored source datasets."""
+    auto = store.read_store("automation_metrics", [schema.TEST_CASES, schema.PASS_RATE], store_dir=store_dir)
+    auto["_weighted"] = auto[schema.PASS_RATE] * auto[schema.TEST_CASES]
+    auto_kpis = auto.groupby(MONTH, observed=True).agg(
+        suites=(schema.PASS_RATE, "size"),
+        test_cases=(schema.TEST_CASES, "sum"),
+        avg_pass_rate=(schema.PASS_RATE, "mean"),
+        min_pass_rate=(schema.PASS_RATE, "min"),
+        max_pass_rate=(schema.PASS_RATE, "max"),
+        _weighted=("_weighted", "sum"),
+    )
+    auto_kpis["weighted_pass_rate"] = auto_kpis.pop("_weighted") / auto_kpis["test_cases"]
+
+    perf = store.read_store("performance_metrics", [schema.PAGE_LOAD_TIME, schema.UPTIME], store_dir=store_dir)
+    perf_kpis = perf.groupby(MONTH, observed=True).agg(
+        countries=(schema.UPTIME, "size"),
+        avg_uptime=(schema.UPTIME, "mean"),
+        min_uptime=(schema.UPTIME, "min"),
+        max_uptime=(schema.UPTIME, "max"),
+        avg_page_load_time=(schema.PAGE_LOAD_TIME, "mean"),
+        max_page_load_time=(schema.PAGE_LOAD_TIME, "max"),
+    )
+
+    rel = store.read_store("release_metrics", [schema.DEPLOYMENTS, schema.QA_SIGNOFF_TIME], store_dir=store_dir)
+    rel_kpis = rel.groupby(MONTH, observed=True).agg(
+        deployments=(schema.DEPLOYMENTS, "sum"),
+        avg_signoff_time=(schema.QA_SIGNOFF_TIME, "mean"),
+        max_signoff_time=(schema.QA_SIGNOFF_TIME, "max"),
+    )
+
+    kpis = pd.concat([auto_kpis, perf_kpis, rel_kpis], axis=1).reset_index()
+    kpis[MONTH] = kpis[MONTH].astype(str)
+    return kpis.sort_values(MONTH, ignore_index=True)
+
+
+def build_kpis(store_dir=None):
+    """Recompute and atomically rewrite the KPI summary; returns its rows."""
+    with _lock:
+        kpis = compute_kpis(store_dir)
+        fileio.atomic_write(kpi_path(store_dir), lambda tmp: kpis.to_parquet(tmp, index=False))
+        return len(kpis)
+
+
+def ensure_kpis(data_dir=None, store_dir=None):
+    """Rebuild sources and the summary if anything upstream is newer."""
+    with _lock:
+        for dataset in SOURCES:
+            store.ensure_dataset(dataset, data_dir, store_dir)
+        out = kpi_path(store_dir)
+        newest_source = max(store.store_path(d, store_dir).stat().st_mtime_ns for d in SOURCES)
+        if not out.exists() or out.stat().st_mtime_ns < newest_source:
+            build_kpis(store_dir)
+
+
+def read_kpis(month, store_dir=None):
+    """The KPI row for one month as a dict (empty if the month has no data)."""
+    ensure_kpis(store_dir=store_dir)
+    row = pd.read_parquet(kpi_path(store_dir), filters=[(MONTH, "==", month)])
+    return row.iloc[0].to_dict() if len(row) else {}
@@ -0,0 +1,200 @@
+"""Schema registry for the monthly datasets.
+
+Every dataset declares its columns in CSV header order with the dtype the
+dashboard expects, a valid range for numeric columns and, where the set is
+closed, the allowed labels. read_csv() parses with these dtypes directly
+(no inference pass) and drops rows that do not fit the schema, so a stray
+string in one cell cannot turn a whole column into object dtype.
+"""
+import logging
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+Column = namedtuple("Column", "name dtype min max categories", defaults=(None, None, None))
+
+
+class SchemaError(ValueError):
+    """A data file is missing columns required by its schema."""
+
+
+# Column names shared across datasets and charts
+COUNTRY = "Country"
+PAGES_TESTED = "% Pages Tested"
+FORM_TYPE = "Form Type"
+FORMS_TESTED = "% Forms Tested"
+METRIC = "Metric"
+COVERAGE = "Coverage %"
+SUITE = "Suite"
+TEST_CASES = "Test Cases"
+PASS_RATE = "Pass Rate %"
+EXECUTION_TIME = "Execution Time (min)"
+BROWSER = "Browser"
+LANGUAGES_COVERED = "Languages Covered"
+ERROR_TYPE = "Error Type"
+COUNT = "Count"
+PAGE_LOAD_TIME = "Page Load Time (s)"
+UPTIME = "Uptime %"
+SCORE = "Score"
+VALUE = "Value"
+SENTIMENT = "Sentiment"
+LEAD_TYPE = "Lead Type"
+MONTH = "Month"
+DEPLOYMENTS = "Deployments"
+POST_DEPLOYMENT_ISSUES = "Post-Deployment Issues"
+TIME_TO_RESOLVE = "Time to Resolve (hrs)"
+QA_SIGNOFF_TIME = "QA Sign-off Time (hrs)"
+
+LIGHTHOUSE_CATEGORIES = ("Performance", "Accessibility", "Best Practices", "SEO")
+# Timings in seconds except TBT (ms); CLS is unitless
+DEEP_DIVE_METRICS = (
+    "First Contentful Paint (FCP)",
+    "Speed Index",
+    "Time to Interactive (TTI)",
+    "Total Blocking Time (TBT)",
+    "Largest Contentful Paint (LCP)",
+    "Cumulative Layout Shift (CLS)",
+)
+SENTIMENTS = ("Positive", "Neutral", "Negative")
+
+SCHEMAS = {
+    "country_coverage": (
+        Column(COUNTRY, "category"),
+        Column(PAGES_TESTED, "float64", 0, 100),
+    ),
+    "form_coverage": (
+        Column(FORM_TYPE, "category"),
+        Column(FORMS_TESTED, "float64", 0, 100),
+    ),
+    "coveo_coverage": (
+        Column(METRIC, "category"),
+        Column(COVERAGE, "float64", 0, 100),
+    ),
+    "automation_metrics": (
+        Column(SUITE, "category"),
+        Column(TEST_CASES, "int32", 0),
+        Column(PASS_RATE, "float64", 0, 100),
+        Column(EXECUTION_TIME, "float64", 0),
+    ),
+    "browser_matrix": (
+        Column(BROWSER, "category"),
+        Column(LANGUAGES_COVERED, "int16", 0),
+    ),
+    "error_metrics": (
+        Column(ERROR_TYPE, "category"),
+        Column(COUNT, "int32", 0),
+    ),
+    "performance_metrics": (
+        Column(COUNTRY, "category"),
+        Column(PAGE_LOAD_TIME, "float64", 0),
+        Column(UPTIME, "float64", 0, 100),
+    ),
+    "lighthouse_scores": (
+        Column(METRIC, "category", categories=LIGHTHOUSE_CATEGORIES),
+        Column(SCORE, "float64", 0, 100),
+    ),
+    "lighthouse_deep_dive": (
+        Column(METRIC, "category", categories=DEEP_DIVE_METRICS),
+        Column(VALUE, "float64", 0),
+    ),
+    "sentiment_data": (
+        Column(SENTIMENT, "category", categories=SENTIMENTS),
+        Column(COUNT, "int32", 0),
+    ),
+    "lead_segmentation": (
+        Column(LEAD_TYPE, "category"),
+        Column(COUNT, "int32", 0),
+    ),
+    "release_metrics": (
+        Column(MONTH, "category"),
+        Column(DEPLOYMENTS, "int16", 0),
+        Column(POST_DEPLOYMENT_ISSUES, "int16", 0),
+        Column(TIME_TO_RESOLVE, "float64", 0),
+        Column(QA_SIGNOFF_TIME, "float64", 0),
+    ),
+}
+
+# Header layout per dataset, as written by the Excel converter
+COLUMNS = {dataset: tuple(col.name for col in cols) for dataset, cols in SCHEMAS.items()}
+
+
+def _is_numeric(col):
+    return col.dtype != "category"
+
+
+def _fits_int(values, dtype):
+    """Whole numbers inside ``dtype``'s range (NaN counts as not fitting)."""
+    bounds = np.iinfo(dtype)
+    return ((values % 1 == 0) & (values >= bounds.min) & (values <= bounds.max)).to_numpy()
+
+
+def _valid_rows(df, columns):
+    ok = np.ones(len(df), dtype=bool)
+    for col in columns:
+        values = df[col.name]
+        if _is_numeric(col):
+            ok &= values.notna().to_numpy()
+            if col.dtype.startswith("int"):
+                # Casting would silently truncate 50.7 or wrap 1e12
+                ok &= _fits_int(values, col.dtype)
+            if col.min is not None:
+                ok &= (values >= col.min).to_numpy()
+            if col.max is not None:
+                ok &= (values <= col.max).to_numpy()
+        else:
+            ok &= values.notna().to_numpy()
+            if col.categories is not None:
+                ok &= values.isin(col.categories).to_numpy()
+    return ok
+
+
+def apply_dtypes(df, dataset):
+    """Cast ``df`` to the schema dtypes (after validation or concatenation).
+
+    Raises SchemaError rather than truncate or wrap a value that does not
+    fit an integer column.
+    """
+    for col in SCHEMAS[dataset]:
+        if col.name in df.columns and col.dtype.startswith("int") and df[col.name].dtype.kind == "f":
+            if not _fits_int(df[col.name], col.dtype).all():
+                raise SchemaError(f"{dataset}: {col.name!r} has values that do not fit {col.dtype}")
+    return df.astype({col.name: col.dtype for col in SCHEMAS[dataset] if col.name in df.columns})
+
+
+def empty_frame(dataset):
+    """A zero-row frame with the dataset's columns and dtypes."""
+    return apply_dtypes(pd.DataFrame(columns=list(COLUMNS[dataset])), dataset)
+
+
+def read_csv(path, dataset):
+    """Parse one dataset CSV with explicit dtypes and drop invalid rows."""
+    columns = SCHEMAS[dataset]
+    names = [col.name for col in columns]
+    # Parse numerics as float64 first so a blank cell does not abort the read;
+    # integer columns are narrowed after validation.
+    dtypes = {col.name: "float64" if _is_numeric(col) else "category" for col in columns}
+    try:
+        df = pd.read_csv(path, usecols=names, dtype=dtypes)
+    except ValueError as exc:
+        if "Usecols do not match" in str(exc):
+            raise SchemaError(f"{path}: {exc}") from exc
+        # A non-numeric value in a numeric column: re-read those columns as text
+        if hasattr(path, "seek"):
+            path.seek(0)
+        df = pd.read_csv(path, usecols=names, dtype={name: "category" if dtype == "category" else str
+                                                     for name, dtype in dtypes.items()})
+        for col in columns:
+            if _is_numeric(col):
+                df[col.name] = pd.to_numeric(df[col.name], errors="coerce")
+
+    ok = _valid_rows(df, columns)
+    if not ok.all():
+        bad = np.flatnonzero(~ok)
+        # +2: header line and 1-based line numbers
+        logger.warning("%s: dropped %d invalid row(s) at line(s) %s", path, len(bad),
+                       ", ".join(str(i + 2) for i in bad[:10]))
+        df = df[ok].reset_index(drop=True)
+    return apply_dtypes(df[names], dataset)
@@ -0,0 +1,53 @@
+"""Registry of dashboard sections and the datasets each one needs.
+
+A section is a render function plus the datasets it declares. Only the
+selected section is executed, and only its datasets are loaded, so a
+rerun costs what is on screen rather than the whole dashboard.
+"""
+from collections import namedtuple
+
+from dashboard import data, profiler
+
+Section = namedtuple("Section", "name datasets render")
+
+
+class SectionRegistry:
+    def __init__(self, loader=data.load_dataset):
+        self.loader = loader
+        self._sections = {}
+
+    def register(self, name, datasets=()):
+        """Decorator registering ``render(month, **frames)`` as a section.
+
+        Each declared dataset is passed to the function as a keyword
+        argument of the same name.
+        """
+        def decorator(render):
+            unknown = set(datasets) - set(data.DATASETS)
+            if unknown:
+                raise KeyError(f"Section {name!r} declares unknown datasets: {sorted(unknown)}")
+            self._sections[name] = Section(name, tuple(datasets), render)
+            return render
+        return decorator
+
+    def names(self):
+        return list(self._sections)
+
+    def __getitem__(self, name):
+        return self._sections[name]
+
+    def __contains__(self, name):
+        return name in self._sections
+
+    def load(self, name, month):
+        """Load the datasets declared by one section for ``month``."""
+        frames = {}
+        for dataset in self._sections[name].datasets:
+            with profiler.span(f"load {dataset}", "data"):
+                frames[dataset] = self.loader(month, dataset)
+        return frames
+
+    def render(self, name, month):
+        section = self._sections[name]
+        with profiler.span(name, "section", month=month):
+            return section.render(month, **self.load(name, month))
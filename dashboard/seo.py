@@ -0,0 +1,286 @@
+"""Page metadata crawler for the SEO metrics.
+
+crawl() fetches pages concurrently (same pooled client, per-host limits and
+rate limiter as dashboard.links), hashes each body as it streams in and
+parses it with a streaming html.parser for the title, meta description,
+canonical link, hreflang alternates, robots directives and schema.org
+types. Re-crawls are incremental: ETag/Last-Modified are sent back as
+conditional headers, and a page whose body hash is unchanged reuses its
+previous parse. Results are saved to store/seo_pages.json.
+
+coverage() turns them into Meta Tag Coverage per page type and locale.
+"""
+import asyncio
+import codecs
+import hashlib
+import json
+import os
+import re
+import time
+from collections import namedtuple
+from html.parser import HTMLParser
+from urllib.parse import urlsplit
+
+import pandas as pd
+
+from dashboard import cache, fileio, links, store
+
+SEO_PATH = store.STORE_DIR / "seo_pages.json"
+
+# Tags a page needs to count as covered
+REQUIRED = ("title", "description", "canonical")
+LOCALE_RE = re.compile(r"^/([a-z]{2,3}(?:[-_][a-z0-9]{2,3})?)(?=/|$)", re.IGNORECASE)
+# Path prefixes that are locales; anything else (/go/, /us/, /io/) is an
+# ordinary first segment. Override with SENSORMATIC_LOCALES=en-us,de-de,...
+LOCALES = frozenset(
+    locale.strip().lower() for locale in os.environ.get("SENSORMATIC_LOCALES", ",".join((
+        "en", "en-us", "en-gb", "en-ca", "en-au", "en-nz", "en-ie", "en-in", "en-sg", "en-za", "en-ae",
+        "de", "de-de", "de-at", "de-ch", "fr", "fr-fr", "fr-ca", "fr-be", "fr-ch",
+        "es", "es-es", "es-mx", "es-419", "it", "it-it", "nl", "nl-nl", "nl-be", "pt", "pt-br", "pt-pt",
+        "sv", "sv-se", "da", "da-dk", "nb", "nb-no", "fi", "fi-fi", "pl", "pl-pl", "cs", "cs-cz",
+        "tr", "tr-tr", "ru", "ru-ru", "ar", "ar-ae", "he", "he-il",
+        "ja", "ja-jp", "ko", "ko-kr", "zh", "zh-cn", "zh-tw", "zh-hk",
+    ))).split(",") if locale.strip()
+)
+
+PageMeta = namedtuple(
+    "PageMeta",
+    "url page_type locale status content_hash etag last_modified title description canonical hreflang "
+    "schema_types noindex error checked_at",
+    defaults=(None,) * 14,
+)
+
+
+class MetaParser(HTMLParser):
+    """Collects SEO tags from HTML fed in chunks."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.lang = None
+        self.title = None
+        self.description = None
+        self.canonical = None
+        self.hreflang = []
+        self.schema_types = set()
+        self.noindex = False
+        self._in_title = False
+        self._in_jsonld = False
+        self._chunks = []
+
+    def handle_starttag(self, tag, attrs):
+        attrs = {k.lower(): (v or "") for k, v in attrs}
+        if tag == "html":
+            self.lang = attrs.get("lang") or None
+        elif tag == "title" and self.title is None:
+            self._in_title, self._chunks = True, []
+        elif tag == "meta":
+            name = attrs.get("name", "").lower()
+            if name == "description" and attrs.get("content", "").strip():
+                self.description = attrs["content"].strip()
+            elif name == "robots" and "noindex" in attrs.get("content", "").lower():
+                self.noindex = True
+        elif tag == "link":
+            rel = attrs.get("rel", "").lower().split()
+            if "canonical" in rel and attrs.get("href"):
+                self.canonical = attrs["href"]
+            elif "alternate" in rel and attrs.get("hreflang"):
+                self.hreflang.append(attrs["hreflang"])
+        elif tag == "script" and attrs.get("type", "").lower() == "application/ld+json":
+            self._in_jsonld, self._chunks = True, []
+        if "itemtype" in attrs:
+            self.schema_types.add(attrs["itemtype"].rstrip("/").rsplit("/", 1)[-1])
+
+    def handle_data(self, data):
+        if self._in_title or self._in_jsonld:
+            self._chunks.append(data)
+
+    def handle_endtag(self, tag):
+        if tag == "title" and self._in_title:
+            self._in_title = False
+            self.title = " ".join("".join(self._chunks).split()) or None
+        elif tag == "script" and self._in_jsonld:
+            self._in_jsonld = False
+            self.schema_types.update(_jsonld_types("".join(self._chunks)))
+
+
+def _jsonld_types(text):
+    try:
+        payload = json.loads(text)
+    except ValueError:
+        return set()
+    types, stack = set(), [payload]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, list):
+            stack.extend(node)
+        elif isinstance(node, dict):
+            kind = node.get("@type")
+            types.update(kind if isinstance(kind, list) else [kind] if kind else [])
+            stack.extend(node.get("@graph", []))
+    return {str(t) for t in types}
+
+
+def _split_locale(path):
+    """(locale or None, path without it) for a URL path with a known LOCALES prefix."""
+    match = LOCALE_RE.match(path)
+    if match:
+        locale = match.group(1).lower().replace("_", "-")
+        if locale in LOCALES:
+            return locale, path[match.end():] or "/"
+    return None, path
+
+
+def page_locale(url, lang=None):
+    """Locale from a known path prefix (/de-de/), else the <html lang>, else "default"."""
+    locale, _ = _split_locale(urlsplit(url).path)
+    if locale:
+        return locale
+    return lang.lower() if lang else "default"
+
+
+def page_type(url):
+    """Page type from the first path segment after any locale prefix."""
+    _, path = _split_locale(urlsplit(url).path)
+    segment = path.strip("/").split("/", 1)[0]
+    return segment or "home"
+
+
+def parse(chunks):
+    """Run MetaParser over an iterable of text chunks."""
+    parser = MetaParser()
+    for chunk in chunks:
+        parser.feed(chunk)
+    parser.close()
+    return parser
+
+
+def _charset(name):
+    """Python codec name for a declared charset; utf-8 if unknown or missing."""
+    try:
+        return codecs.lookup(name).name if name else "utf-8"
+    except LookupError:
+        return "utf-8"
+
+
+async def fetch_page(session, limiter, semaphore, url, kind=None, previous=None):
+    """Fetch and parse one page; never raises.
+
+    Any failure, network or otherwise, becomes a PageMeta with ``error``
+    set, so one bad page cannot abort the crawl.
+    """
+    kind = kind or page_type(url)
+    try:
+        return await _fetch_page(session, limiter, semaphore, url, kind, previous)
+    except Exception as exc:
+        return PageMeta(url, kind, page_locale(url), error=f"{type(exc).__name__}: {exc}", checked_at=time.time())
+
+
+async def _fetch_page(session, limiter, semaphore, url, kind, previous):
+    import aiohttp
+
+    if previous is not None and previous.error is None and (previous.status or 0) < 400:
+        headers = links.conditional_headers(previous.etag, previous.last_modified)
+    else:
+        headers = {}
+    now = time.time()
+    async with semaphore:
+        await limiter.wait(urlsplit(url).netloc)
+        try:
+            async with session.get(url, headers=headers) as response:
+                status = response.status
+                if status == 304 and previous is not None:
+                    return previous._replace(page_type=kind, checked_at=now)
+                digest = hashlib.blake2b(digest_size=16)
+                body = []
+                async for chunk in response.content.iter_chunked(64 * 1024):
+                    digest.update(chunk)
+                    body.append(chunk)
+                etag, modified = response.headers.get("ETag"), response.headers.get("Last-Modified")
+                charset = _charset(response.charset)
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as exc:
+            return PageMeta(url, kind, page_locale(url), error=f"{type(exc).__name__}: {exc}", checked_at=now)
+
+    content_hash = digest.hexdigest()
+    if previous is not None and previous.content_hash == content_hash:
+        # Same bytes as last time: skip parsing
+        return previous._replace(page_type=kind, status=status, etag=etag, last_modified=modified,
+                                 checked_at=now)
+    decoder = codecs.getincrementaldecoder(charset)(errors="replace")
+    parsed = parse(decoder.decode(chunk) for chunk in body + [b""])
+    return PageMeta(url, kind, page_locale(url, parsed.lang), status, content_hash, etag, modified,
+                    parsed.title, parsed.description, parsed.canonical, tuple(sorted(set(parsed.hreflang))),
+                    tuple(sorted(parsed.schema_types)), parsed.noindex, None, now)
+
+
+async def crawl_async(pages, previous=None, concurrency=links.CONCURRENCY, per_host=links.PER_HOST,
+                      rate=links.RATE_PER_HOST, timeout=links.TIMEOUT):
+    """Crawl ``pages`` ({url: page type or None}); returns {url: PageMeta}."""
+    import aiohttp
+
+    previous = previous or {}
+    semaphore = asyncio.Semaphore(concurrency)
+    limiter = links.HostRateLimiter(rate)
+    connector = aiohttp.TCPConnector(limit=concurrency, limit_per_host=per_host, ttl_dns_cache=300)
+    async with aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=timeout),
+                                     headers={"User-Agent": "sensormatic-seo-crawler"}) as session:
+        results = await asyncio.gather(*(fetch_page(session, limiter, semaphore, url, kind, previous.get(url))
+                                         for url, kind in pages.items()))
+    return {meta.url: meta for meta in results}
+
+
+def crawl(pages, previous=None, **options):
+    """Synchronous wrapper around crawl_async()."""
+    return asyncio.run(crawl_async(pages, previous, **options))
+
+
+def save_pages(pages, path=None):
+    """Atomically write {url: PageMeta} as JSON."""
+    rows = [meta._asdict() for meta in pages.values()]
+    fileio.write_text(path or SEO_PATH, json.dumps(rows, indent=1))
+
+
+def load_pages(path=None):
+    """{url: PageMeta} from the last crawl ({} if none), cached by mtime."""
+    path = path or SEO_PATH
+    try:
+        mtime = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return {}
+    return cache.versioned(("seo", str(path)), mtime, lambda: _read_pages(path))
+
+
+def _read_pages(path):
+    with open(path, encoding="utf-8") as fh:
+        rows = json.load(fh)
+    return {row["url"]: PageMeta(**dict(row, hreflang=tuple(row["hreflang"] or ()),
+                                        schema_types=tuple(row["schema_types"] or ())))
+            for row in rows}
+
+
+def pages_frame(pages):
+    """Crawled pages that returned HTML, one row each, with a flag per tag."""
+    rows = [meta for meta in pages.values() if meta.error is None and meta.status is not None and meta.status < 400]
+    df = pd.DataFrame(rows, columns=PageMeta._fields)
+    for tag in REQUIRED:
+        df[f"has_{tag}"] = df[tag].notna()
+    df["has_hreflang"] = df["hreflang"].map(bool)
+    df["has_schema"] = df["schema_types"].map(bool)
+    df["covered"] = df[[f"has_{tag}" for tag in REQUIRED]].all(axis=1)
+    return df
+
+
+def coverage(pages, by=("page_type", "locale")):
+    """Meta Tag Coverage % (all of REQUIRED present) and per-tag % per group."""
+    df = pages_frame(pages)
+    flags = [f"has_{tag}" for tag in REQUIRED] + ["has_hreflang", "has_schema", "covered"]
+    out = df.groupby(list(by), observed=True)[flags].mean().mul(100).round(1)
+    out.insert(0, "pages", df.groupby(list(by), observed=True).size())
+    return out.rename(columns={"covered": "Meta Tag Coverage %"}).reset_index()
+
+
+def summary(pages):
+    """(indexable pages, overall Meta Tag Coverage %) for the headline metrics."""
+    df = pages_frame(pages)
+    if df.empty:
+        return 0, None
+    return int((~df["noindex"].astype(bool)).sum()), round(100 * float(df["covered"].mean()), 1)
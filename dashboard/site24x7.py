@@ -0,0 +1,245 @@
+"""SLA uptime and response-time percentiles from Site24x7 check logs.
+
+ingest() streams an exported check-result CSV (plain or gzip) in Arrow
+record batches, so a month of 1-minute checks from 40 locations never sits
+in memory at once. Per (month, country) it keeps:
+
+- a histogram of response times over log-spaced bins (~1% wide), from
+  which p50/p95/p99 are read without keeping the samples;
+- the down checks as [start, start + interval) intervals. At the end these
+  are unioned per group with a sort and a running maximum of the interval
+  ends, so overlapping outages from several locations count once.
+
+Uptime % is 100 * (1 - merged downtime / observed span). The ``ALL`` row
+merges every location, i.e. the site counts as down while any location
+reports it down. Results go to store/site24x7.parquet, one row per month
+and country.
+
+Several exports (per-location or partial-month files) are folded into one
+accumulator before the rows are computed. save_stats() replaces whole
+months, so every export covering a month must be ingested in the same call.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+
+from dashboard import cache, fileio, schema, store
+
+SITE24X7_PATH = store.STORE_DIR / "site24x7.parquet"
+ALL = "All"
+
+INTERVAL = 60  # seconds between checks from one location
+BLOCK_SIZE = 32 * 2**20  # CSV bytes per record batch
+DOWN_STATUSES = ("down", "critical", "0")
+
+# Export header aliases, matched case-insensitively
+COLUMNS = {
+    "timestamp": ("timestamp", "time", "collected time", "date"),
+    "location": ("location", "monitor location", "poll location"),
+    "status": ("status", "availability"),
+    "response_ms": ("response ms", "response time", "response time (ms)", "response_time", "response_ms"),
+}
+# Location suffixes that differ from the dashboard's country labels
+COUNTRY_ALIASES = {"GB": "UK"}
+
+# Log-spaced response-time bins from 1 ms to 2 minutes
+EDGES = np.geomspace(1, 120_000, 1201)
+BIN_MID = np.sqrt(EDGES[:-1] * EDGES[1:])
+N_BINS = len(EDGES) - 1
+LOG_SCALE = N_BINS / np.log(EDGES[-1])
+PERCENTILES = (50, 95, 99)
+
+
+def location_country(location):
+    """Country label from a "City - CC" location name (the name itself otherwise)."""
+    code = str(location).rsplit("-", 1)[-1].strip().upper()
+    return COUNTRY_ALIASES.get(code, code)
+
+
+def _resolve_columns(names):
+    lower = {name.strip().lower(): name for name in names}
+    resolved = {}
+    for field, aliases in COLUMNS.items():
+        match = next((lower[a] for a in aliases if a in lower), None)
+        if match is None:
+            raise ValueError(f"No {field} column in check log (expected one of {', '.join(aliases)})")
+        resolved[field] = match
+    return resolved
+
+
+def _epoch_seconds(column):
+    """Arrow timestamp, string or epoch column -> int64 UTC seconds."""
+    if pa.types.is_timestamp(column.type):
+        return pc.cast(column, pa.timestamp("s", column.type.tz)).cast(pa.int64()).to_numpy(zero_copy_only=False)
+    if pa.types.is_integer(column.type) or pa.types.is_floating(column.type):
+        values = column.to_numpy(zero_copy_only=False).astype(np.int64)
+        return values // 1000 if len(values) and values.max() > 10**11 else values
+    parsed = pd.to_datetime(column.to_pandas(), utc=True, format="mixed")
+    return parsed.to_numpy(dtype="datetime64[s]").astype(np.int64)
+
+
+class _Accumulator:
+    """Running histograms, spans and down intervals per (month, country)."""
+
+    def __init__(self, interval):
+        self.interval = interval
+        self.groups = {}  # (month, country) -> group id
+        self.hist = np.zeros((0, N_BINS), dtype=np.int64)
+        self.first = np.zeros(0, dtype=np.int64)
+        self.last = np.zeros(0, dtype=np.int64)
+        self.checks = np.zeros(0, dtype=np.int64)
+        self.down_starts, self.down_groups = [], []
+
+    def _group_ids(self, keys):
+        ids = [self.groups.setdefault(key, len(self.groups)) for key in keys]
+        grow = len(self.groups) - len(self.first)
+        if grow > 0:
+            self.hist = np.vstack([self.hist, np.zeros((grow, N_BINS), dtype=np.int64)])
+            self.first = np.concatenate([self.first, np.full(grow, np.iinfo(np.int64).max)])
+            self.last = np.concatenate([self.last, np.full(grow, np.iinfo(np.int64).min)])
+            self.checks = np.concatenate([self.checks, np.zeros(grow, dtype=np.int64)])
+        return np.asarray(ids, dtype=np.int64)
+
+    def add(self, seconds, location, down, response):
+        """Fold one batch in (location is a dictionary-encoded Arrow array)."""
+        months = seconds.astype("datetime64[s]").astype("datetime64[M]")
+        month_codes = months.astype(np.int64)
+        countries = [location_country(name) for name in location.dictionary.to_pylist()]
+        country_names, country_codes = np.unique(countries, return_inverse=True)
+        loc_codes = country_codes[location.indices.to_numpy(zero_copy_only=False)]
+
+        # Each check counts towards its country and towards ALL
+        all_code = len(country_names)
+        keys, local = np.unique(np.concatenate([month_codes * (all_code + 1) + loc_codes,
+                                                month_codes * (all_code + 1) + all_code]), return_inverse=True)
+        names = list(country_names) + [ALL]
+        gids = self._group_ids([(str(np.datetime64(int(k // (all_code + 1)), "M")).replace("-", "_"),
+                                 names[int(k % (all_code + 1))]) for k in keys])[local]
+        seconds2 = np.concatenate([seconds, seconds])
+        down2 = np.concatenate([down, down])
+        timed = ~np.isnan(response)
+        # Bins are log-spaced, so the bin index is a scaled log rather than a search
+        bins = np.clip((np.log(np.maximum(response[timed], 1)) * LOG_SCALE).astype(np.int64), 0, N_BINS - 1)
+
+        np.minimum.at(self.first, gids, seconds2)
+        np.maximum.at(self.last, gids, seconds2)
+        self.checks += np.bincount(gids, minlength=len(self.checks))
+        self.hist += np.bincount(np.concatenate([gids[:len(seconds)][timed], gids[len(seconds):][timed]]) * N_BINS
+                                 + np.concatenate([bins, bins]), minlength=self.hist.size).reshape(self.hist.shape)
+        self.down_starts.append(seconds2[down2])
+        self.down_groups.append(gids[down2])
+
+    def downtime(self):
+        """Merged downtime seconds per group."""
+        total = np.zeros(len(self.groups), dtype=np.int64)
+        if not self.down_starts:
+            return total
+        starts, groups = np.concatenate(self.down_starts), np.concatenate(self.down_groups)
+        if not len(starts):
+            return total
+        # Shift each group onto its own stretch of the time axis: one sorted
+        # pass with a running maximum then merges every group at once
+        shifted = starts + groups * 2**34
+        order = np.argsort(shifted, kind="stable")
+        shifted, groups = shifted[order], groups[order]
+        ends = shifted + self.interval
+        opens = np.r_[True, shifted[1:] > np.maximum.accumulate(ends)[:-1]]
+        first = np.flatnonzero(opens)
+        np.add.at(total, groups[first], np.maximum.reduceat(ends, first) - shifted[first])
+        return total
+
+    def frame(self):
+        seconds = self.downtime()
+        span = np.maximum(self.last + self.interval - self.first, 1)
+        cumulative = np.cumsum(self.hist, axis=1)
+        counts = cumulative[:, -1]
+        rows = {
+            store.MONTH_COLUMN: [month for month, _ in self.groups],
+            schema.COUNTRY: [country for _, country in self.groups],
+            "Checks": self.checks,
+            schema.UPTIME: np.round(100 * (1 - seconds / span), 3),
+            "Downtime (min)": np.round(seconds / 60, 1),
+            "Avg Response (ms)": np.round((self.hist * BIN_MID).sum(axis=1) / np.maximum(counts, 1), 1),
+        }
+        for p in PERCENTILES:
+            idx = (cumulative < np.ceil(counts * p / 100)[:, None]).sum(axis=1)
+            rows[f"p{p} (ms)"] = np.where(counts > 0, np.round(BIN_MID[np.minimum(idx, N_BINS - 1)]), np.nan)
+        return pd.DataFrame(rows).sort_values([store.MONTH_COLUMN, schema.COUNTRY], ignore_index=True)
+
+
+def ingest(paths, interval=INTERVAL, block_size=BLOCK_SIZE):
+    """Stream one or more check-log exports; returns one row per (month, country).
+
+    Checks from every export are merged before uptime and percentiles are
+    computed. A ValueError names the export that could not be read.
+    """
+    if isinstance(paths, (str, os.PathLike)):
+        paths = [paths]
+    totals = _Accumulator(interval)
+    for path in paths:
+        try:
+            _fold(path, totals, block_size)
+        except (OSError, ValueError) as exc:
+            raise ValueError(f"{path}: {exc}") from exc
+    return totals.frame()
+
+
+def _fold(path, totals, block_size):
+    """Stream one export into ``totals``."""
+    with pacsv.open_csv(path, read_options=pacsv.ReadOptions(block_size=block_size)) as probe:
+        columns = _resolve_columns(probe.schema.names)
+    convert = pacsv.ConvertOptions(
+        include_columns=list(columns.values()),
+        column_types={columns["location"]: pa.dictionary(pa.int32(), pa.string()),
+                      columns["status"]: pa.string(), columns["response_ms"]: pa.float64()},
+    )
+    with pacsv.open_csv(path, read_options=pacsv.ReadOptions(block_size=block_size),
+                        convert_options=convert) as reader:
+        for batch in reader:
+            if not batch.num_rows:
+                continue
+            location = batch.column(columns["location"])
+            status = pc.utf8_lower(pc.utf8_trim_whitespace(batch.column(columns["status"])))
+            down = pc.fill_null(pc.is_in(status, value_set=pa.array(DOWN_STATUSES)), False)
+            totals.add(_epoch_seconds(batch.column(columns["timestamp"])), location,
+                       down.to_numpy(zero_copy_only=False),
+                       batch.column(columns["response_ms"]).to_numpy(zero_copy_only=False))
+
+
+def save_stats(stats, path=None):
+    """Merge ``stats`` into the saved table, replacing the months it covers."""
+    path = path or SITE24X7_PATH
+    saved = load_stats(path)
+    if len(saved):
+        saved = saved[~saved[store.MONTH_COLUMN].isin(stats[store.MONTH_COLUMN])]
+        stats = pd.concat([saved, stats], ignore_index=True)
+    stats = stats.sort_values([store.MONTH_COLUMN, schema.COUNTRY], ignore_index=True)
+    fileio.atomic_write(path, lambda tmp: stats.to_parquet(tmp, index=False))
+    return stats
+
+
+def load_stats(path=None):
+    """Saved uptime/percentile rows (empty if none), cached by mtime."""
+    path = path or SITE24X7_PATH
+    try:
+        mtime = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return pd.DataFrame()
+    return cache.versioned(("site24x7", str(path)), mtime, lambda: pd.read_parquet(path))
+
+
+def month_stats(month=None, path=None):
+    """Rows for ``month`` (default: latest ingested) and the month before, as (current, previous)."""
+    stats = load_stats(path)
+    if stats.empty:
+        return stats, None
+    months = sorted(stats[store.MONTH_COLUMN].unique())
+    month = month or months[-1]
+    earlier = [m for m in months if m < month]
+    current = stats[stats[store.MONTH_COLUMN] == month].set_index(schema.COUNTRY)
+    previous = stats[stats[store.MONTH_COLUMN] == earlier[-1]].set_index(schema.COUNTRY) if earlier else None
+    return current, previous
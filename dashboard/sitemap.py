@@ -0,0 +1,180 @@
+"""Sitemap snapshots per month and month-over-month page diffs.
+
+ingest() streams a sitemap or sitemap index (local path or URL, plain or
+gzip) with ElementTree.iterparse, following nested indexes and clearing
+each element once read, so memory stays flat however many URLs there are.
+Each month's URL set is saved to store/sitemap/YYYY_MM.parquet sorted by a
+64-bit URL hash, alongside lastmod and locale. diff() compares two months
+with sorted-array set operations on those hashes.
+"""
+import gzip
+import hashlib
+import io
+import urllib.request
+import xml.etree.ElementTree as ET
+from collections import deque, namedtuple
+from pathlib import Path
+from urllib.parse import urljoin
+
+import numpy as np
+import pandas as pd
+
+from dashboard import cache, fileio, seo, store
+
+SITEMAP_DIR = store.STORE_DIR / "sitemap"
+NS = "{http://www.sitemaps.org/schemas/sitemap/0.9}"
+TIMEOUT = 30
+
+# Locale regions that differ from the dashboard's country labels
+COUNTRY_ALIASES = {"GB": "UK"}
+
+Diff = namedtuple("Diff", "added removed changed unchanged")
+
+
+def url_hash(url):
+    return int.from_bytes(hashlib.blake2b(url.encode(), digest_size=8).digest(), "little")
+
+
+def _open(source):
+    """Binary stream for a path or URL, transparently gunzipped."""
+    if "://" in str(source):
+        request = urllib.request.Request(str(source), headers={"User-Agent": "sensormatic-sitemap-ingester"})
+        raw = urllib.request.urlopen(request, timeout=TIMEOUT)
+    else:
+        raw = open(source, "rb")
+    stream = io.BufferedReader(raw) if not hasattr(raw, "peek") else raw
+    if stream.peek(2)[:2] == b"\x1f\x8b":
+        return gzip.GzipFile(fileobj=stream)
+    return stream
+
+
+def iter_urls(source):
+    """Yield (loc, lastmod) for every page, following nested sitemap indexes."""
+    queue, seen = deque([str(source)]), set()
+    while queue:
+        current = queue.popleft()
+        if current in seen:
+            continue
+        seen.add(current)
+        with _open(current) as fh:
+            events = ET.iterparse(fh, events=("start", "end"))
+            _, root = next(events)
+            for event, elem in events:
+                if event != "end":
+                    continue
+                if elem.tag == f"{NS}url":
+                    loc = elem.findtext(f"{NS}loc")
+                    if loc:
+                        yield loc.strip(), (elem.findtext(f"{NS}lastmod") or "").strip()
+                elif elem.tag == f"{NS}sitemap":
+                    loc = elem.findtext(f"{NS}loc")
+                    if loc:
+                        nested = loc.strip()
+                        if "://" not in nested:
+                            nested = urljoin(current, nested) if "://" in current else str(Path(current).parent / nested)
+                        queue.append(nested)
+                else:
+                    continue
+                # Detach what has been read: clearing only the element would
+                # leave an empty child per URL on the root
+                root.clear()
+
+
+def snapshot_path(month, sitemap_dir=None):
+    return Path(sitemap_dir or SITEMAP_DIR) / f"{month}.parquet"
+
+
+def ingest(source, month, sitemap_dir=None):
+    """Stream ``source`` into the month's snapshot; returns its URL count."""
+    urls, lastmods = [], []
+    for loc, lastmod in iter_urls(source):
+        urls.append(loc)
+        lastmods.append(lastmod)
+    df = pd.DataFrame({
+        "hash": np.fromiter((url_hash(u) for u in urls), dtype=np.uint64, count=len(urls)),
+        "url": urls,
+        "lastmod": lastmods,
+        "locale": pd.Categorical([seo.page_locale(u) for u in urls]),
+    })
+    df = df.drop_duplicates("hash").sort_values("hash", ignore_index=True)
+    fileio.atomic_write(snapshot_path(month, sitemap_dir), lambda tmp: df.to_parquet(tmp, index=False))
+    return len(df)
+
+
+def months(sitemap_dir=None):
+    root = Path(sitemap_dir or SITEMAP_DIR)
+    return sorted(p.stem for p in root.glob("*.parquet")) if root.is_dir() else []
+
+
+def read_snapshot(month, columns=None, sitemap_dir=None):
+    """One month's snapshot (sorted by hash); empty frame if none."""
+    path = snapshot_path(month, sitemap_dir)
+    if not path.exists():
+        return pd.DataFrame(columns=columns or ["hash", "url", "lastmod", "locale"])
+    return pd.read_parquet(path, columns=columns)
+
+
+def _diff(old_month, new_month, sitemap_dir):
+    old = read_snapshot(old_month, ["hash", "lastmod"], sitemap_dir)
+    new = read_snapshot(new_month, ["hash", "lastmod"], sitemap_dir)
+    old_hash, new_hash = old["hash"].to_numpy(np.uint64), new["hash"].to_numpy(np.uint64)
+    common, old_idx, new_idx = np.intersect1d(old_hash, new_hash, assume_unique=True, return_indices=True)
+    changed = old["lastmod"].to_numpy()[old_idx] != new["lastmod"].to_numpy()[new_idx]
+    return Diff(
+        added=np.setdiff1d(new_hash, common, assume_unique=True),
+        removed=np.setdiff1d(old_hash, common, assume_unique=True),
+        changed=common[changed],
+        unchanged=common[~changed],
+    )
+
+
+def diff(old_month, new_month, sitemap_dir=None):
+    """Hashes added, removed, changed (lastmod differs) and unchanged, cached by mtime."""
+    key = ("sitemap", old_month, new_month, str(sitemap_dir or SITEMAP_DIR))
+    paths = (snapshot_path(old_month, sitemap_dir), snapshot_path(new_month, sitemap_dir))
+    mtimes = tuple(p.stat().st_mtime_ns if p.exists() else None for p in paths)
+    return cache.versioned(key, mtimes, lambda: _diff(old_month, new_month, sitemap_dir))
+
+
+def month_diff(month, sitemap_dir=None):
+    """(previous snapshot month, Diff) for ``month``, or None without an earlier snapshot."""
+    earlier = [m for m in months(sitemap_dir) if m < month]
+    if not earlier or not snapshot_path(month, sitemap_dir).exists():
+        return None
+    return earlier[-1], diff(earlier[-1], month, sitemap_dir)
+
+
+def urls_for(month, hashes, sitemap_dir=None):
+    """URLs of ``hashes`` in one month's snapshot (binary search on the sorted hashes)."""
+    snap = read_snapshot(month, ["hash", "url"], sitemap_dir)
+    keys = snap["hash"].to_numpy(np.uint64)
+    if len(keys) == 0:
+        return []
+    pos = np.searchsorted(keys, hashes)
+    pos = pos[(pos < len(keys)) & (keys[np.minimum(pos, len(keys) - 1)] == hashes)]
+    return snap["url"].to_numpy()[pos].tolist()
+
+
+def locale_country(locale):
+    """Dashboard country label for a locale ("en-us" -> "US"), or None.
+
+    Only the region part names a country: a bare language ("en", "ja",
+    "sv") has none, and "sv" is not El Salvador.
+    """
+    if not locale or locale == "default":
+        return None
+    parts = locale.replace("_", "-").split("-")
+    if len(parts) < 2:
+        return None
+    code = parts[-1].upper()
+    if not (len(code) == 2 and code.isalpha()):
+        # Regions like es-419 (Latin America) are not countries
+        return None
+    return COUNTRY_ALIASES.get(code, code)
+
+
+def pages_by_country(month, sitemap_dir=None):
+    """Sitemap page count per country for one month."""
+    snap = read_snapshot(month, ["locale"], sitemap_dir)
+    countries = snap["locale"].astype(str).map(locale_country)
+    return countries.value_counts().rename_axis("Country").rename("Sitemap Pages").reset_index()
@@ -0,0 +1,136 @@
+"""Columnar store compacted from the data/YYYY_MM CSV folders.
+
+Each dataset becomes one Parquet file holding every month, with a ``month``
+column and one row group per month. Columns keep their dashboard.schema
+dtypes (label columns are categoricals), and readers push column and month
+selections down to Parquet so a multi-month trend only decodes what it
+needs. The file's schema metadata records the (mtime, size) of every CSV it
+was built from, which is how staleness is detected.
+"""
+import json
+import os
+import threading
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from dashboard import data, fileio, schema
+
+STORE_DIR = Path(os.environ.get("SENSORMATIC_STORE_DIR", data.DATA_DIR.parent / "store"))
+
+MONTH_COLUMN = "month"
+SOURCES_KEY = b"sensormatic.sources"
+
+# Held across ensure_dataset's staleness check and rebuild, so two threads
+# never compact the same dataset at once
+_lock = threading.RLock()
+_sources = {}  # parquet path -> (mtime_ns, {month: [mtime_ns, size]})
+
+
+def store_path(dataset, store_dir=None):
+    if dataset not in data.DATASETS:
+        raise KeyError(f"Unknown dataset: {dataset!r}")
+    return Path(store_dir or STORE_DIR) / f"{dataset}.parquet"
+
+
+def source_fingerprints(dataset, data_dir=None):
+    """{month: [mtime_ns, size]} of the dataset's CSV in every month folder."""
+    sources = {}
+    for month in data.available_months(data_dir):
+        try:
+            sources[month] = list(data.fingerprint(data.dataset_path(month, dataset, data_dir)))
+        except FileNotFoundError:
+            continue
+    return sources
+
+
+def build_dataset(dataset, data_dir=None, store_dir=None):
+    """Compact every month of one dataset into its Parquet file.
+
+    Returns the number of rows written. The file is replaced atomically so
+    readers never see a partial write.
+    """
+    with _lock:
+        sources = source_fingerprints(dataset, data_dir)
+        frames = []
+        for month in sources:
+            df = schema.read_csv(data.dataset_path(month, dataset, data_dir), dataset)
+            df.insert(0, MONTH_COLUMN, month)
+            frames.append(df)
+        out = store_path(dataset, store_dir)
+        if not frames:
+            if out.exists():
+                out.unlink()
+            return 0
+
+        combined = schema.apply_dtypes(pd.concat(frames, ignore_index=True), dataset)
+        combined[MONTH_COLUMN] = combined[MONTH_COLUMN].astype("category")
+        table = pa.Table.from_pandas(combined, preserve_index=False)
+        table = table.replace_schema_metadata({**(table.schema.metadata or {}),
+                                               SOURCES_KEY: json.dumps(sources).encode()})
+
+        def write(tmp):
+            with pq.ParquetWriter(tmp, table.schema) as writer:
+                # One row group per month lets readers skip months by statistics
+                offset = 0
+                for frame in frames:
+                    writer.write_table(table.slice(offset, len(frame)))
+                    offset += len(frame)
+
+        fileio.atomic_write(out, write)
+        return len(combined)
+
+
+def build_store(datasets=None, data_dir=None, store_dir=None):
+    """Rebuild the Parquet files for ``datasets`` (all by default)."""
+    return {
+        dataset: build_dataset(dataset, data_dir, store_dir)
+        for dataset in (datasets or data.DATASETS)
+    }
+
+
+def built_from(dataset, store_dir=None):
+    """{month: [mtime_ns, size]} recorded in the Parquet file, or None if it is missing."""
+    out = store_path(dataset, store_dir)
+    try:
+        mtime = out.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+    cached = _sources.get(out)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    metadata = pq.read_schema(out).metadata or {}
+    sources = json.loads(metadata[SOURCES_KEY]) if SOURCES_KEY in metadata else {}
+    _sources[out] = (mtime, sources)
+    return sources
+
+
+def is_stale(dataset, data_dir=None, store_dir=None):
+    """True if the Parquet file is missing or its source CSVs were added, removed or changed.
+
+    Months copied in with old mtimes are caught too, since the comparison is
+    against the fingerprints recorded at build time, not the file's own mtime.
+    """
+    sources = built_from(dataset, store_dir)
+    return sources is None or sources != source_fingerprints(dataset, data_dir)
+
+
+def ensure_dataset(dataset, data_dir=None, store_dir=None):
+    """Rebuild one dataset's Parquet file if it is stale."""
+    with _lock:
+        if is_stale(dataset, data_dir, store_dir):
+            build_dataset(dataset, data_dir, store_dir)
+
+
+def read_store(dataset, columns=None, months=None, store_dir=None):
+    """Read one dataset from the store, limited to ``columns`` and ``months``.
+
+    The ``month`` column is always included. Month filters are evaluated
+    against row-group statistics, so unselected months are never decoded.
+    """
+    if columns is not None:
+        columns = [MONTH_COLUMN] + [c for c in columns if c != MONTH_COLUMN]
+    filters = [(MONTH_COLUMN, "in", list(months))] if months is not None else None
+    return pd.read_parquet(store_path(dataset, store_dir), columns=columns, filters=filters)
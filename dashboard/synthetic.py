@@ -0,0 +1,109 @@
+"""Seeded synthetic data/YYYY_MM trees for load and scaling tests.
+
+Every dataset in dashboard.schema is generated column by column with NumPy:
+label columns cycle through a pool of configurable size (so the same
+entities recur every month), numeric columns are drawn from plausible
+distributions clipped to the schema range. CSVs are written with
+pyarrow's CSV writer, which keeps multi-million-row trees to seconds.
+"""
+import itertools
+import string
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+
+from dashboard import data, schema
+
+# Real labels first; pools are padded with numbered labels beyond these
+KNOWN_LABELS = {
+    schema.COUNTRY: ["US", "UK", "IN", "DE", "FR", "CA", "AU", "JP", "BR", "MX", "ES", "IT", "NL", "SE", "CN", "KR"],
+    schema.BROWSER: ["Chrome", "Firefox", "Safari", "Edge", "Opera", "Samsung Internet", "Chrome Android", "Safari iOS"],
+    schema.ERROR_TYPE: ["Broken Links", "404 Errors", "500 Errors", "SEO Issues", "Form Failures", "Coveo Anomalies"],
+    schema.SUITE: ["Smoke", "Regression", "E2E"],
+    schema.FORM_TYPE: ["Contact", "Demo", "Newsletter"],
+    schema.METRIC: ["Queries Tested", "Filters Tested", "Relevance Score"],
+    schema.LEAD_TYPE: ["Sales", "Support"],
+}
+
+DEFAULT_CARDINALITY = {schema.COUNTRY: 40, schema.BROWSER: 8, schema.ERROR_TYPE: 6}
+
+
+def label_pool(column, size):
+    """``size`` distinct labels for a label column, real ones first."""
+    known = KNOWN_LABELS.get(column, [])
+    if column == schema.COUNTRY:
+        # Two-letter codes, then numbered locales once all 676 are used
+        codes = known + [a + b for a, b in itertools.product(string.ascii_uppercase, repeat=2)
+                         if a + b not in known]
+        pool = codes[:size] + [f"{codes[i % len(codes)]}-{i // len(codes)}" for i in range(len(codes), size)]
+        return np.array(pool[:size])
+    return np.array(known[:size] + [f"{column} {i + 1}" for i in range(len(known), size)])
+
+
+def _numeric(rng, col, n):
+    """Plausible values for one numeric column, clipped to its schema range."""
+    name = col.name
+    if name == schema.UPTIME:
+        values = 100 - rng.exponential(0.25, n)
+    elif name == schema.PAGE_LOAD_TIME:
+        values = rng.lognormal(0.4, 0.3, n)
+    elif col.max == 100:
+        values = 100 * rng.beta(8, 1.5, n)
+    elif col.dtype.startswith("int"):
+        values = rng.poisson(50, n)
+    else:
+        values = rng.gamma(2.0, 5.0, n)
+    lo = -np.inf if col.min is None else col.min
+    hi = np.inf if col.max is None else col.max
+    values = np.clip(values, lo, hi)
+    return values.astype(col.dtype) if col.dtype.startswith("int") else np.round(values, 2)
+
+
+def generate_dataset(dataset, rows, month, rng, cardinality=None):
+    """One month of ``dataset`` with ``rows`` rows, as a pyarrow Table."""
+    cardinality = {**DEFAULT_CARDINALITY, **(cardinality or {})}
+    columns = {}
+    for col in schema.SCHEMAS[dataset]:
+        if col.dtype != "category":
+            columns[col.name] = _numeric(rng, col, rows)
+        elif col.categories is not None:
+            columns[col.name] = np.array(col.categories)[np.arange(rows) % len(col.categories)]
+        elif dataset == "release_metrics" and col.name == schema.MONTH:
+            # Release history rows: this month, then the months before it
+            period = pd.Period(month.replace("_", "-"), freq="M")
+            offsets = np.arange(rows) % 12
+            columns[col.name] = np.array([(period - int(k)).strftime("%b") for k in range(12)])[offsets]
+        else:
+            pool = label_pool(col.name, cardinality.get(col.name, max(rows, 1)))
+            columns[col.name] = pool[np.arange(rows) % len(pool)]
+    return pa.table(columns)
+
+
+def month_range(start, months):
+    """``months`` consecutive "YYYY_MM" keys starting at ``start``."""
+    periods = pd.period_range(start.replace("_", "-"), periods=months, freq="M")
+    return [p.strftime("%Y_%m") for p in periods]
+
+
+def generate_tree(out_dir, months=12, rows=1000, start="2024_01", cardinality=None, seed=0, datasets=None):
+    """Write a synthetic data/YYYY_MM tree; returns the total rows written.
+
+    ``rows`` is either one row count for every dataset or a
+    {dataset: rows} mapping. ``cardinality`` maps a label column name
+    (e.g. "Country") to its number of distinct values.
+    """
+    rng = np.random.default_rng(seed)
+    total = 0
+    for month in month_range(start, months):
+        month_dir = Path(out_dir) / month
+        month_dir.mkdir(parents=True, exist_ok=True)
+        for dataset in datasets or data.DATASETS:
+            n = rows.get(dataset, 0) if isinstance(rows, dict) else rows
+            table = generate_dataset(dataset, n, month, rng, cardinality)
+            pacsv.write_csv(table, month_dir / data.DATASETS[dataset],
+                            pacsv.WriteOptions(quoting_style="needed"))
+            total += n
+    return total
@@ -0,0 +1,70 @@
+"""Paginated table view for large frames.
+
+st.dataframe serializes the whole frame on every rerun. paged_table()
+keeps the frame on the server, filters and sorts it there, and sends only
+the current page of rows. The filtered, sorted row order is kept in
+session state, so paging through the same view does not sort again.
+"""
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+PAGE_SIZE = 50
+
+
+def filter_positions(df, query):
+    """Row positions where any text column contains ``query`` (case-insensitive)."""
+    if not query:
+        return np.arange(len(df))
+    query = query.lower()
+    mask = np.zeros(len(df), dtype=bool)
+    for name in df.columns:
+        values = df[name]
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            # Match each label once, then select rows by category code
+            labels = values.cat.categories.astype(str).str.lower().str.contains(query, regex=False)
+            mask |= np.isin(values.cat.codes.to_numpy(), np.flatnonzero(labels))
+        elif pd.api.types.is_string_dtype(values) or values.dtype == object:
+            mask |= values.astype(str).str.lower().str.contains(query, regex=False).to_numpy()
+    return np.flatnonzero(mask)
+
+
+def sort_positions(df, positions, column, ascending=True):
+    """``positions`` reordered by ``column`` (stable, missing values last)."""
+    if column is None:
+        return positions
+    values = df[column].iloc[positions].reset_index(drop=True)
+    order = values.sort_values(ascending=ascending, kind="stable", na_position="last").index.to_numpy()
+    return positions[order]
+
+
+def paged_table(df, key, page_size=PAGE_SIZE):
+    """Render ``df`` one page at a time with server-side filter and sort.
+
+    Frames that fit on one page are shown with a plain st.dataframe.
+    """
+    if len(df) <= page_size:
+        st.dataframe(df)
+        return
+
+    col1, col2, col3 = st.columns([3, 2, 1])
+    query = col1.text_input("Filter", key=f"{key}-filter", placeholder="Search text columns")
+    column = col2.selectbox("Sort by", list(df.columns), index=None, key=f"{key}-sort")
+    descending = col3.toggle("Descending", key=f"{key}-desc", disabled=column is None)
+
+    view = (query, column, descending)
+    cached = st.session_state.get(f"{key}-view")
+    if cached is not None and cached[0] is df and cached[1] == view:
+        positions = cached[2]
+    else:
+        positions = sort_positions(df, filter_positions(df, query), column, not descending)
+        st.session_state[f"{key}-view"] = (df, view, positions)
+
+    total = len(positions)
+    pages = max(1, -(-total // page_size))
+    page = st.number_input(f"Page (of {pages:,})", min_value=1, max_value=pages, value=1, step=1,
+                           key=f"{key}-page-{hash(view)}")
+    start = (page - 1) * page_size
+    st.dataframe(df.iloc[positions[start:start + page_size]])
+    shown = f"Rows {start + 1:,}–{min(start + page_size, total):,} of {total:,}" if total else "No matching rows"
+    st.caption(shown + (f" (filtered from {len(df):,})" if total != len(df) else ""))
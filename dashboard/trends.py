@@ -0,0 +1,99 @@
+"""Multi-month trends with period-over-period deltas.
+
+Datasets are stacked across months with a single read of the columnar
+store, then every delta is computed with vectorized merges and grouped
+rolling windows, so cost grows with rows rather than with the number of
+months.
+"""
+import pandas as pd
+
+from dashboard import cache, profiler, store
+
+MONTH = store.MONTH_COLUMN
+
+
+def stack(dataset, columns=None, months=None):
+    """All months of one dataset as a single frame with a ``month`` column."""
+    store.ensure_dataset(dataset)
+    df = store.read_store(dataset, columns=columns, months=months)
+    df[MONTH] = df[MONTH].astype(str)
+    return df
+
+
+def month_index(months):
+    """Months since year 0 for "YYYY_MM" keys, so gaps and YoY line up."""
+    months = pd.Series(months, dtype=str)
+    return months.str[:4].astype(int) * 12 + months.str[5:7].astype(int) - 1
+
+
+def aggregate(df, value, key=None, agg="mean"):
+    """One ``value`` per (key, month), aggregated with ``agg``."""
+    keys = [MONTH] if key is None else [key, MONTH]
+    out = df.groupby(keys, observed=True, sort=False)[value].agg(agg).reset_index()
+    out["_period"] = month_index(out[MONTH]).to_numpy()
+    return out.sort_values(([key] if key else []) + ["_period"], ignore_index=True)
+
+
+def add_deltas(df, value, key=None, periods=1, suffix="mom"):
+    """Add delta and percent change versus ``periods`` months earlier.
+
+    ``periods=1`` gives month-over-month, ``periods=12`` year-over-year.
+    Months with no earlier value get NaN.
+    """
+    keys = ([key] if key else []) + ["_period"]
+    prev = df[keys + [value]].copy()
+    prev["_period"] += periods
+    prev = prev.rename(columns={value: "_prev"})
+    out = df.merge(prev, on=keys, how="left")
+    out[f"delta_{suffix}"] = out[value] - out["_prev"]
+    out[f"pct_{suffix}"] = out[f"delta_{suffix}"] / out["_prev"] * 100
+    return out.drop(columns="_prev")
+
+
+def add_rolling_mean(df, value, key=None, window=3):
+    """Rolling mean of ``value`` over the last ``window`` rows of each entity."""
+    if key is None:
+        rolled = df[value].rolling(window, min_periods=1).mean()
+    else:
+        rolled = (df.groupby(key, observed=True, sort=False)[value]
+                  .rolling(window, min_periods=1).mean()
+                  .reset_index(level=0, drop=True))
+    df[f"rolling_{window}"] = rolled
+    return df
+
+
+@profiler.traced("data")
+def trend(dataset, value, key=None, agg="mean", months=None, window=3):
+    """Per-month ``value`` for each ``key`` entity with MoM/YoY deltas.
+
+    Returns columns: key (if any), month, value, delta_mom, pct_mom,
+    delta_yoy, pct_yoy and rolling_<window>. Results are cached per store
+    file version and shared between sessions; do not mutate them.
+    """
+    store.ensure_dataset(dataset)
+    source = store.store_path(dataset).stat()
+    cache_key = ("trend", dataset, value, key, agg, tuple(months or ()), window,
+                 source.st_mtime_ns, source.st_size)
+    df = cache.shared.get(cache_key)
+    if df is not None:
+        return df
+    columns = [value] if key is None else [key, value]
+    df = aggregate(stack(dataset, columns, months), value, key, agg)
+    df = add_deltas(df, value, key, periods=1, suffix="mom")
+    df = add_deltas(df, value, key, periods=12, suffix="yoy")
+    df = add_rolling_mean(df, value, key, window)
+    return cache.shared.put(cache_key, df.drop(columns="_period"), persist=True)
+
+
+@profiler.traced("data")
+def metric_delta(dataset, value, month, agg="mean"):
+    """(value, MoM delta) of a dataset-wide aggregate for st.metric.
+
+    The delta is None when the previous month has no data.
+    """
+    df = trend(dataset, value, agg=agg)
+    row = df[df[MONTH] == month]
+    if row.empty:
+        return None, None
+    current, delta = float(row[value].iloc[0]), row["delta_mom"].iloc[0]
+    return current, None if pd.isna(delta) else float(delta)
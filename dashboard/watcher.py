@@ -0,0 +1,134 @@
+"""Background poller that refreshes only the month datasets that changed.
+
+The watcher keeps a manifest of every dataset CSV under the data folder
+(mtime, size and content hash). When a file is added, edited or removed it
+re-ingests just that dataset into the columnar store and drops the matching
+(month, dataset) cache entries, so open sessions see new numbers on their
+next rerun without a full cache flush.
+"""
+import hashlib
+import logging
+import threading
+from pathlib import Path
+
+from dashboard import cube, data, rollup, store
+
+logger = logging.getLogger(__name__)
+
+POLL_INTERVAL = 5.0
+
+_watcher = None
+_watcher_lock = threading.Lock()
+
+
+def _file_hash(path):
+    digest = hashlib.sha1()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def scan(data_dir=None, previous=None):
+    """Build a manifest {(month, dataset): (mtime_ns, size, sha1)}.
+
+    Files whose (mtime, size) match ``previous`` reuse its hash instead of
+    being read again.
+    """
+    previous = previous or {}
+    manifest = {}
+    for month in data.available_months(data_dir):
+        for dataset in data.DATASETS:
+            path = data.dataset_path(month, dataset, data_dir)
+            try:
+                fp = data.fingerprint(path)
+            except FileNotFoundError:
+                continue
+            old = previous.get((month, dataset))
+            if old is not None and old[:2] == fp:
+                manifest[(month, dataset)] = old
+            else:
+                manifest[(month, dataset)] = fp + (_file_hash(path),)
+    return manifest
+
+
+def changed_keys(old, new):
+    """(month, dataset) keys added, removed or whose content hash changed."""
+    keys = set(old) ^ set(new)
+    keys.update(k for k in set(old) & set(new) if old[k][2] != new[k][2])
+    return keys
+
+
+class DataWatcher(threading.Thread):
+    """Daemon thread polling the data folder every ``interval`` seconds."""
+
+    def __init__(self, data_dir=None, store_dir=None, interval=POLL_INTERVAL, rebuild_store=None,
+                 on_change=None):
+        super().__init__(name="sensormatic-data-watcher", daemon=True)
+        self.data_dir = data_dir
+        self.store_dir = store_dir
+        self.interval = interval
+        if rebuild_store is None:
+            rebuild_store = Path(store_dir or store.STORE_DIR).is_dir()
+        self.rebuild_store = rebuild_store
+        self.on_change = on_change
+        # Filled by the first scan in run(), so starting the thread from a
+        # Streamlit rerun does not hash every CSV before the page renders
+        self.manifest = None
+        self._stop_event = threading.Event()
+
+    def poll(self):
+        """Rescan once and refresh what changed; returns the changed keys.
+
+        The first call only records the baseline manifest.
+        """
+        if self.manifest is None:
+            self.manifest = scan(self.data_dir)
+            return set()
+        manifest = scan(self.data_dir, self.manifest)
+        keys = changed_keys(self.manifest, manifest)
+        self.manifest = manifest
+        if not keys:
+            return keys
+
+        datasets = sorted({dataset for _, dataset in keys})
+        logger.info("Data changed for %s", sorted(keys))
+        if self.rebuild_store:
+            store.build_store(datasets, self.data_dir, self.store_dir)
+            if set(datasets) & set(rollup.SOURCES):
+                rollup.build_kpis(self.store_dir)
+            if set(datasets) & set(cube.SOURCES):
+                cube.build_cube(self.store_dir)
+        for month, dataset in keys:
+            data.invalidate(month, dataset)
+        if self.on_change is not None:
+            self.on_change(keys)
+        return keys
+
+    def run(self):
+        try:
+            self.poll()
+        except Exception:
+            logger.exception("Data watcher initial scan failed")
+        while not self._stop_event.wait(self.interval):
+            try:
+                self.poll()
+            except Exception:
+                logger.exception("Data watcher poll failed")
+
+    def stop(self):
+        self._stop_event.set()
+
+
+def ensure_watcher(**kwargs):
+    """Start the process-wide watcher once and return it.
+
+    Streamlit reruns the dashboard script on every interaction; only the
+    first call in the server process starts the thread.
+    """
+    global _watcher
+    with _watcher_lock:
+        if _watcher is None or not _watcher.is_alive():
+            _watcher = DataWatcher(**kwargs)
+            _watcher.start()
+        return _watcher
@@ -1,7 +1,6 @@
 import streamlit as st
-import pandas as pd
-import numpy as np
-import plotly.express as px
+from dashboard import figures
+from dashboard.data import LIGHTHOUSE_MISSING, latest_month, load_dataset
 
 # Set dark theme and page config
 st.set_page_config(page_title="Sensormatic Digital Dashboard", layout="wide")
@@ -17,6 +16,12 @@ st.markdown(
     unsafe_allow_html=True
 )
 
+# Latest monthly data folder
+month = latest_month()
+if month is None:
+    st.info("No monthly data yet: add a YYYY_MM folder under SensormaticDashboard/data/ (see scripts/excel_to_csv_converter.py).")
+    st.stop()
+
 # Sidebar navigation
 section = st.sidebar.radio("Select Dashboard Section", [
     "Functional Coverage Metrics",
@@ -27,141 +32,105 @@ section = st.sidebar.radio("Select Dashboard Section", [
     "Release & Deployment Metrics"
 ])
 
-# Mock data generators
+# Section data loaders (SensormaticDashboard/data/YYYY_MM)
 def generate_country_coverage():
-    return pd.DataFrame({
-        'Country': ['US', 'UK', 'IN', 'DE', 'FR'],
-        '% Pages Tested': [95, 90, 85, 80, 75]
-    })
+    return load_dataset(month, "country_coverage")
 
 def generate_form_coverage():
-    return pd.DataFrame({
-        'Form Type': ['Contact', 'Demo', 'Newsletter'],
-        '% Forms Tested': [98, 92, 88]
-    })
+    return load_dataset(month, "form_coverage")
 
 def generate_coveo_coverage():
-    return pd.DataFrame({
-        'Metric': ['Queries Tested', 'Filters Tested', 'Relevance Score'],
-        'Coverage %': [90, 85, 80]
-    })
+    return load_dataset(month, "coveo_coverage")
 
 def generate_automation_metrics():
-    return pd.DataFrame({
-        'Suite': ['Smoke', 'Regression', 'E2E'],
-        'Test Cases': [50, 120, 80],
-        'Pass Rate %': [98, 92, 95],
-        'Execution Time (min)': [5, 20, 15]
-    })
+    return load_dataset(month, "automation_metrics")
 
 def generate_browser_matrix():
-    return pd.DataFrame({
-        'Browser': ['Chrome', 'Firefox', 'Safari', 'Edge'],
-        'Languages Covered': [5, 4, 3, 2]
-    })
+    return load_dataset(month, "browser_matrix")
 
 def generate_error_metrics():
-    return pd.DataFrame({
-        'Error Type': ['Broken Links', '404 Errors', '500 Errors', 'SEO Issues', 'Form Failures', 'Coveo Anomalies'],
-        'Count': [12, 5, 2, 20, 8, 3]
-    })
+    return load_dataset(month, "error_metrics")
 
 def generate_performance_metrics():
-    return pd.DataFrame({
-        'Country': ['US', 'UK', 'IN', 'DE', 'FR'],
-        'Page Load Time (s)': [1.2, 1.5, 2.0, 1.8, 1.6],
-        'Uptime %': [99.9, 99.8, 99.7, 99.6, 99.5]
-    })
+    return load_dataset(month, "performance_metrics")
 
 def generate_lighthouse_scores():
-    return pd.DataFrame({
-        'Metric': ['Accessibility', 'Performance', 'SEO'],
-        'Score': [90, 85, 88]
-    })
+    return load_dataset(month, "lighthouse_scores")
 
 def generate_sentiment_data():
-    return pd.DataFrame({
-        'Sentiment': ['Positive', 'Neutral', 'Negative'],
-        'Count': [120, 30, 10]
-    })
+    return load_dataset(month, "sentiment_data")
 
 def generate_lead_segmentation():
-    return pd.DataFrame({
-        'Lead Type': ['Sales', 'Support'],
-        'Count': [80, 40]
-    })
+    return load_dataset(month, "lead_segmentation")
 
 def generate_release_metrics():
-    return pd.DataFrame({
-        'Month': ['Jul', 'Aug', 'Sep'],
-        'Deployments': [5, 6, 4],
-        'Post-Deployment Issues': [2, 1, 3],
-        'Time to Resolve (hrs)': [12, 8, 10],
-        'QA Sign-off Time (hrs)': [4, 3, 5]
-    })
+    return load_dataset(month, "release_metrics")
 
 # Section rendering
 if section == "Functional Coverage Metrics":
     st.subheader("📍 Pages Tested by Country")
     df = generate_country_coverage()
     st.dataframe(df)
-    st.plotly_chart(px.bar(df, x='Country', y='% Pages Tested', title='Pages Tested by Country'))
+    st.plotly_chart(figures.bar(df, x='Country', y='% Pages Tested', title='Pages Tested by Country'))
 
     st.subheader("📨 Forms Tested")
     df = generate_form_coverage()
     st.dataframe(df)
-    st.plotly_chart(px.bar(df, x='Form Type', y='% Forms Tested', title='Forms Tested'))
+    st.plotly_chart(figures.bar(df, x='Form Type', y='% Forms Tested', title='Forms Tested'))
 
     st.subheader("🔍 Coveo Search Coverage")
     df = generate_coveo_coverage()
     st.dataframe(df)
-    st.plotly_chart(px.bar(df, x='Metric', y='Coverage %', title='Coveo Coverage'))
+    st.plotly_chart(figures.bar(df, x='Metric', y='Coverage %', title='Coveo Coverage'))
 
 elif section == "Automation Metrics":
     st.subheader("🤖 Test Automation Summary")
     df = generate_automation_metrics()
     st.dataframe(df)
-    st.plotly_chart(px.bar(df, x='Suite', y='Pass Rate %', title='Pass Rate by Suite'))
+    st.plotly_chart(figures.bar(df, x='Suite', y='Pass Rate %', title='Pass Rate by Suite'))
 
     st.subheader("🌐 Browser/Language Coverage")
     df = generate_browser_matrix()
     st.dataframe(df)
-    st.plotly_chart(px.bar(df, x='Browser', y='Languages Covered', title='Browser Language Coverage'))
+    st.plotly_chart(figures.bar(df, x='Browser', y='Languages Covered', title='Browser Language Coverage'))
 
 elif section == "Error & Defect Metrics":
     st.subheader("🚨 Error Summary")
     df = generate_error_metrics()
     st.dataframe(df)
-    st.plotly_chart(px.pie(df, names='Error Type', values='Count', title='Error Type Distribution'))
+    st.plotly_chart(figures.pie(df, names='Error Type', values='Count', title='Error Type Distribution'))
 
 elif section == "Performance & Uptime":
     st.subheader("📶 Site Performance by Country")
     df = generate_performance_metrics()
     st.dataframe(df)
-    st.plotly_chart(px.line(df, x='Country', y='Page Load Time (s)', title='Page Load Time by Country'))
+    st.plotly_chart(figures.line(df, x='Country', y='Page Load Time (s)', title='Page Load Time by Country'))
 
     st.subheader("📈 Lighthouse Scores")
     df = generate_lighthouse_scores()
-    st.dataframe(df)
-    st.plotly_chart(px.bar(df, x='Metric', y='Score', title='Lighthouse Scores'))
+    if df.empty:
+        st.info(LIGHTHOUSE_MISSING)
+    else:
+        st.dataframe(df)
+        st.plotly_chart(figures.bar(df, x='Metric', y='Score', title='Lighthouse Scores'))
 
 elif section == "User Experience & Sentiment":
     st.subheader("🧠 NLP Sentiment Analysis")
     df = generate_sentiment_data()
     st.dataframe(df)
-    st.plotly_chart(px.pie(df, names='Sentiment', values='Count', title='User Sentiment Distribution'))
+    st.plotly_chart(figures.pie(df, names='Sentiment', values='Count', title='User Sentiment Distribution'))
 
     st.subheader("📊 Lead Segmentation")
     df = generate_lead_segmentation()
     st.dataframe(df)
-    st.plotly_chart(px.bar(df, x='Lead Type', y='Count', title='Lead Segmentation'))
+    st.plotly_chart(figures.bar(df, x='Lead Type', y='Count', title='Lead Segmentation'))
 
 elif section == "Release & Deployment Metrics":
     st.subheader("🚀 Deployment Summary")
     df = generate_release_metrics()
     st.dataframe(df)
-    st.plotly_chart(px.line(df, x='Month', y=['Deployments', 'Post-Deployment Issues', 'QA Sign-off Time (hrs)'],
-                            title='Month-wise QA Metrics Trends'))
+    st.plotly_chart(figures.line(df, x='Month', y=['Deployments', 'Post-Deployment Issues', 'QA Sign-off Time (hrs)'],
+                                 title='Month-wise QA Metrics Trends'))
 
 st.markdown("---")
 st.caption("Sensormatic Digital Dashboard | Built with Streamlit | © Harsha")
@@ -1,7 +1,8 @@
 import streamlit as st
-import pandas as pd
-import plotly.express as px
 import os
+from dashboard import figures
+from dashboard.data import LIGHTHOUSE_MISSING, available_months, load_dataset, month_label
+from dashboard.watcher import ensure_watcher
 
 # Set page config
 st.set_page_config(page_title="Sensormatic Digital Dashboard", layout="wide")
@@ -10,8 +11,12 @@ st.set_page_config(page_title="Sensormatic Digital Dashboard", layout="wide")
 st.image("https://upload.wikimedia.org/wikipedia/commons/thumb/3/3e/Sensormatic_logo.svg/2560px-Sensormatic_logo.svg.png", use_container_width=True)
 
 # Sidebar month selector
-available_months = ["July", "August", "September"]
-selected_month = st.sidebar.selectbox("Select Month", available_months)
+ensure_watcher()
+months = available_months()
+if not months:
+    st.info("No monthly data yet: add a YYYY_MM folder under SensormaticDashboard/data/ (see scripts/excel_to_csv_converter.py).")
+    st.stop()
+selected_month = st.sidebar.selectbox("Select Month", months, index=len(months) - 1, format_func=month_label)
 
 # Sidebar section selector
 section = st.sidebar.radio("Select Dashboard Section", [
@@ -23,78 +28,39 @@ section = st.sidebar.radio("Select Dashboard Section", [
     "Release & Deployment Metrics"
 ])
 
-# Sample data generators for each section
+# Section data loaders (SensormaticDashboard/data/YYYY_MM)
 def generate_country_coverage():
-    return pd.DataFrame({
-        'Country': ['US', 'UK', 'IN', 'DE', 'FR'],
-        '% Pages Tested': [95, 90, 85, 80, 75]
-    })
+    return load_dataset(selected_month, "country_coverage")
 
 def generate_form_coverage():
-    return pd.DataFrame({
-        'Form Type': ['Contact', 'Demo', 'Newsletter'],
-        '% Forms Tested': [98, 92, 88]
-    })
+    return load_dataset(selected_month, "form_coverage")
 
 def generate_coveo_coverage():
-    return pd.DataFrame({
-        'Metric': ['Queries Tested', 'Filters Tested', 'Relevance Score'],
-        'Coverage %': [90, 85, 80]
-    })
+    return load_dataset(selected_month, "coveo_coverage")
 
 def generate_automation_metrics():
-    return pd.DataFrame({
-        'Suite': ['Smoke', 'Regression', 'E2E'],
-        'Test Cases': [50, 120, 80],
-        'Pass Rate %': [98, 92, 95],
-        'Execution Time (min)': [5, 20, 15]
-    })
+    return load_dataset(selected_month, "automation_metrics")
 
 def generate_browser_matrix():
-    return pd.DataFrame({
-        'Browser': ['Chrome', 'Firefox', 'Safari', 'Edge'],
-        'Languages Covered': [5, 4, 3, 2]
-    })
+    return load_dataset(selected_month, "browser_matrix")
 
 def generate_error_metrics():
-    return pd.DataFrame({
-        'Error Type': ['Broken Links', '404 Errors', '500 Errors', 'SEO Issues', 'Form Failures', 'Coveo Anomalies'],
-        'Count': [12, 5, 2, 20, 8, 3]
-    })
+    return load_dataset(selected_month, "error_metrics")
 
 def generate_performance_metrics():
-    return pd.DataFrame({
-        'Country': ['US', 'UK', 'IN', 'DE', 'FR'],
-        'Page Load Time (s)': [1.2, 1.5, 2.0, 1.8, 1.6],
-        'Uptime %': [99.9, 99.8, 99.7, 99.6, 99.5]
-    })
+    return load_dataset(selected_month, "performance_metrics")
 
 def generate_lighthouse_scores():
-    return pd.DataFrame({
-        'Metric': ['Accessibility', 'Performance', 'SEO'],
-        'Score': [90, 85, 88]
-    })
+    return load_dataset(selected_month, "lighthouse_scores")
 
 def generate_sentiment_data():
-    return pd.DataFrame({
-        'Sentiment': ['Positive', 'Neutral', 'Negative'],
-        'Count': [120, 30, 10]
-    })
+    return load_dataset(selected_month, "sentiment_data")
 
 def generate_lead_segmentation():
-    return pd.DataFrame({
-        'Lead Type': ['Sales', 'Support'],
-        'Count': [80, 40]
-    })
+    return load_dataset(selected_month, "lead_segmentation")
 
 def generate_release_metrics():
-    return pd.DataFrame({
-        'Month': ['July', 'August', 'September'],
-        'Deployments': [5, 6, 4],
-        'Post-Deployment Issues': [2, 1, 3],
-        'Time to Resolve (hrs)': [12, 8, 10],
-        'QA Sign-off Time (hrs)': [4, 3, 5]
-    })
+    return load_dataset(selected_month, "release_metrics")
 
 # Section rendering
 if section == "Functional Coverage Metrics":
@@ -115,7 +81,7 @@ elif section == "Error & Defect Metrics":
     st.subheader("🚨 Error Summary")
     st.dataframe(generate_error_metrics())
     error_df = generate_error_metrics()
-    fig = px.pie(error_df, names='Error Type', values='Count', title='Error Type Distribution')
+    fig = figures.pie(error_df, names='Error Type', values='Count', title='Error Type Distribution')
     st.plotly_chart(fig)
 
 elif section == "Performance & Uptime":
@@ -123,16 +89,20 @@ elif section == "Performance & Uptime":
     perf_df = generate_performance_metrics()
     st.dataframe(perf_df)
     st.subheader("📈 Page Load Time")
-    fig = px.line(perf_df, x='Country', y='Page Load Time (s)', title='Page Load Time by Country')
+    fig = figures.line(perf_df, x='Country', y='Page Load Time (s)', title='Page Load Time by Country')
     st.plotly_chart(fig)
     st.subheader("📊 Lighthouse Scores")
-    st.dataframe(generate_lighthouse_scores())
+    lighthouse_df = generate_lighthouse_scores()
+    if lighthouse_df.empty:
+        st.info(LIGHTHOUSE_MISSING)
+    else:
+        st.dataframe(lighthouse_df)
 
 elif section == "User Experience & Sentiment":
     st.subheader("💬 Sentiment Analysis")
     sentiment_df = generate_sentiment_data()
     st.dataframe(sentiment_df)
-    fig = px.pie(sentiment_df, names='Sentiment', values='Count', title='User Sentiment Distribution')
+    fig = figures.pie(sentiment_df, names='Sentiment', values='Count', title='User Sentiment Distribution')
     st.plotly_chart(fig)
     st.subheader("📈 Lead Segmentation")
     st.dataframe(generate_lead_segmentation())
@@ -142,10 +112,10 @@ elif section == "Release & Deployment Metrics":
     release_df = generate_release_metrics()
     st.dataframe(release_df)
     st.subheader("📊 Month-wise QA Trends")
-    filtered_df = release_df[release_df['Month'] == selected_month]
+    filtered_df = release_df[release_df['Month'] == month_label(selected_month, '%b')]
     st.dataframe(filtered_df)
-    fig = px.line(release_df, x='Month', y=['Deployments', 'Post-Deployment Issues', 'QA Sign-off Time (hrs)'],
-                  title='Month-wise QA Metrics Trends')
+    fig = figures.line(release_df, x='Month', y=['Deployments', 'Post-Deployment Issues', 'QA Sign-off Time (hrs)'],
+                       title='Month-wise QA Metrics Trends')
     st.plotly_chart(fig)
 
 # Footer
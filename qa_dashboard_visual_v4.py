@@ -1,13 +1,18 @@
 
 import streamlit as st
-import pandas as pd
-import numpy as np
 import plotly.express as px
+from dashboard.data import LIGHTHOUSE_MISSING, latest_month, load_dataset
 
 st.set_page_config(page_title="QA Automation Dashboard", layout="wide")
 
 st.title("📊 Sensormatic Digital Dashboard")
 
+# Latest monthly data folder
+month = latest_month()
+if month is None:
+    st.info("No monthly data yet: add a YYYY_MM folder under SensormaticDashboard/data/ (see scripts/excel_to_csv_converter.py).")
+    st.stop()
+
 # Sidebar navigation
 section = st.sidebar.radio("Select Dashboard Section", [
     "Functional Coverage Metrics",
@@ -18,78 +23,39 @@ section = st.sidebar.radio("Select Dashboard Section", [
     "Release & Deployment Metrics"
 ])
 
-# Mock data generators
+# Section data loaders (SensormaticDashboard/data/YYYY_MM)
 def generate_country_coverage():
-    return pd.DataFrame({
-        'Country': ['US', 'UK', 'IN', 'DE', 'FR'],
-        '% Pages Tested': [95, 90, 85, 80, 75]
-    })
+    return load_dataset(month, "country_coverage")
 
 def generate_form_coverage():
-    return pd.DataFrame({
-        'Form Type': ['Contact', 'Demo', 'Newsletter'],
-        '% Forms Tested': [98, 92, 88]
-    })
+    return load_dataset(month, "form_coverage")
 
 def generate_coveo_coverage():
-    return pd.DataFrame({
-        'Metric': ['Queries Tested', 'Filters Tested', 'Relevance Score'],
-        'Coverage %': [90, 85, 80]
-    })
+    return load_dataset(month, "coveo_coverage")
 
 def generate_automation_metrics():
-    return pd.DataFrame({
-        'Suite': ['Smoke', 'Regression', 'E2E'],
-        'Test Cases': [50, 120, 80],
-        'Pass Rate %': [98, 92, 95],
-        'Execution Time (min)': [5, 20, 15]
-    })
+    return load_dataset(month, "automation_metrics")
 
 def generate_browser_matrix():
-    return pd.DataFrame({
-        'Browser': ['Chrome', 'Firefox', 'Safari', 'Edge'],
-        'Languages Covered': [5, 4, 3, 2]
-    })
+    return load_dataset(month, "browser_matrix")
 
 def generate_error_metrics():
-    return pd.DataFrame({
-        'Error Type': ['Broken Links', '404 Errors', '500 Errors', 'SEO Issues', 'Form Failures', 'Coveo Anomalies'],
-        'Count': [12, 5, 2, 20, 8, 3]
-    })
+    return load_dataset(month, "error_metrics")
 
 def generate_performance_metrics():
-    return pd.DataFrame({
-        'Country': ['US', 'UK', 'IN', 'DE', 'FR'],
-        'Page Load Time (s)': [1.2, 1.5, 2.0, 1.8, 1.6],
-        'Uptime %': [99.9, 99.8, 99.7, 99.6, 99.5]
-    })
+    return load_dataset(month, "performance_metrics")
 
 def generate_lighthouse_scores():
-    return pd.DataFrame({
-        'Metric': ['Accessibility', 'Performance', 'SEO'],
-        'Score': [90, 85, 88]
-    })
+    return load_dataset(month, "lighthouse_scores")
 
 def generate_sentiment_data():
-    return pd.DataFrame({
-        'Sentiment': ['Positive', 'Neutral', 'Negative'],
-        'Count': [120, 30, 10]
-    })
+    return load_dataset(month, "sentiment_data")
 
 def generate_lead_segmentation():
-    return pd.DataFrame({
-        'Lead Type': ['Sales', 'Support'],
-        'Count': [80, 40]
-    })
+    return load_dataset(month, "lead_segmentation")
 
 def generate_release_metrics():
-    return pd.DataFrame({
-        'Month': ['Jan', 'Feb', 'Mar'],
-        'Deployments': [5, 6, 4],
-        'Post-Deployment Issues': [2, 1, 3],
-        'Time to Resolve (hrs)': [12, 8, 10],
-        'QA Sign-off Time (hrs)': [4, 3, 5]
-    })
+    return load_dataset(month, "release_metrics")
 
 # Section rendering
 if section == "Functional Coverage Metrics":
@@ -121,7 +87,11 @@ elif section == "Performance & Uptime":
     perf_df = generate_performance_metrics()
     st.dataframe(perf_df)
     st.subheader("📈 Lighthouse Scores")
-    st.dataframe(generate_lighthouse_scores())
+    lighthouse_df = generate_lighthouse_scores()
+    if lighthouse_df.empty:
+        st.info(LIGHTHOUSE_MISSING)
+    else:
+        st.dataframe(lighthouse_df)
     st.subheader("⚡ Akamai Rule Latency")
     st.metric("Avg Latency", "120ms")
 
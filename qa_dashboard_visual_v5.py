@@ -1,8 +1,8 @@
 import streamlit as st
-import pandas as pd
-import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
+from dashboard import figures
+from dashboard.data import LIGHTHOUSE_MISSING, available_months, load_dataset, month_label
+from dashboard.tables import paged_table
+from dashboard.watcher import ensure_watcher
 
 st.set_page_config(page_title="Sensormatic Digital Dashboard", layout="wide")
 st.title("📊 Sensormatic Digital Dashboard")
@@ -18,157 +18,114 @@ section = st.sidebar.radio("Select Dashboard Section", [
 ])
 
 # Month selector
-month = st.sidebar.selectbox("Select Month", ["July", "August", "September"])
-
-# Mock data generators
+ensure_watcher()
+months = available_months()
+if not months:
+    st.info("No monthly data yet: add a YYYY_MM folder under SensormaticDashboard/data/ (see scripts/excel_to_csv_converter.py).")
+    st.stop()
+month = st.sidebar.selectbox("Select Month", months, index=len(months) - 1, format_func=month_label)
+
+# Section data loaders (SensormaticDashboard/data/YYYY_MM)
 def generate_country_coverage():
-    return pd.DataFrame({
-        'Country': ['US', 'UK', 'IN', 'DE', 'FR'],
-        '% Pages Tested': [95, 90, 85, 80, 75]
-    })
+    return load_dataset(month, "country_coverage")
 
 def generate_form_coverage():
-    return pd.DataFrame({
-        'Form Type': ['Contact', 'Demo', 'Newsletter'],
-        '% Forms Tested': [98, 92, 88]
-    })
+    return load_dataset(month, "form_coverage")
 
 def generate_coveo_coverage():
-    return pd.DataFrame({
-        'Metric': ['Queries Tested', 'Filters Tested', 'Relevance Score'],
-        'Coverage %': [90, 85, 80]
-    })
+    return load_dataset(month, "coveo_coverage")
 
 def generate_automation_metrics():
-    return pd.DataFrame({
-        'Suite': ['Smoke', 'Regression', 'E2E'],
-        'Test Cases': [50, 120, 80],
-        'Pass Rate %': [98, 92, 95],
-        'Execution Time (min)': [5, 20, 15]
-    })
+    return load_dataset(month, "automation_metrics")
 
 def generate_browser_matrix():
-    return pd.DataFrame({
-        'Browser': ['Chrome', 'Firefox', 'Safari', 'Edge'],
-        'Languages Covered': [5, 4, 3, 2]
-    })
+    return load_dataset(month, "browser_matrix")
 
 def generate_error_metrics():
-    return pd.DataFrame({
-        'Error Type': ['Broken Links', '404 Errors', '500 Errors', 'SEO Issues', 'Form Failures', 'Coveo Anomalies'],
-        'Count': [12, 5, 2, 20, 8, 3]
-    })
+    return load_dataset(month, "error_metrics")
 
 def generate_performance_metrics():
-    return pd.DataFrame({
-        'Country': ['US', 'UK', 'IN', 'DE', 'FR'],
-        'Page Load Time (s)': [1.2, 1.5, 2.0, 1.8, 1.6],
-        'Uptime %': [99.9, 99.8, 99.7, 99.6, 99.5]
-    })
+    return load_dataset(month, "performance_metrics")
 
 def generate_lighthouse_scores():
-    return pd.DataFrame({
-        'Metric': ['Accessibility', 'Performance', 'SEO'],
-        'Score': [90, 85, 88]
-    })
+    return load_dataset(month, "lighthouse_scores")
 
 def generate_sentiment_data():
-    return pd.DataFrame({
-        'Sentiment': ['Positive', 'Neutral', 'Negative'],
-        'Count': [120, 30, 10]
-    })
+    return load_dataset(month, "sentiment_data")
 
 def generate_lead_segmentation():
-    return pd.DataFrame({
-        'Lead Type': ['Sales', 'Support'],
-        'Count': [80, 40]
-    })
+    return load_dataset(month, "lead_segmentation")
 
 def generate_release_metrics():
-    return pd.DataFrame({
-        'Month': ['July', 'August', 'September'],
-        'Deployments': [5, 6, 4],
-        'Post-Deployment Issues': [2, 1, 3],
-        'Time to Resolve (hrs)': [12, 8, 10],
-        'QA Sign-off Time (hrs)': [4, 3, 5]
-    })
+    return load_dataset(month, "release_metrics")
 
 # Section rendering
 if section == "Functional Coverage Metrics":
     st.subheader("📍 Pages Tested by Country")
     df = generate_country_coverage()
-    st.plotly_chart(px.bar(df, x='Country', y='% Pages Tested', color='Country', title="Pages Tested by Country"))
+    st.plotly_chart(figures.bar(df, x='Country', y='% Pages Tested', color='Country', title="Pages Tested by Country"))
 
     st.subheader("📨 Forms Tested")
-    st.plotly_chart(px.bar(generate_form_coverage(), x='Form Type', y='% Forms Tested', color='Form Type'))
+    st.plotly_chart(figures.bar(generate_form_coverage(), x='Form Type', y='% Forms Tested', color='Form Type'))
 
     st.subheader("🔍 Coveo Search Coverage")
-    st.plotly_chart(px.bar(generate_coveo_coverage(), x='Metric', y='Coverage %', color='Metric'))
+    st.plotly_chart(figures.bar(generate_coveo_coverage(), x='Metric', y='Coverage %', color='Metric'))
 
     st.subheader("📈 Country Coverage Bubble Chart")
-    bubble = px.scatter(df, x='Country', y='% Pages Tested', size='% Pages Tested', color='Country',
-                        title="Stock-Market Style Country Distribution", size_max=60)
+    bubble = figures.scatter(df, x='Country', y='% Pages Tested', size='% Pages Tested', color='Country',
+                             title="Stock-Market Style Country Distribution", size_max=60)
     st.plotly_chart(bubble)
 
 elif section == "Automation Metrics":
     st.subheader("🤖 Test Automation Summary")
     auto_df = generate_automation_metrics()
-    st.dataframe(auto_df)
+    paged_table(auto_df, key="automation-table")
 
     st.subheader("📊 Pass Rate Gauge")
-    for i, row in auto_df.iterrows():
-        fig = go.Figure(go.Indicator(
-            mode="gauge+number",
-            value=row['Pass Rate %'],
-            title={'text': f"{row['Suite']} Pass Rate"},
-            gauge={'axis': {'range': [0, 100]}}
-        ))
-        st.plotly_chart(fig)
+    st.plotly_chart(figures.gauge_grid(auto_df, value='Pass Rate %', label='Suite', title_suffix=" Pass Rate"))
 
     st.subheader("🌐 Browser/Language Coverage")
-    st.plotly_chart(px.bar(generate_browser_matrix(), x='Browser', y='Languages Covered', color='Browser'))
+    st.plotly_chart(figures.bar(generate_browser_matrix(), x='Browser', y='Languages Covered', color='Browser'))
 
 elif section == "Error & Defect Metrics":
     st.subheader("🚨 Error Summary")
     err_df = generate_error_metrics()
-    st.plotly_chart(px.pie(err_df, names='Error Type', values='Count', title="Error Type Distribution"))
+    st.plotly_chart(figures.pie(err_df, names='Error Type', values='Count', title="Error Type Distribution"))
 
 elif section == "Performance & Uptime":
     st.subheader("📶 Site Performance by Country")
     perf_df = generate_performance_metrics()
-    st.plotly_chart(px.line(perf_df, x='Country', y='Page Load Time (s)', markers=True, title="Page Load Time"))
+    st.plotly_chart(figures.line(perf_df, x='Country', y='Page Load Time (s)', markers=True, title="Page Load Time"))
 
     st.subheader("📊 Uptime Gauge")
-    for i, row in perf_df.iterrows():
-        fig = go.Figure(go.Indicator(
-            mode="gauge+number",
-            value=row['Uptime %'],
-            title={'text': f"{row['Country']} Uptime"},
-            gauge={'axis': {'range': [95, 100]}}
-        ))
-        st.plotly_chart(fig)
+    st.plotly_chart(figures.gauge_grid(perf_df, value='Uptime %', label='Country', axis_range=[95, 100],
+                                       columns=5, title_suffix=" Uptime"))
 
     st.subheader("📊 Lighthouse Scores")
-    st.plotly_chart(px.bar(generate_lighthouse_scores(), x='Metric', y='Score', color='Metric'))
+    lighthouse_df = generate_lighthouse_scores()
+    if lighthouse_df.empty:
+        st.info(LIGHTHOUSE_MISSING)
+    else:
+        st.plotly_chart(figures.bar(lighthouse_df, x='Metric', y='Score', color='Metric'))
 
 elif section == "User Experience & Sentiment":
     st.subheader("💬 Hotjar Feedback Trends")
     st.metric("Positive Feedback %", "85%")
 
     st.subheader("🧠 NLP Sentiment Analysis")
-    st.plotly_chart(px.pie(generate_sentiment_data(), names='Sentiment', values='Count', title="User Sentiment"))
+    st.plotly_chart(figures.pie(generate_sentiment_data(), names='Sentiment', values='Count', title="User Sentiment"))
 
     st.subheader("📊 Lead Segmentation")
-    st.plotly_chart(px.bar(generate_lead_segmentation(), x='Lead Type', y='Count', color='Lead Type'))
+    st.plotly_chart(figures.bar(generate_lead_segmentation(), x='Lead Type', y='Count', color='Lead Type'))
 
 elif section == "Release & Deployment Metrics":
     st.subheader("🚀 Deployment Summary")
     release_df = generate_release_metrics()
-    st.dataframe(release_df)
+    paged_table(release_df, key="release-table")
 
     st.subheader("📈 Month-wise QA Trends")
-    st.plotly_chart(px.line(release_df, x='Month', y=['Deployments', 'Post-Deployment Issues', 'QA Sign-off Time (hrs)'],
-                            markers=True, title="Monthly QA Metrics"))
+    st.plotly_chart(figures.line(release_df, x='Month', y=['Deployments', 'Post-Deployment Issues', 'QA Sign-off Time (hrs)'],
+                                 markers=True, title="Monthly QA Metrics"))
 
 st.markdown("---")
 st.caption("Sensormatic Digital Dashboard | © Harsha")
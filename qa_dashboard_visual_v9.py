@@ -1,174 +1,148 @@
 import streamlit as st
-import pandas as pd
-import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
+from dashboard import cache, figures, profiler, site24x7, sitemap
+from dashboard.downsample import zoom_window
+from dashboard.data import LIGHTHOUSE_MISSING, available_months, month_label
+from dashboard.sections import SectionRegistry
+from dashboard.tables import paged_table
+from dashboard.trends import metric_delta, trend
+from dashboard.watcher import ensure_watcher
 
 st.set_page_config(page_title="Sensormatic Digital Dashboard", layout="wide")
 st.title("📊 Sensormatic Digital Dashboard")
 
-# Sidebar navigation
-section = st.sidebar.radio("Select Dashboard Section", [
-    "Functional Coverage Metrics",
-    "Automation Metrics",
-    "Error & Defect Metrics",
-    "Performance & Uptime",
-    "User Experience & Sentiment",
-    "Release & Deployment Metrics"
-])
+# Sections render only when selected and receive only the datasets they declare
+sections = SectionRegistry()
 
-# Month selector
-month = st.sidebar.selectbox("Select Month", ["July", "August", "September"])
-
-# Mock data generators
-def generate_country_coverage():
-    return pd.DataFrame({
-        'Country': ['US', 'UK', 'IN', 'DE', 'FR'],
-        '% Pages Tested': [95, 90, 85, 80, 75]
-    })
-
-def generate_form_coverage():
-    return pd.DataFrame({
-        'Form Type': ['Contact', 'Demo', 'Newsletter'],
-        '% Forms Tested': [98, 92, 88]
-    })
-
-def generate_coveo_coverage():
-    return pd.DataFrame({
-        'Metric': ['Queries Tested', 'Filters Tested', 'Relevance Score'],
-        'Coverage %': [90, 85, 80]
-    })
-
-def generate_automation_metrics():
-    return pd.DataFrame({
-        'Suite': ['Smoke', 'Regression', 'E2E'],
-        'Test Cases': [50, 120, 80],
-        'Pass Rate %': [98, 92, 95],
-        'Execution Time (min)': [5, 20, 15]
-    })
-
-def generate_browser_matrix():
-    return pd.DataFrame({
-        'Browser': ['Chrome', 'Firefox', 'Safari', 'Edge'],
-        'Languages Covered': [5, 4, 3, 2]
-    })
-
-def generate_error_metrics():
-    return pd.DataFrame({
-        'Error Type': ['Broken Links', '404 Errors', '500 Errors', 'SEO Issues', 'Form Failures', 'Coveo Anomalies'],
-        'Count': [12, 5, 2, 20, 8, 3]
-    })
-
-def generate_performance_metrics():
-    return pd.DataFrame({
-        'Country': ['US', 'UK', 'IN', 'DE', 'FR'],
-        'Page Load Time (s)': [1.2, 1.5, 2.0, 1.8, 1.6],
-        'Uptime %': [99.9, 99.8, 99.7, 99.6, 99.5]
-    })
-
-def generate_lighthouse_scores():
-    return pd.DataFrame({
-        'Metric': ['Accessibility', 'Performance', 'SEO'],
-        'Score': [90, 85, 88]
-    })
-
-def generate_sentiment_data():
-    return pd.DataFrame({
-        'Sentiment': ['Positive', 'Neutral', 'Negative'],
-        'Count': [120, 30, 10]
-    })
-
-def generate_lead_segmentation():
-    return pd.DataFrame({
-        'Lead Type': ['Sales', 'Support'],
-        'Count': [80, 40]
-    })
-
-def generate_release_metrics():
-    return pd.DataFrame({
-        'Month': ['July', 'August', 'September'],
-        'Deployments': [5, 6, 4],
-        'Post-Deployment Issues': [2, 1, 3],
-        'Time to Resolve (hrs)': [12, 8, 10],
-        'QA Sign-off Time (hrs)': [4, 3, 5]
-    })
+# Element emission is timed when profiling is on (?profile=1)
+plotly_chart = profiler.traced("emit", "st.plotly_chart")(st.plotly_chart)
+table = profiler.traced("emit", "paged_table")(paged_table)
 
-# Section rendering
-if section == "Functional Coverage Metrics":
+
+@sections.register("Functional Coverage Metrics", datasets=["country_coverage", "form_coverage", "coveo_coverage"])
+def functional_coverage(month, country_coverage, form_coverage, coveo_coverage):
     st.subheader("📍 Pages Tested by Country")
-    df = generate_country_coverage()
-    st.plotly_chart(px.bar(df, x='Country', y='% Pages Tested', color='Country', title="Pages Tested by Country"))
+    plotly_chart(figures.bar(country_coverage, x='Country', y='% Pages Tested', color='Country',
+                             title="Pages Tested by Country"))
+    sitemap_pages = sitemap.pages_by_country(month)
+    if len(sitemap_pages):
+        # Turn the tested share into page counts against this month's sitemap
+        counts = country_coverage.merge(sitemap_pages, on='Country', how='left')
+        counts['Pages Tested'] = (counts['% Pages Tested'] / 100 * counts['Sitemap Pages']).round()
+        table(counts, key="country-sitemap-table")
 
     st.subheader("📨 Forms Tested")
-    st.plotly_chart(px.bar(generate_form_coverage(), x='Form Type', y='% Forms Tested', color='Form Type'))
+    plotly_chart(figures.bar(form_coverage, x='Form Type', y='% Forms Tested', color='Form Type'))
 
     st.subheader("🔍 Coveo Search Coverage")
-    st.plotly_chart(px.bar(generate_coveo_coverage(), x='Metric', y='Coverage %', color='Metric'))
+    plotly_chart(figures.bar(coveo_coverage, x='Metric', y='Coverage %', color='Metric'))
 
     st.subheader("📈 Country Coverage Bubble Chart")
-    bubble = px.scatter(df, x='Country', y='% Pages Tested', size='% Pages Tested', color='Country',
-                        title="Stock-Market Style Country Distribution", size_max=60)
-    st.plotly_chart(bubble)
+    bubble = figures.scatter(country_coverage, x='Country', y='% Pages Tested', size='% Pages Tested', color='Country',
+                             title="Stock-Market Style Country Distribution", size_max=60)
+    plotly_chart(bubble)
+
 
-elif section == "Automation Metrics":
+@sections.register("Automation Metrics", datasets=["automation_metrics", "browser_matrix"])
+def automation_metrics(month, automation_metrics, browser_matrix):
     st.subheader("🤖 Test Automation Summary")
-    auto_df = generate_automation_metrics()
-    st.dataframe(auto_df)
+    table(automation_metrics, key="automation-table")
+    pass_rate, pass_delta = metric_delta("automation_metrics", "Pass Rate %", month)
+    st.metric("Avg Pass Rate %", "–" if pass_rate is None else f"{pass_rate:.1f}%",
+              delta=None if pass_delta is None else f"{pass_delta:+.1f} pts vs last month")
 
     st.subheader("📊 Pass Rate Gauge")
-    for i, row in auto_df.iterrows():
-        fig = go.Figure(go.Indicator(
-            mode="gauge+number",
-            value=row['Pass Rate %'],
-            title={'text': f"{row['Suite']} Pass Rate"},
-            gauge={'axis': {'range': [0, 100]}}
-        ))
-        st.plotly_chart(fig)
+    plotly_chart(figures.gauge_grid(automation_metrics, value='Pass Rate %', label='Suite', axis_range=[0, 100],
+                                    title_suffix=" Pass Rate"))
 
     st.subheader("🌐 Browser/Language Coverage")
-    st.plotly_chart(px.bar(generate_browser_matrix(), x='Browser', y='Languages Covered', color='Browser'))
+    plotly_chart(figures.bar(browser_matrix, x='Browser', y='Languages Covered', color='Browser'))
 
-elif section == "Error & Defect Metrics":
+
+@sections.register("Error & Defect Metrics", datasets=["error_metrics"])
+def error_metrics(month, error_metrics):
     st.subheader("🚨 Error Summary")
-    err_df = generate_error_metrics()
-    st.plotly_chart(px.pie(err_df, names='Error Type', values='Count', title="Error Type Distribution"))
+    total_errors, errors_delta = metric_delta("error_metrics", "Count", month, agg="sum")
+    st.metric("Total Errors", "–" if total_errors is None else f"{total_errors:,.0f}", delta_color="inverse",
+              delta=None if errors_delta is None else f"{errors_delta:+,.0f} vs last month")
+    plotly_chart(figures.pie(error_metrics, names='Error Type', values='Count', title="Error Type Distribution"))
+
+    st.subheader("📈 Error Trend by Type")
+    plotly_chart(figures.line(trend("error_metrics", "Count", key="Error Type", agg="sum"), x='month', y='Count',
+                              color='Error Type', markers=True, title="Errors by Month"))
 
-elif section == "Performance & Uptime":
+
+@sections.register("Performance & Uptime", datasets=["performance_metrics", "lighthouse_scores"])
+def performance_uptime(month, performance_metrics, lighthouse_scores):
     st.subheader("📶 Site Performance by Country")
-    perf_df = generate_performance_metrics()
-    st.plotly_chart(px.line(perf_df, x='Country', y='Page Load Time (s)', markers=True, title="Page Load Time"))
+    col1, col2 = st.columns(2)
+    uptime, uptime_delta = metric_delta("performance_metrics", "Uptime %", month)
+    col1.metric("Avg Uptime %", "–" if uptime is None else f"{uptime:.2f}%",
+                delta=None if uptime_delta is None else f"{uptime_delta:+.2f} pts vs last month")
+    load_time, load_delta = metric_delta("performance_metrics", "Page Load Time (s)", month)
+    col2.metric("Avg Page Load Time", "–" if load_time is None else f"{load_time:.2f} s",
+                delta_color="inverse",
+                delta=None if load_delta is None else f"{load_delta:+.2f} s vs last month")
+    plotly_chart(figures.line(zoom_window(performance_metrics, 'Country', key="zoom-load-time"),
+                              x='Country', y='Page Load Time (s)', markers=True, title="Page Load Time"))
+
+    checks, _ = site24x7.month_stats(month)
+    if len(checks):
+        st.subheader("⏱️ Response Time Percentiles")
+        table(checks.drop(columns="month").reset_index(), key="site24x7-table")
 
     st.subheader("📊 Uptime Gauge")
-    for i, row in perf_df.iterrows():
-        fig = go.Figure(go.Indicator(
-            mode="gauge+number",
-            value=row['Uptime %'],
-            title={'text': f"{row['Country']} Uptime"},
-            gauge={'axis': {'range': [95, 100]}}
-        ))
-        st.plotly_chart(fig)
+    plotly_chart(figures.gauge_grid(performance_metrics, value='Uptime %', label='Country', axis_range=[95, 100],
+                                    columns=5, title_suffix=" Uptime"))
 
     st.subheader("📊 Lighthouse Scores")
-    st.plotly_chart(px.bar(generate_lighthouse_scores(), x='Metric', y='Score', color='Metric'))
+    if lighthouse_scores.empty:
+        st.info(LIGHTHOUSE_MISSING)
+    else:
+        plotly_chart(figures.bar(lighthouse_scores, x='Metric', y='Score', color='Metric'))
+
 
-elif section == "User Experience & Sentiment":
+@sections.register("User Experience & Sentiment", datasets=["sentiment_data", "lead_segmentation"])
+def user_experience(month, sentiment_data, lead_segmentation):
     st.subheader("💬 Hotjar Feedback Trends")
     st.metric("Positive Feedback %", "85%")
 
     st.subheader("🧠 NLP Sentiment Analysis")
-    st.plotly_chart(px.pie(generate_sentiment_data(), names='Sentiment', values='Count', title="User Sentiment"))
+    plotly_chart(figures.pie(sentiment_data, names='Sentiment', values='Count', title="User Sentiment"))
 
     st.subheader("📊 Lead Segmentation")
-    st.plotly_chart(px.bar(generate_lead_segmentation(), x='Lead Type', y='Count', color='Lead Type'))
+    plotly_chart(figures.bar(lead_segmentation, x='Lead Type', y='Count', color='Lead Type'))
 
-elif section == "Release & Deployment Metrics":
+
+@sections.register("Release & Deployment Metrics", datasets=["release_metrics"])
+def release_metrics(month, release_metrics):
     st.subheader("🚀 Deployment Summary")
-    release_df = generate_release_metrics()
-    st.dataframe(release_df)
+    table(release_metrics, key="release-table")
 
     st.subheader("📈 Month-wise QA Trends")
-    st.plotly_chart(px.line(release_df, x='Month', y=['Deployments', 'Post-Deployment Issues', 'QA Sign-off Time (hrs)'],
-                            markers=True, title="Monthly QA Metrics"))
+    plotly_chart(figures.line(zoom_window(release_metrics, 'Month', key="zoom-release"), x='Month',
+                              y=['Deployments', 'Post-Deployment Issues', 'QA Sign-off Time (hrs)'],
+                              markers=True, title="Monthly QA Metrics"))
+
+
+# Sidebar navigation
+section = st.sidebar.radio("Select Dashboard Section", sections.names())
+
+# Month selector
+ensure_watcher()
+months = available_months()
+if not months:
+    st.info("No monthly data yet: add a YYYY_MM folder under SensormaticDashboard/data/ (see scripts/excel_to_csv_converter.py).")
+    st.stop()
+month = st.sidebar.selectbox("Select Month", months, index=len(months) - 1, format_func=month_label)
+
+# Section rendering
+profiler.begin(section)
+try:
+    sections.render(section, month)
+finally:
+    trace = profiler.end()
+profiler.panel(trace)
+cache.panel()
 
 st.markdown("---")
 st.caption("Sensormatic Digital Dashboard | © Harsha")
@@ -0,0 +1,216 @@
+"""Headless render benchmark for the dashboard scripts.
+
+Runs each script with Streamlit's AppTest for every sidebar section x month
+combination and records cold (shared cache cleared, disk tier off) and warm rerun wall time,
+element count, payload bytes and peak traced memory. Results are appended
+to benchmarks/history.jsonl and written to a per-run CSV so runs can be
+compared over time.
+
+With --scale, a synthetic tree with N times the rows of the current monthly
+CSVs is generated into a temporary folder (dashboard.synthetic) and the
+benchmark is repeated against it in a child process, e.g.
+``--scale 10 100 1000``.
+
+Usage:
+    python scripts/benchmark.py [--script FILE ...] [--scale N ...]
+"""
+import argparse
+import csv
+import gc
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from dashboard import cache, data, schema, synthetic  # noqa: E402
+
+DEFAULT_SCRIPTS = sorted(p.name for p in ROOT.glob("qa_dashboard_visual*.py")) + ["version_11.py", "version_12.py"]
+RESULTS_DIR = ROOT / "benchmarks"
+TIMEOUT = 120
+
+
+def clear_caches():
+    # Every namespace (data, trend, figure, ...); the disk tier is off, see main()
+    cache.shared.clear()
+    gc.collect()
+
+
+def tree_stats(at):
+    """(element count, serialized payload bytes) of the rendered main area."""
+    count, size = 0, 0
+    stack = [at.main]
+    while stack:
+        node = stack.pop()
+        children = getattr(node, "children", None)
+        if children:
+            stack.extend(children.values())
+        elif getattr(node, "proto", None) is not None:
+            count += 1
+            size += node.proto.ByteSize()
+    return count, size
+
+
+def _select(at, section_index, month_index):
+    if section_index is not None:
+        at.sidebar.radio[0].set_value(at.sidebar.radio[0].options[section_index])
+    if month_index is not None:
+        at.sidebar.selectbox[0].select_index(month_index)
+
+
+def _timed_run(at):
+    start = time.perf_counter()
+    at.run()
+    elapsed = time.perf_counter() - start
+    if at.exception:
+        raise RuntimeError("; ".join(e.message for e in at.exception))
+    return elapsed
+
+
+def combinations(script):
+    """Discover (section, section index, month, month index) for a script."""
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(str(ROOT / script), default_timeout=TIMEOUT).run()
+    sections = list(at.sidebar.radio[0].options) if at.sidebar.radio else [None]
+    months = list(at.sidebar.selectbox[0].options) if at.sidebar.selectbox else [None]
+    for si, section in enumerate(sections):
+        for mi, month in enumerate(months):
+            yield section, (si if section is not None else None), month, (mi if month is not None else None)
+
+
+def bench_one(script, section_index, month_index):
+    from streamlit.testing.v1 import AppTest
+
+    def fresh():
+        at = AppTest.from_file(str(ROOT / script), default_timeout=TIMEOUT)
+        at.run()
+        _select(at, section_index, month_index)
+        return at
+
+    at = fresh()
+    clear_caches()
+    cold = _timed_run(at)
+    warm = _timed_run(at)
+    elements, payload = tree_stats(at)
+
+    at = fresh()
+    clear_caches()
+    tracemalloc.start()
+    try:
+        _timed_run(at)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {"cold_s": round(cold, 4), "warm_s": round(warm, 4), "elements": elements,
+            "payload_bytes": payload, "peak_mem_bytes": peak}
+
+
+def run_benchmarks(scripts, label):
+    run_id = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True,
+                                text=True).stdout.strip()
+    except OSError:
+        commit = ""
+    results = []
+    for script in scripts:
+        for section, si, month, mi in combinations(script):
+            row = {"run_id": run_id, "commit": commit, "label": label, "script": script,
+                   "section": section or "", "month": month or "",
+                   "rows_per_dataset": _rows_per_dataset()}
+            try:
+                row.update(bench_one(script, si, mi))
+            except Exception as exc:
+                row["error"] = str(exc)
+            results.append(row)
+            print(f"{script:<28} {row['section'][:30]:<30} {row['month']:<15} "
+                  f"cold {row.get('cold_s', float('nan')):7.3f}s  warm {row.get('warm_s', float('nan')):7.3f}s  "
+                  f"{row.get('elements', 0):4d} el  {row.get('payload_bytes', 0):>9,} B"
+                  + (f"  ERROR {row['error']}" if "error" in row else ""))
+    return results
+
+
+def _rows_per_dataset():
+    month = data.latest_month()
+    if month is None:
+        return 0
+    path = data.dataset_path(month, "country_coverage")
+    with open(path, "rb") as fh:
+        return sum(1 for _ in fh) - 1
+
+
+def write_results(results, out_dir):
+    out_dir.mkdir(parents=True, exist_ok=True)
+    with open(out_dir / "history.jsonl", "a", encoding="utf-8") as fh:
+        for row in results:
+            fh.write(json.dumps(row) + "\n")
+    if results:
+        fields = list(dict.fromkeys(k for row in results for k in row))
+        csv_path = out_dir / f"run_{results[0]['run_id']}_{results[0]['label']}.csv"
+        with open(csv_path, "w", newline="", encoding="utf-8") as fh:
+            writer = csv.DictWriter(fh, fieldnames=fields)
+            writer.writeheader()
+            writer.writerows(results)
+        print(f"Results written to {csv_path}")
+
+
+def scale_tree(src, dst, factor):
+    """Generate a synthetic tree in ``dst`` with ``factor`` x the rows of ``src``.
+
+    Months and per-dataset row counts follow the source tree, so results
+    line up with the baseline run.
+    """
+    months = data.available_months(src)
+    if not months:
+        return 0
+    rows = {}
+    for dataset in data.DATASETS:
+        try:
+            with open(data.dataset_path(months[-1], dataset, src), "rb") as fh:
+                rows[dataset] = factor * (sum(1 for _ in fh) - 1)
+        except FileNotFoundError:
+            # Lighthouse datasets are only there once reports were ingested
+            if dataset not in data.OPTIONAL_DATASETS:
+                raise
+    cardinality = {schema.COUNTRY: rows["country_coverage"], schema.BROWSER: rows["browser_matrix"],
+                   schema.ERROR_TYPE: rows["error_metrics"]}
+    return synthetic.generate_tree(dst, len(months), rows, months[0], cardinality, datasets=list(rows))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--script", action="append", help="Script to benchmark (repeatable, default: all)")
+    parser.add_argument("--scale", type=int, nargs="+", default=[],
+                        help="Also benchmark synthetic data scaled by these factors")
+    parser.add_argument("--label", default="baseline", help=argparse.SUPPRESS)
+    parser.add_argument("--output", type=Path, default=RESULTS_DIR)
+    args = parser.parse_args(argv)
+    scripts = args.script or DEFAULT_SCRIPTS
+    # Cold runs must rebuild everything: point the disk cache tier at a
+    # folder that does not exist, which disables it (children inherit this)
+    os.environ["SENSORMATIC_CACHE_DIR"] = str(Path(tempfile.gettempdir()) / f"sensormatic-nocache-{os.getpid()}")
+
+    write_results(run_benchmarks(scripts, args.label), args.output)
+
+    for factor in args.scale:
+        with tempfile.TemporaryDirectory(prefix=f"sensormatic_x{factor}_") as tmp:
+            data_dir = Path(tmp) / "data"
+            scale_tree(data.DATA_DIR, data_dir, factor)
+            env = dict(os.environ, SENSORMATIC_DATA_DIR=str(data_dir), SENSORMATIC_STORE_DIR=str(Path(tmp) / "store"))
+            cmd = [sys.executable, __file__, "--label", f"x{factor}", "--output", str(args.output)]
+            for script in scripts:
+                cmd += ["--script", script]
+            print(f"\n== Synthetic data x{factor} ==")
+            subprocess.run(cmd, env=env, check=True)
+
+
+if __name__ == "__main__":
+    main()
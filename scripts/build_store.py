@@ -0,0 +1,36 @@
+"""Compact SensormaticDashboard/data/YYYY_MM CSVs into the columnar store.
+
+Usage:
+    python scripts/build_store.py [--dataset NAME ...]
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from dashboard import cube, data, rollup, store  # noqa: E402
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dataset", action="append", choices=sorted(data.DATASETS),
+                        help="Dataset to rebuild (repeatable, default: all)")
+    parser.add_argument("--data-dir", type=Path, default=None)
+    parser.add_argument("--store-dir", type=Path, default=None)
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    rows = store.build_store(args.dataset, args.data_dir, args.store_dir)
+    for dataset, count in rows.items():
+        print(f"{dataset:<22} {count:>10,} rows")
+    if any(dataset in rows for dataset in rollup.SOURCES):
+        print(f"{'kpi_summary':<22} {rollup.build_kpis(args.store_dir):>10,} rows")
+    if any(dataset in rows for dataset in cube.SOURCES):
+        print(f"{'cube':<22} {cube.build_cube(args.store_dir):>10,} cells")
+    print(f"Store written to {args.store_dir or store.STORE_DIR} in {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Check every Knowledge Base page URL and save the results for the dashboard.
+
+Results go to store/link_health.json, which feeds the KB status badges and
+the Broken Links metric. The previous results are reused for conditional
+requests, so pages that have not changed answer 304.
+
+Usage:
+    python scripts/check_links.py [--urls-file FILE] [--concurrency N] [--per-host N] [--rate R]
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from dashboard import knowledge_base, links  # noqa: E402
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--urls-file", type=Path, help="Check these URLs (one per line) instead of the KB catalog")
+    parser.add_argument("--output", type=Path, default=links.LINKS_PATH)
+    parser.add_argument("--concurrency", type=int, default=links.CONCURRENCY)
+    parser.add_argument("--per-host", type=int, default=links.PER_HOST, help="Connections per host")
+    parser.add_argument("--rate", type=float, default=links.RATE_PER_HOST, help="Requests per second per host")
+    parser.add_argument("--timeout", type=float, default=links.TIMEOUT)
+    args = parser.parse_args(argv)
+
+    if args.urls_file:
+        urls = [line.strip() for line in args.urls_file.read_text(encoding="utf-8").splitlines() if line.strip()]
+    else:
+        urls = [url for _, _, url in knowledge_base.page_urls()]
+
+    start = time.perf_counter()
+    results = links.check(urls, links.load_results(args.output), concurrency=args.concurrency,
+                          per_host=args.per_host, rate=args.rate, timeout=args.timeout)
+    links.save_results(results, args.output)
+    for result in links.broken(results):
+        print(f"✗ {result.url}: {result.error or result.status}", file=sys.stderr)
+    print(f"Checked {len(results)} URLs in {time.perf_counter() - start:.2f}s: "
+          f"{len(links.broken(results))} broken -> {args.output}")
+    return 1 if links.broken(results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,64 @@
+"""Crawl Knowledge Base and sitemap pages for SEO metadata and save it for the dashboard.
+
+Pages are fetched concurrently and parsed for title, meta description,
+canonical, hreflang and schema tags. The previous crawl is reused: pages
+answering 304, or whose body hash is unchanged, are not parsed again.
+Pages come from the Knowledge Base catalog, plus every URL of a sitemap or
+sitemap index with --sitemap and any --urls-file. Results go to
+store/seo_pages.json, which feeds the SEO metrics.
+
+Usage:
+    python scripts/crawl_seo.py [--sitemap URL|PATH] [--urls-file FILE] [--concurrency N] [--per-host N] [--rate R]
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from dashboard import knowledge_base, links, seo, sitemap  # noqa: E402
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sitemap", action="append", default=[],
+                        help="Also crawl every page of this sitemap or sitemap index, URL or path (repeatable)")
+    parser.add_argument("--urls-file", type=Path, help="Also crawl these URLs (one per line)")
+    parser.add_argument("--output", type=Path, default=seo.SEO_PATH)
+    parser.add_argument("--concurrency", type=int, default=links.CONCURRENCY)
+    parser.add_argument("--per-host", type=int, default=links.PER_HOST, help="Connections per host")
+    parser.add_argument("--rate", type=float, default=links.RATE_PER_HOST, help="Requests per second per host")
+    parser.add_argument("--timeout", type=float, default=links.TIMEOUT)
+    args = parser.parse_args(argv)
+
+    # KB pages are typed by their catalog entry; other URLs by their path
+    pages = {url: name for _, name, url in knowledge_base.page_urls()}
+    for source in args.sitemap:
+        for url, _ in sitemap.iter_urls(source):
+            pages.setdefault(url, None)
+    if args.urls_file:
+        for line in args.urls_file.read_text(encoding="utf-8").splitlines():
+            if line.strip():
+                pages.setdefault(line.strip(), None)
+
+    previous = seo.load_pages(args.output)
+    start = time.perf_counter()
+    results = seo.crawl(pages, previous, concurrency=args.concurrency, per_host=args.per_host, rate=args.rate,
+                        timeout=args.timeout)
+    seo.save_pages(results, args.output)
+
+    reparsed = sum(1 for url, meta in results.items()
+                   if url not in previous or previous[url].content_hash != meta.content_hash)
+    failed = [meta for meta in results.values() if meta.error or (meta.status or 0) >= 400]
+    for meta in failed:
+        print(f"✗ {meta.url}: {meta.error or meta.status}", file=sys.stderr)
+    indexable, covered = seo.summary(results)
+    print(f"Crawled {len(results)} pages in {time.perf_counter() - start:.2f}s ({reparsed} parsed, "
+          f"{len(results) - reparsed} unchanged): {indexable} indexable, "
+          f"Meta Tag Coverage {covered if covered is not None else '–'}% -> {args.output}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
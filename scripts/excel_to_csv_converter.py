@@ -0,0 +1,164 @@
+"""Convert monthly QA Excel workbooks into data/YYYY_MM/<dataset>.csv files.
+
+Each workbook holds one month, named so the month can be read from the file
+name (e.g. ``QA_Metrics_2025-07.xlsx`` or ``2025_07.xlsx``), with one sheet per
+dashboard dataset ("Country Coverage", "Automation Metrics", ...). Sheets are
+streamed row by row in openpyxl read-only mode, their headers are checked
+against dashboard.schema, and every CSV is written to a temp file and renamed
+into place. Workbooks are converted in parallel, one per worker process.
+
+The Lighthouse datasets (data.OPTIONAL_DATASETS) belong to
+scripts/ingest_lighthouse.py: sheets for them are skipped with a note and a
+workbook without them is not an error. Sheets that match no dataset
+("Notes", "Summary", ...) are skipped with a warning; only missing or
+malformed dataset sheets make the exit status non-zero.
+
+Usage:
+    python scripts/excel_to_csv_converter.py WORKBOOK_OR_DIR [...] [--workers N]
+"""
+import argparse
+import csv
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from dashboard import data, fileio  # noqa: E402
+from dashboard.schema import COLUMNS  # noqa: E402
+
+MONTH_RE = re.compile(r"(20\d{2})[_-]?(0[1-9]|1[0-2])")
+
+
+def month_from_name(path):
+    match = MONTH_RE.search(Path(path).stem)
+    if not match:
+        raise ValueError(f"Cannot read YYYY_MM month from workbook name: {path}")
+    return f"{match.group(1)}_{match.group(2)}"
+
+
+def sheet_dataset(title):
+    """Map a sheet title such as "Country Coverage" to its dataset name."""
+    key = re.sub(r"[^a-z0-9]+", "_", title.strip().lower()).strip("_")
+    return key if key in COLUMNS else None
+
+
+def _clean(value):
+    return value.strip() if isinstance(value, str) else value
+
+
+def write_sheet(rows, header, dataset, out_dir):
+    """Stream one sheet's remaining rows to <out_dir>/<dataset>.csv atomically.
+
+    ``header`` is the sheet's own header row; columns are written in schema
+    order. Returns the number of data rows written.
+    """
+    expected = COLUMNS[dataset]
+    missing = [col for col in expected if col not in header]
+    if missing:
+        raise ValueError(f"missing columns {missing} (found {list(header)})")
+    positions = [header.index(col) for col in expected]
+
+    def write(tmp):
+        count = 0
+        with open(tmp, "w", newline="", encoding="utf-8") as fh:
+            writer = csv.writer(fh, lineterminator="\n")
+            writer.writerow(expected)
+            for row in rows:
+                values = [_clean(row[i]) if i < len(row) else None for i in positions]
+                if all(v is None or v == "" for v in values):
+                    continue
+                writer.writerow(values)
+                count += 1
+        return count
+
+    return fileio.atomic_write(out_dir / data.DATASETS[dataset], write)
+
+
+def convert_workbook(path, data_dir, month=None):
+    """Convert every recognised sheet of one workbook.
+
+    Returns (month, {dataset: rows}, [notes], [warnings], [errors]). Runs
+    in a worker process, so it only takes and returns picklable values.
+    """
+    from openpyxl import load_workbook
+
+    month = month or month_from_name(path)
+    out_dir = Path(data_dir) / month
+    out_dir.mkdir(parents=True, exist_ok=True)
+    written, notes, warnings, errors = {}, [], [], []
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        for ws in wb.worksheets:
+            dataset = sheet_dataset(ws.title)
+            if dataset is None:
+                warnings.append(f"{Path(path).name}[{ws.title}]: no dataset named like this sheet, skipped")
+                continue
+            if dataset in data.OPTIONAL_DATASETS:
+                notes.append(f"{Path(path).name}[{ws.title}]: written by scripts/ingest_lighthouse.py, skipped")
+                continue
+            rows = ws.iter_rows(values_only=True)
+            header = tuple(_clean(v) for v in next(rows, ()))
+            try:
+                written[dataset] = write_sheet(rows, header, dataset, out_dir)
+            except ValueError as exc:
+                errors.append(f"{Path(path).name}[{ws.title}]: {exc}")
+    finally:
+        wb.close()
+    missing = sorted(set(COLUMNS) - set(written) - data.OPTIONAL_DATASETS)
+    if missing:
+        errors.append(f"{Path(path).name}: no sheet for {', '.join(missing)}")
+    return month, written, notes, warnings, errors
+
+
+def find_workbooks(inputs):
+    for item in inputs:
+        item = Path(item)
+        if item.is_dir():
+            yield from sorted(p for p in item.glob("*.xlsx") if not p.name.startswith("~$"))
+        else:
+            yield item
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("inputs", nargs="+", help="Workbooks or folders of workbooks")
+    parser.add_argument("--data-dir", type=Path, default=data.DATA_DIR,
+                        help="Output root holding the YYYY_MM folders")
+    parser.add_argument("--month", help="Override YYYY_MM (single workbook only)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(),
+                        help="Worker processes (default: CPU count)")
+    args = parser.parse_args(argv)
+
+    workbooks = list(find_workbooks(args.inputs))
+    if args.month and len(workbooks) != 1:
+        parser.error("--month can only be used with a single workbook")
+
+    failed = False
+    with ProcessPoolExecutor(max_workers=max(1, min(args.workers, len(workbooks) or 1))) as pool:
+        futures = {pool.submit(convert_workbook, str(wb), str(args.data_dir), args.month): wb
+                   for wb in workbooks}
+        for future in as_completed(futures):
+            workbook = futures[future]
+            try:
+                month, written, notes, warnings, errors = future.result()
+            except Exception as exc:
+                print(f"✗ {workbook.name}: {exc}", file=sys.stderr)
+                failed = True
+                continue
+            total = sum(written.values())
+            print(f"✓ {workbook.name} -> {month}: {len(written)} datasets, {total} rows")
+            for message in notes:
+                print(f"  · {message}")
+            for message in warnings:
+                print(f"  ? {message}", file=sys.stderr)
+            for message in errors:
+                print(f"  ! {message}", file=sys.stderr)
+            failed = failed or bool(errors)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,38 @@
+"""Generate a synthetic data/YYYY_MM tree for load and scaling tests.
+
+Usage:
+    python scripts/generate_synthetic_data.py OUT_DIR [--months 24] [--rows 100000]
+        [--countries 200] [--browsers 12] [--error-types 30] [--seed 0]
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from dashboard import schema, synthetic  # noqa: E402
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("out_dir", type=Path, help="Folder to create the YYYY_MM folders in")
+    parser.add_argument("--months", type=int, default=12)
+    parser.add_argument("--start", default="2024_01", help="First month (YYYY_MM)")
+    parser.add_argument("--rows", type=int, default=1000, help="Rows per dataset per month")
+    parser.add_argument("--countries", type=int, default=synthetic.DEFAULT_CARDINALITY[schema.COUNTRY])
+    parser.add_argument("--browsers", type=int, default=synthetic.DEFAULT_CARDINALITY[schema.BROWSER])
+    parser.add_argument("--error-types", type=int, default=synthetic.DEFAULT_CARDINALITY[schema.ERROR_TYPE])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    cardinality = {schema.COUNTRY: args.countries, schema.BROWSER: args.browsers,
+                   schema.ERROR_TYPE: args.error_types}
+    start = time.perf_counter()
+    total = synthetic.generate_tree(args.out_dir, args.months, args.rows, args.start, cardinality, args.seed)
+    print(f"Wrote {total:,} rows across {args.months} months to {args.out_dir} "
+          f"in {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
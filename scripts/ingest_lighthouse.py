@@ -0,0 +1,52 @@
+"""Ingest a folder of Lighthouse JSON reports into the monthly datasets.
+
+Reports are parsed in a pool of worker processes that send back only the
+category scores and the FCP, Speed Index, TTI, TBT, LCP and CLS audits.
+Extracted rows are cached by report hash, so re-runs only parse new
+reports. Writes data/YYYY_MM/lighthouse_scores.csv and
+lighthouse_deep_dive.csv (median over pages, mobile runs unless
+--form-factor says otherwise) for every month that has a data folder, plus
+per-page medians for every form factor in store/lighthouse_pages.parquet.
+
+Usage:
+    python scripts/ingest_lighthouse.py REPORT_DIR [--workers N]
+"""
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from dashboard import data, lighthouse  # noqa: E402
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("report_dir", type=Path, help="Folder searched recursively for *.json reports")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Worker processes (default: CPU count)")
+    parser.add_argument("--data-dir", type=Path, default=data.DATA_DIR)
+    parser.add_argument("--form-factor", choices=("mobile", "desktop"), default=lighthouse.FORM_FACTOR,
+                        help="Runs summarized in the monthly datasets (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    if not args.report_dir.is_dir():
+        parser.error(f"Not a folder: {args.report_dir}")
+    start = time.perf_counter()
+    rows, parsed, errors = lighthouse.ingest(args.report_dir, workers=args.workers)
+    for path, error in sorted(errors.items()):
+        print(f"✗ {path}: {error}", file=sys.stderr)
+    pages = lighthouse.page_frame(rows)
+    written, skipped = lighthouse.write_datasets(pages, args.data_dir, form_factor=args.form_factor)
+    print(f"{len(rows)} reports ({parsed} parsed, {len(rows) - parsed} from cache) -> {len(pages)} page rows "
+          f"in {time.perf_counter() - start:.2f}s")
+    if written:
+        print(f"Wrote {args.form_factor} lighthouse_scores and lighthouse_deep_dive for {', '.join(written)}")
+    if skipped:
+        print(f"Skipped {', '.join(skipped)}: no data folder in {args.data_dir}", file=sys.stderr)
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,47 @@
+"""Compute SLA uptime and response-time percentiles from Site24x7 check logs.
+
+Each export (CSV or CSV.gz with timestamp, location, status and response
+time columns) is streamed in batches, and all exports given are folded
+together, so per-location or partial-month files add up. Uptime % merges
+overlapping downtime across locations; p50/p95/p99 come from per-country
+histograms. The months covered replace their rows in
+store/site24x7.parquet, which feeds the Site24x7 Uptime & Response metrics;
+pass every export for a month in one run.
+
+Usage:
+    python scripts/ingest_site24x7.py EXPORT [EXPORT ...] [--interval SECONDS]
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from dashboard import schema, site24x7  # noqa: E402
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("exports", nargs="+", type=Path, help="Check-result exports (.csv or .csv.gz)")
+    parser.add_argument("--interval", type=int, default=site24x7.INTERVAL,
+                        help=f"Seconds between checks from one location (default: {site24x7.INTERVAL})")
+    parser.add_argument("--output", type=Path, default=site24x7.SITE24X7_PATH)
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    try:
+        stats = site24x7.ingest([str(export) for export in args.exports], interval=args.interval)
+    except ValueError as exc:
+        # Saving the other exports alone would replace their months with partial data
+        print(f"✗ {exc}", file=sys.stderr)
+        return 1
+    site24x7.save_stats(stats, args.output)
+    print(f"{len(args.exports)} export(s): {int(stats.loc[stats[schema.COUNTRY] == site24x7.ALL, 'Checks'].sum()):,} "
+          f"checks in {time.perf_counter() - start:.2f}s")
+    print(stats.to_string(index=False))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,53 @@
+"""Snapshot the site's sitemap for a month and report changes since the last one.
+
+The sitemap (or sitemap index) is streamed from a URL or local file,
+following nested indexes and gzip sitemaps, into store/sitemap/YYYY_MM.parquet.
+The snapshot feeds the Indexed Pages metric and the sitemap page counts
+next to Pages Tested by Country.
+
+Usage:
+    python scripts/ingest_sitemap.py SITEMAP [--month YYYY_MM] [--show N]
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from dashboard import data, sitemap  # noqa: E402
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("sitemap", help="Sitemap or sitemap index URL or path (.xml or .xml.gz)")
+    parser.add_argument("--month", help="Month to record (default: latest data month)")
+    parser.add_argument("--sitemap-dir", type=Path, default=sitemap.SITEMAP_DIR)
+    parser.add_argument("--show", type=int, default=10, help="Added/removed URLs to list (default: 10)")
+    args = parser.parse_args(argv)
+
+    month = args.month or (data.available_months() or [None])[-1]
+    if month is None:
+        parser.error(f"No data months in {data.DATA_DIR}; pass --month")
+
+    start = time.perf_counter()
+    count = sitemap.ingest(args.sitemap, month, args.sitemap_dir)
+    print(f"Ingested {count:,} URLs for {month} in {time.perf_counter() - start:.2f}s")
+
+    start = time.perf_counter()
+    previous = sitemap.month_diff(month, args.sitemap_dir)
+    if previous is None:
+        print("No earlier snapshot to compare with")
+        return 0
+    before, changes = previous
+    print(f"vs {before} ({time.perf_counter() - start:.3f}s): +{len(changes.added):,} added, "
+          f"-{len(changes.removed):,} removed, {len(changes.changed):,} changed, "
+          f"{len(changes.unchanged):,} unchanged")
+    for sign, source, hashes in (("+", month, changes.added), ("-", before, changes.removed)):
+        for url in sitemap.urls_for(source, hashes[:args.show], args.sitemap_dir):
+            print(f"  {sign} {url}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,131 @@
+"""Pre-warm the on-disk dashboard cache ahead of traffic.
+
+Creates the cache folder (which turns the disk tier of dashboard.cache on),
+loads every dataset for the selected months, then renders every sidebar
+section x month of the dashboard headlessly in a pool of worker processes,
+so trends and figures are written to disk. A server started afterwards
+serves them from disk on its first rerun. Per-section timings are printed,
+slowest first.
+
+Usage:
+    python scripts/warm_cache.py [--month YYYY_MM ... | --all-months] [--workers N] [--clear]
+"""
+import argparse
+import os
+import shutil
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from dashboard import cache, data  # noqa: E402
+
+DEFAULT_SCRIPT = "qa_dashboard_visual_v9.py"
+TIMEOUT = 120
+
+_app = None  # one AppTest per worker process, reused across tasks
+
+
+def _run(at):
+    # Streamlit installs the script as __main__; put ours back so the pool
+    # can still find warm_one by name
+    main_module = sys.modules["__main__"]
+    try:
+        return at.run()
+    finally:
+        sys.modules["__main__"] = main_module
+
+
+def _app_for(script):
+    global _app
+    from streamlit.testing.v1 import AppTest
+
+    if _app is None:
+        _app = _run(AppTest.from_file(str(ROOT / script), default_timeout=TIMEOUT))
+    return _app
+
+
+def sections(script):
+    """Entries of the script's sidebar section radio ([None] if it has none)."""
+    from streamlit.testing.v1 import AppTest
+
+    # A throwaway app: workers must not inherit this process's AppTest
+    at = _run(AppTest.from_file(str(ROOT / script), default_timeout=TIMEOUT))
+    return list(at.sidebar.radio[0].options) if at.sidebar.radio else [None]
+
+
+def warm_one(script, section, month):
+    """Render one section for one month; returns (section, month, seconds)."""
+    at = _app_for(script)
+    start = time.perf_counter()
+    if section is not None:
+        at.sidebar.radio[0].set_value(section)
+    if at.sidebar.selectbox:
+        at.sidebar.selectbox[0].set_value(month)
+    _run(at)
+    if at.exception:
+        raise RuntimeError("; ".join(e.message for e in at.exception))
+    return section, month, time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    months_group = parser.add_mutually_exclusive_group()
+    months_group.add_argument("--month", action="append", help="Month to warm (repeatable, default: latest)")
+    months_group.add_argument("--all-months", action="store_true", help="Warm every available month")
+    parser.add_argument("--script", default=DEFAULT_SCRIPT, help="Dashboard script whose sections are rendered")
+    parser.add_argument("--cache-dir", type=Path, help="Cache folder (default: SENSORMATIC_CACHE_DIR or store/cache)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Worker processes (default: CPU count)")
+    parser.add_argument("--clear", action="store_true", help="Delete existing cache blobs first")
+    args = parser.parse_args(argv)
+
+    if args.cache_dir is not None:
+        # Inherited by the worker processes
+        os.environ["SENSORMATIC_CACHE_DIR"] = str(args.cache_dir)
+    directory = cache.shared.disk.directory
+    if args.clear and directory.is_dir():
+        shutil.rmtree(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+
+    available = data.available_months()
+    months = available if args.all_months else args.month or available[-1:]
+    unknown = sorted(set(months) - set(available))
+    if not months or unknown:
+        parser.error(f"No data for month(s) {', '.join(unknown) or 'any'} in {data.DATA_DIR}")
+
+    start = time.perf_counter()
+    for month in months:
+        for dataset in data.DATASETS:
+            data.load_dataset(month, dataset)
+    print(f"Loaded {len(data.DATASETS)} datasets x {len(months)} month(s) in {time.perf_counter() - start:.2f}s")
+
+    tasks = [(section, month) for section in sections(args.script) for month in months]
+    timings, failed = {}, False
+    with ProcessPoolExecutor(max_workers=max(1, min(args.workers, len(tasks)))) as pool:
+        futures = {pool.submit(warm_one, args.script, section, month): (section, month) for section, month in tasks}
+        for future in as_completed(futures):
+            section, month = futures[future]
+            try:
+                _, _, seconds = future.result()
+            except Exception as exc:
+                print(f"✗ {section} / {month}: {exc}", file=sys.stderr)
+                failed = True
+                continue
+            timings.setdefault(section, []).append(seconds)
+
+    print(f"\n{'Section':<32} {'months':>6} {'total':>8} {'slowest':>8}")
+    for section, times in sorted(timings.items(), key=lambda item: -sum(item[1])):
+        print(f"{section or args.script:<32} {len(times):>6} {sum(times):7.2f}s {max(times):7.2f}s")
+
+    blobs = [p for p in directory.iterdir() if p.is_file()]
+    size = sum(p.stat().st_size for p in blobs)
+    print(f"\nWarmed {len(tasks)} section x month renders in {time.perf_counter() - start:.2f}s: "
+          f"{len(blobs)} blobs, {size / 2**20:.1f} MB in {directory}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
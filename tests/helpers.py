@@ -0,0 +1,38 @@
+import asyncio
+import socket
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+
+def serve(app, scenario):
+    """Run ``scenario(url)`` against ``app`` on a local test server.
+
+    ``url(path)`` gives the absolute URL of a path on that server.
+    """
+    async def main():
+        async with TestServer(app) as server:
+            return await scenario(lambda path: str(server.make_url(path)))
+    return asyncio.run(main())
+
+
+def closed_port_url(path="/"):
+    """A URL on a local port nothing listens on."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    return f"http://127.0.0.1:{port}{path}"
+
+
+def app_of(routes):
+    """An app answering GET/HEAD on each path with ``routes[path]()``.
+
+    A callable may return a response or raise an aiohttp HTTPException
+    (e.g. a redirect).
+    """
+    app = web.Application()
+    for path, respond in routes.items():
+        async def handler(request, respond=respond):
+            return respond()
+        app.router.add_get(path, handler)
+    return app
@@ -0,0 +1,50 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from dashboard import downsample
+
+
+def series(n=10_000, spike=6_543, seed=0):
+    rng = np.random.default_rng(seed)
+    y = np.sin(np.linspace(0, 20, n)) + rng.normal(0, 0.05, n)
+    y[spike] = 25.0
+    return np.arange(n, dtype=float), y
+
+
+@pytest.mark.parametrize("points", [8, 100, 2000])
+def test_minmax_keeps_endpoints_spikes_and_budget(points):
+    x, y = series()
+    y[1234] = -25.0
+    idx = downsample.minmax_indices(y, points)
+    assert len(idx) <= points
+    assert np.all(np.diff(idx) > 0)
+    assert {0, len(y) - 1, 6_543, 1234} <= set(idx.tolist())
+
+
+@pytest.mark.parametrize("points", [3, 100, 2000])
+def test_lttb_keeps_endpoints_spikes_and_budget(points):
+    x, y = series()
+    idx = downsample.lttb_indices(x, y, points)
+    assert len(idx) == points
+    assert np.all(np.diff(idx) > 0)
+    assert idx[0] == 0 and idx[-1] == len(y) - 1
+    if points > 3:
+        assert 6_543 in idx
+
+
+def test_short_series_are_untouched():
+    x, y = series(n=50, spike=10)
+    assert np.array_equal(downsample.minmax_indices(y, 100), np.arange(50))
+    assert np.array_equal(downsample.lttb_indices(x, y, 100), np.arange(50))
+
+
+@pytest.mark.parametrize("method", ["minmax", "lttb"])
+def test_downsample_budget_is_per_series(method):
+    x, y = series(n=5_000, spike=100)
+    df = pd.DataFrame({"t": np.tile(x, 2), "v": np.r_[y, -y], "k": np.repeat(["a", "b"], len(x))})
+    out = downsample.downsample(df, "t", "v", key="k", points=200, method=method)
+    counts = out["k"].value_counts()
+    assert (counts <= 200).all() and set(counts.index) == {"a", "b"}
+    assert out.index.is_monotonic_increasing
+    assert out["v"].max() == 25.0 and out["v"].min() == -25.0
@@ -0,0 +1,81 @@
+from aiohttp import web
+
+from dashboard import links
+
+from helpers import app_of, closed_port_url, serve
+
+
+def check(app, paths, previous=None):
+    async def scenario(url):
+        return await links.check_async([url(p) for p in paths], previous(url) if previous else None, rate=0)
+    return serve(app, scenario)
+
+
+def test_head_rejected_falls_back_to_get():
+    async def handler(request):
+        return web.Response(status=405 if request.method == "HEAD" else 200)
+
+    app = web.Application()
+    app.router.add_route("*", "/page", handler)
+    (result,) = check(app, ["/page"]).values()
+    assert (result.status, result.ok, result.method) == (200, True, "GET")
+
+
+def test_redirect_chain_is_recorded():
+    def redirect(cls, location):
+        def respond():
+            raise cls(location)
+        return respond
+
+    app = app_of({"/a": redirect(web.HTTPMovedPermanently, "/b"), "/b": redirect(web.HTTPFound, "/c"),
+                  "/c": lambda: web.Response(text="ok")})
+    (result,) = check(app, ["/a"]).values()
+    assert result.ok and result.status == 200 and result.method == "HEAD"
+    assert [status for status, _ in result.redirects] == [301, 302]
+    assert [url.rsplit("/", 1)[-1] for _, url in result.redirects] == ["a", "b"]
+
+
+def test_not_found_is_broken_after_get():
+    methods = []
+
+    async def handler(request):
+        methods.append(request.method)
+        return web.Response(status=404)
+
+    app = web.Application()
+    app.router.add_route("*", "/missing", handler)
+    results = check(app, ["/missing"])
+    (result,) = results.values()
+    assert (result.status, result.ok, result.method) == (404, False, "GET")
+    assert methods == ["HEAD", "GET"]
+    assert links.broken(results) == [result]
+
+
+def test_connection_error_becomes_a_result():
+    url = closed_port_url("/down")
+    result = links.check([url], rate=0)[url]
+    assert result.status is None and not result.ok
+    assert result.error.startswith("ClientConnectorError")
+
+
+def test_not_modified_reuses_previous_result():
+    seen = []
+
+    async def handler(request):
+        seen.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return web.Response(status=304)
+        return web.Response(text="body", headers={"ETag": '"v1"'})
+
+    app = web.Application()
+    app.router.add_get("/page", handler)
+
+    async def scenario(url):
+        first = await links.check_async([url("/page")], rate=0)
+        second = await links.check_async([url("/page")], first, rate=0)
+        return first[url("/page")], second[url("/page")]
+
+    first, second = serve(app, scenario)
+    assert first.etag == '"v1"' and first.status == 200
+    assert seen == [None, '"v1"']
+    assert second._replace(latency_ms=None, checked_at=None) == first._replace(latency_ms=None, checked_at=None)
@@ -0,0 +1,46 @@
+import pandas as pd
+import pytest
+
+from dashboard import schema
+
+
+def write(tmp_path, text):
+    path = tmp_path / "data.csv"
+    path.write_text(text)
+    return path
+
+
+def test_invalid_rows_are_dropped(tmp_path):
+    path = write(tmp_path, "\n".join([
+        "Suite,Test Cases,Pass Rate %,Execution Time (min)",
+        "Smoke,120,98.5,12",
+        "Blank,,90,5",           # missing integer
+        "Fraction,50.7,90,5",    # would truncate
+        "Huge,1e12,90,5",        # does not fit int32
+        "Negative,-3,90,5",      # below min
+        "Over,10,120,5",         # pass rate above 100
+        "Regression,300,91,45.5",
+    ]))
+    df = schema.read_csv(path, "automation_metrics")
+    assert df["Suite"].tolist() == ["Smoke", "Regression"]
+    assert df["Test Cases"].tolist() == [120, 300]
+    assert df["Test Cases"].dtype == "int32"
+    assert isinstance(df["Suite"].dtype, pd.CategoricalDtype)
+
+
+def test_non_numeric_text_drops_only_its_row(tmp_path):
+    path = write(tmp_path, "Browser,Languages Covered\nChrome,12\nSafari,n/a\nEdge,9\n")
+    df = schema.read_csv(path, "browser_matrix")
+    assert df["Browser"].tolist() == ["Chrome", "Edge"]
+    assert df["Languages Covered"].dtype == "int16"
+
+
+def test_unknown_category_is_dropped(tmp_path):
+    path = write(tmp_path, "Metric,Score\nPerformance,91\nSpeed,80\nSEO,99\n")
+    assert schema.read_csv(path, "lighthouse_scores")["Metric"].tolist() == ["Performance", "SEO"]
+
+
+def test_missing_column_raises(tmp_path):
+    path = write(tmp_path, "Browser\nChrome\n")
+    with pytest.raises(schema.SchemaError):
+        schema.read_csv(path, "browser_matrix")
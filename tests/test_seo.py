@@ -0,0 +1,82 @@
+from aiohttp import web
+
+from dashboard import seo
+
+from helpers import app_of, closed_port_url, serve
+
+PAGE = """<!doctype html>
+<html lang="de-DE"><head>
+<title>  Sensormatic   Solutions </title>
+<meta name="description" content="Retail loss prevention">
+<link rel="canonical" href="https://example.com/de-de/solutions">
+<link rel="alternate" hreflang="en-us" href="https://example.com/en-us/solutions">
+<link rel="alternate" hreflang="de-de" href="https://example.com/de-de/solutions">
+<script type="application/ld+json">{"@graph": [{"@type": "Organization"}, {"@type": "WebPage"}]}</script>
+</head><body></body></html>"""
+
+
+def crawl(app, pages, previous=None):
+    async def scenario(url):
+        return await seo.crawl_async({url(p): kind for p, kind in pages.items()},
+                                     previous(url) if previous else None, rate=0)
+    return serve(app, scenario)
+
+
+def test_page_tags_are_parsed():
+    app = app_of({"/de-de/solutions": lambda: web.Response(text=PAGE, content_type="text/html")})
+    (meta,) = crawl(app, {"/de-de/solutions": None}).values()
+    assert meta.error is None and meta.status == 200
+    assert (meta.page_type, meta.locale) == ("solutions", "de-de")
+    assert meta.title == "Sensormatic Solutions"
+    assert meta.description == "Retail loss prevention"
+    assert meta.canonical == "https://example.com/de-de/solutions"
+    assert meta.hreflang == ("de-de", "en-us")
+    assert meta.schema_types == ("Organization", "WebPage")
+    assert not meta.noindex
+
+
+def test_not_modified_and_unchanged_pages_reuse_previous():
+    calls = []
+
+    async def handler(request):
+        calls.append(request.headers.get("If-None-Match"))
+        if request.path == "/cached" and request.headers.get("If-None-Match") == '"v1"':
+            return web.Response(status=304)
+        return web.Response(text=PAGE, content_type="text/html", headers={"ETag": '"v1"'})
+
+    app = web.Application()
+    app.router.add_get("/cached", handler)
+    app.router.add_get("/same", handler)
+
+    async def scenario(url):
+        pages = {url("/cached"): "kb", url("/same"): "kb"}
+        first = await seo.crawl_async(pages, rate=0)
+        # /same ignores the validator and sends the same bytes again
+        second = await seo.crawl_async(pages, {k: v._replace(etag=None) if k.endswith("same") else v
+                                               for k, v in first.items()}, rate=0)
+        return [(first[u], second[u]) for u in pages]
+
+    (cached_first, cached_second), (same_first, same_second) = serve(app, scenario)
+    assert cached_second.status == 200 and cached_second.title == cached_first.title
+    assert same_second.content_hash == same_first.content_hash and same_second.etag == '"v1"'
+    assert calls.count('"v1"') == 1
+
+
+def test_unknown_charset_falls_back_to_utf8():
+    body = "<html><title>Grüße</title></html>".encode()
+    app = app_of({"/page": lambda: web.Response(body=body, headers={"Content-Type": "text/html; charset=x-nonsense"})})
+    (meta,) = crawl(app, {"/page": None}).values()
+    assert meta.error is None and meta.title == "Grüße"
+
+
+def test_one_failing_page_does_not_stop_the_crawl():
+    app = app_of({"/ok": lambda: web.Response(text=PAGE, content_type="text/html")})
+    down = closed_port_url("/down")
+
+    async def scenario(url):
+        return await seo.crawl_async({url("/ok"): None, down: None}, rate=0)
+
+    results = serve(app, scenario)
+    assert results[down].error.startswith("ClientConnectorError") and results[down].status is None
+    (ok,) = (meta for url, meta in results.items() if url != down)
+    assert ok.error is None and ok.title == "Sensormatic Solutions"
@@ -0,0 +1,71 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from dashboard import site24x7
+
+START = pd.Timestamp("2025-07-01")
+
+
+def write_log(path, rows):
+    pd.DataFrame(rows, columns=["Timestamp", "Location", "Status", "Response Time (ms)"]).to_csv(path, index=False)
+    return str(path)
+
+
+def checks(location, minutes, down=(), response=100.0):
+    return [(str(START + pd.Timedelta(minutes=m)), location, "Down" if m in down else "Up",
+             np.nan if m in down else response) for m in minutes]
+
+
+def row(stats, country):
+    return stats.set_index("Country").loc[country]
+
+
+def test_overlapping_downtime_counts_once(tmp_path):
+    log = write_log(tmp_path / "log.csv", checks("London - GB", range(60), down={10, 11, 12})
+                    + checks("Berlin - DE", range(60), down={11, 12, 13, 30}))
+    stats = site24x7.ingest(log)
+    assert row(stats, "UK")["Downtime (min)"] == 3
+    assert row(stats, "DE")["Downtime (min)"] == 4
+    # 10-13 overlap into one 4-minute outage, plus minute 30
+    assert row(stats, site24x7.ALL)["Downtime (min)"] == 5
+    assert row(stats, site24x7.ALL)["Uptime %"] == pytest.approx(100 * (1 - 5 / 60), abs=1e-3)
+
+
+def test_downtime_matches_brute_force(tmp_path):
+    rng = np.random.default_rng(7)
+    rows, down_minutes = [], set()
+    for location in ("London - GB", "Berlin - DE", "Dallas - US"):
+        down = set(np.flatnonzero(rng.random(600) < 0.05).tolist())
+        down_minutes |= down
+        rows += checks(location, range(600), down=down)
+    stats = site24x7.ingest(write_log(tmp_path / "log.csv", rows))
+    assert row(stats, site24x7.ALL)["Downtime (min)"] == len(down_minutes)
+
+
+def test_percentiles_match_numpy(tmp_path):
+    rng = np.random.default_rng(3)
+    response = rng.lognormal(mean=5.5, sigma=0.6, size=20_000)
+    rows = [(str(START + pd.Timedelta(seconds=i)), "Dallas - US", "Up", r) for i, r in enumerate(response)]
+    stats = row(site24x7.ingest(write_log(tmp_path / "log.csv", rows)), "US")
+    for p in site24x7.PERCENTILES:
+        # Bins are ~1% wide
+        assert stats[f"p{p} (ms)"] == pytest.approx(np.percentile(response, p), rel=0.015)
+
+
+def test_exports_for_one_month_are_merged(tmp_path):
+    gb = checks("London - GB", range(0, 120, 2), down={10}, response=120.0)
+    others = (checks("Berlin - DE", range(120), down={11, 50}, response=80.0)
+              + checks("Dallas - US", range(120), response=200.0))
+    combined = site24x7.ingest(write_log(tmp_path / "all.csv", gb + others))
+    split = site24x7.ingest([write_log(tmp_path / "gb.csv", gb), write_log(tmp_path / "rest.csv", others)])
+    pd.testing.assert_frame_equal(split, combined)
+    assert set(split["Country"]) == {"UK", "DE", "US", site24x7.ALL}
+    assert row(split, site24x7.ALL)["Checks"] == len(gb) + len(others)
+
+
+def test_unreadable_export_is_named(tmp_path):
+    bad = tmp_path / "bad.csv"
+    bad.write_text("when,where\n1,2\n")
+    with pytest.raises(ValueError, match="bad.csv"):
+        site24x7.ingest([write_log(tmp_path / "ok.csv", checks("London - GB", range(5))), str(bad)])
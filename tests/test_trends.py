@@ -0,0 +1,33 @@
+import numpy as np
+import pandas as pd
+
+from dashboard import trends
+
+
+def monthly(rows):
+    return trends.aggregate(pd.DataFrame(rows, columns=["Country", "month", "Uptime %"]), "Uptime %", key="Country")
+
+
+def test_month_index_is_contiguous_across_years():
+    assert list(trends.month_index(["2024_12", "2025_01", "2025_12"]).diff().iloc[1:]) == [1, 11]
+
+
+def test_deltas_skip_month_gaps():
+    df = monthly([
+        ("US", "2025_01", 99.0), ("US", "2025_02", 99.5),
+        # No March: April has no month-over-month delta
+        ("US", "2025_04", 98.0), ("US", "2026_02", 99.9),
+        ("UK", "2025_02", 97.0), ("UK", "2025_03", 98.0),
+    ])
+    out = trends.add_deltas(df, "Uptime %", key="Country", periods=1, suffix="mom")
+    out = trends.add_deltas(out, "Uptime %", key="Country", periods=12, suffix="yoy")
+    out = out.set_index(["Country", "month"])
+    assert np.isnan(out.loc[("US", "2025_01"), "delta_mom"])
+    assert out.loc[("US", "2025_02"), "delta_mom"] == 0.5
+    assert np.isnan(out.loc[("US", "2025_04"), "delta_mom"])
+    assert np.isnan(out.loc[("US", "2026_02"), "delta_mom"])
+    assert round(out.loc[("US", "2026_02"), "delta_yoy"], 6) == 0.4
+    # Entities never borrow each other's months
+    assert np.isnan(out.loc[("UK", "2025_02"), "delta_mom"])
+    assert out.loc[("UK", "2025_03"), "delta_mom"] == 1.0
+    assert round(out.loc[("UK", "2025_03"), "pct_mom"], 6) == round(100 / 97, 6)
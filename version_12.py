@@ -1,5 +1,6 @@
 
 import streamlit as st
+from dashboard import knowledge_base, links, seo, site24x7, sitemap
 
 st.set_page_config(page_title="Sensormatic Digital Dashboard", layout="wide")
 
@@ -11,8 +12,22 @@ st.markdown("This dashboard presents performance KPIs and a structured Knowledge
 st.header("🔍 Performance KPIs")
 
 with st.expander("🌐 Site24x7 Uptime & Response"):
-    st.metric("Uptime", "99.95%")
-    st.metric("Avg Response Time", "320 ms")
+    checks, previous_checks = site24x7.month_stats()
+    if site24x7.ALL in checks.index:
+        site, before = checks.loc[site24x7.ALL], None
+        if previous_checks is not None and site24x7.ALL in previous_checks.index:
+            before = previous_checks.loc[site24x7.ALL]
+        st.metric("Uptime", f"{site['Uptime %']:.2f}%",
+                  delta=None if before is None else f"{site['Uptime %'] - before['Uptime %']:+.2f} pts",
+                  help=f"SLA uptime for {site['month']}: downtime merged across all check locations")
+        for p in site24x7.PERCENTILES:
+            column = f"p{p} (ms)"
+            st.metric(f"p{p} Response Time", f"{site[column]:,.0f} ms", delta_color="inverse",
+                      delta=None if before is None else f"{site[column] - before[column]:+,.0f} ms")
+        st.dataframe(checks.drop(index=site24x7.ALL).drop(columns="month"))
+    else:
+        st.metric("Uptime", "–", help="Run scripts/ingest_site24x7.py on a check-log export")
+        st.metric("Avg Response Time", "–")
 
 with st.expander("🚦 Lighthouse Scores"):
     st.metric("Performance", "85")
@@ -21,9 +36,30 @@ with st.expander("🚦 Lighthouse Scores"):
     st.metric("SEO", "95")
 
 with st.expander("🔍 SEO Metrics"):
-    st.metric("Indexed Pages", "1,245")
-    st.metric("Broken Links", "3")
-    st.metric("Meta Tag Coverage", "98%")
+    seo_pages = seo.load_pages()
+    indexable, meta_coverage = seo.summary(seo_pages)
+    sitemap_months = sitemap.months()
+    if sitemap_months:
+        # The sitemap is the full page set; the crawl only covers KB pages
+        latest = sitemap_months[-1]
+        changes = sitemap.month_diff(latest)
+        pages_delta = None if changes is None else len(changes[1].added) - len(changes[1].removed)
+        st.metric("Indexed Pages", f"{len(sitemap.read_snapshot(latest, ['hash'])):,}",
+                  delta=None if pages_delta is None else f"{pages_delta:+,} vs {changes[0]}",
+                  help=f"URLs in the {latest} sitemap snapshot (scripts/ingest_sitemap.py)")
+        if changes is not None:
+            st.caption(f"Sitemap since {changes[0]}: {len(changes[1].added):,} added · "
+                       f"{len(changes[1].removed):,} removed · {len(changes[1].changed):,} changed")
+    else:
+        st.metric("Indexed Pages", f"{indexable:,}" if seo_pages else "–",
+                  help="Crawled pages without a noindex directive (scripts/crawl_seo.py)")
+    link_health = links.load_results()
+    st.metric("Broken Links", f"{len(links.broken(link_health))} / {len(link_health)}" if link_health else "–",
+              help="From the last run of scripts/check_links.py")
+    st.metric("Meta Tag Coverage", "–" if meta_coverage is None else f"{meta_coverage:g}%",
+              help="Pages with a title, meta description and canonical link")
+    if seo_pages:
+        st.dataframe(seo.coverage(seo_pages), hide_index=True)
 
 with st.expander("📌 JIRA Tickets"):
     st.metric("Open Bugs", "12")
@@ -38,137 +74,4 @@ with st.expander("🔥 Hotjar Insights"):
 # ------------------ KNOWLEDGE BASE SECTION ------------------
 
 st.header("📚 Knowledge Base – Page Type Review & QA")
-
-# Resources
-with st.expander("📘 RESOURCES"):
-    resources = {
-        "Article/Blog": "https://www.sensormatic.com/resources/ar/2025/sustainable-spx-label-blog",
-        "Case Study": "https://www.sensormatic.com/resources/cs/2025/nrf-big-show-2025-case-study",
-        "TrafficTrak’r": "https://www.sensormatic.com/resources/tt/2025/traffictrakr-202509",
-        "Ungated Video": "https://www.sensormatic.com/resources/vi/2025/nrf-2025-big-idea-session-video-recording",
-        "Gated Video/Webinar": "https://www.sensormatic.com/resources/vi/2025/orbit-ai-2025-webinar",
-        "White Paper": "https://www.sensormatic.com/resources/wp/2025/re-id-revolution-white-paper"
-    }
-    for name, url in resources.items():
-        with st.expander(f"🔹 {name}"):
-            st.markdown(f"[View Page]({url})")
-            st.subheader("✅ Reviewer Checklist")
-            st.markdown("""
-            **Content Reviewer**
-            - Validate headline, summary, and CTA
-            - Check metadata (author, publish date, tags)
-            - Ensure internal links and document uploads are correct
-
-            **Language Reviewer**
-            - Confirm tone and grammar
-            - Validate localization readiness
-
-            **Marketing Stakeholder**
-            - Ensure SEO metadata and campaign tracking
-            - Confirm CRM/form integration (if gated)
-            """)
-
-            st.subheader("🧪 QA Functional Scenarios")
-            st.markdown("""
-            - Verify page loads without errors
-            - Test form submission (if applicable)
-            - Check video/document embed functionality
-            - Validate redirects and thank-you pages
-            - Confirm analytics tracking is firing
-            """)
-
-# Media Items
-with st.expander("📰 MEDIA ITEMS"):
-    media = {
-        "In the News": "https://www.sensormatic.com/media-center/in-the-news",
-        "Press Release": "https://www.sensormatic.com/media-center"
-    }
-    for name, url in media.items():
-        with st.expander(f"🔹 {name}"):
-            st.markdown(f"[View Page]({url})")
-            st.subheader("✅ Reviewer Checklist")
-            st.markdown("""
-            **Content Reviewer**
-            - Validate source and quote accuracy
-            - Check formatting and attribution
-
-            **Language Reviewer**
-            - Confirm clarity and tone
-            - Validate localization
-
-            **Marketing Stakeholder**
-            - Ensure SEO tagging and social sharing setup
-            """)
-
-            st.subheader("🧪 QA Functional Scenarios")
-            st.markdown("""
-            - Verify page loads and links work
-            - Check media embeds (if any)
-            - Confirm metadata and schema tags
-            """)
-
-# Landing Pages
-with st.expander("📍 LANDING PAGES"):
-    landing = {
-        "Tradeshow LP": None,
-        "Campaign Home LP": "https://www.sensormatic.com/landing/source-tagging-registration"
-    }
-    for name, url in landing.items():
-        with st.expander(f"🔹 {name}"):
-            if url:
-                st.markdown(f"[View Page]({url})")
-            else:
-                st.markdown("_No URL provided_")
-            st.subheader("✅ Reviewer Checklist")
-            st.markdown("""
-            **Content Reviewer**
-            - Validate event/campaign details and CTA
-            - Check form setup and thank-you page
-
-            **Language Reviewer**
-            - Confirm localization of messaging
-            - Validate translation accuracy
-
-            **Marketing Stakeholder**
-            - Ensure CRM integration and campaign tracking
-            - Confirm lead-gen flow and analytics
-            """)
-
-            st.subheader("🧪 QA Functional Scenarios")
-            st.markdown("""
-            - Test form submission and thank-you redirect
-            - Validate UTM parameters and tracking
-            - Check responsiveness across devices
-            """)
-
-# Solutions
-with st.expander("🧩 SOLUTIONS"):
-    solutions = {
-        "Solution Main Page": "https://www.sensormatic.com/loss-prevention-liability",
-        "Solution Sub-page": "https://www.sensormatic.com/loss-prevention-liability/compliance-manager/food-safety"
-    }
-    for name, url in solutions.items():
-        with st.expander(f"🔹 {name}"):
-            st.markdown(f"[View Page]({url})")
-            st.subheader("✅ Reviewer Checklist")
-            st.markdown("""
-            **Content Reviewer**
-            - Validate solution overview and benefits
-            - Check linking to sub-pages and CTAs
-
-            **Language Reviewer**
-            - Confirm terminology consistency
-            - Validate localization readiness
-
-            **Marketing Stakeholder**
-            - Ensure SEO metadata and product alignment
-            - Confirm analytics and engagement tracking
-            """)
-
-            st.subheader("🧪 QA Functional Scenarios")
-            st.markdown("""
-            - Verify page loads and links work
-            - Test CTA buttons and navigation
-            - Confirm analytics and tag firing
-            """)
-
+knowledge_base.render()